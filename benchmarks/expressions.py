@@ -0,0 +1,94 @@
+"""Measure how long narwhals expressions take to translate to DataFusion.
+
+Translation is the time `select` takes to turn narwhals expressions into
+native ones, without executing anything. Two shapes are measured:
+
+- depth: `e = (e * e) - (e / e)` nested `d` times. Every level uses the
+  previous one four times, so the expression is a tree with 4**d leaves and
+  translation grows with that, not with `d`. narwhals hands over the tree
+  rather than a graph of shared sub-expressions, so the duplicates are built
+  before the plugin sees them.
+- width: `w` columns, each selected as `(c * 2 + 1).alias(...)`. This should
+  grow linearly in `w`.
+
+The same queries on polars' lazy API are timed for reference:
+
+    python benchmarks/expressions.py --max-depth 7 --widths 10 100 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+import narwhals as nw
+import pyarrow as pa
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _frames(table: pa.Table) -> dict[str, nw.LazyFrame[Any]]:
+    from narwhals._utils import Version
+
+    from narwhals_datafusion import __narwhals_namespace__
+
+    ns = __narwhals_namespace__(Version.MAIN)
+    frames = {"narwhals[datafusion]": ns.from_native(ns.context.from_arrow(table)).to_narwhals()}
+    try:
+        import polars as pl
+    except ImportError:
+        return frames
+    frames["narwhals[polars]"] = nw.from_native(pl.from_arrow(table)).lazy()
+    return frames
+
+
+def _time_ms(func: Callable[[], Any], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def deep(depth: int) -> nw.Expr:
+    expr = nw.col("x")
+    for _ in range(depth):
+        expr = (expr * expr) - (expr / expr)
+    return expr.alias("out")
+
+
+def wide(width: int) -> list[nw.Expr]:
+    return [(nw.col(f"c{i}") * 2 + 1).alias(f"out{i}") for i in range(width)]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-depth", type=int, default=6)
+    parser.add_argument("--widths", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'shape':<14}{'leaves':>8}{'mode':>24}{'translate ms':>14}")
+    deep_frames = _frames(pa.table({"x": [1.0, 2.0, 3.0]}))
+    for depth in range(1, args.max_depth + 1):
+        expr = deep(depth)
+        for mode, lf in deep_frames.items():
+            ms = _time_ms(partial(lf.select, expr), args.repeat)
+            print(f"{f'depth={depth}':<14}{4**depth:>8}{mode:>24}{ms:>14.1f}")
+    for width in args.widths:
+        wide_frames = _frames(pa.table({f"c{i}": [1, 2, 3] for i in range(width)}))
+        exprs = wide(width)
+        for mode, lf in wide_frames.items():
+            ms = _time_ms(partial(lf.select, *exprs), args.repeat)
+            print(f"{f'width={width}':<14}{width:>8}{mode:>24}{ms:>14.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
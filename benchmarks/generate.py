@@ -0,0 +1,154 @@
+"""Generate TPC-H-like tables as Parquet files.
+
+The tables have the TPC-H schema (restricted to the columns the benchmark
+queries use), row counts and value distributions, but are generated with
+numpy rather than `dbgen`, so results don't match the official answers.
+
+    python benchmarks/generate.py --scale-factor 0.1 --data-dir benchmarks/data
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+NATIONS = [
+    ("ALGERIA", 0), ("ARGENTINA", 1), ("BRAZIL", 1), ("CANADA", 1), ("EGYPT", 4),
+    ("ETHIOPIA", 0), ("FRANCE", 3), ("GERMANY", 3), ("INDIA", 2), ("INDONESIA", 2),
+    ("IRAN", 4), ("IRAQ", 4), ("JAPAN", 2), ("JORDAN", 4), ("KENYA", 0),
+    ("MOROCCO", 0), ("MOZAMBIQUE", 0), ("PERU", 1), ("CHINA", 2), ("ROMANIA", 3),
+    ("SAUDI ARABIA", 4), ("VIETNAM", 2), ("RUSSIA", 3), ("UNITED KINGDOM", 3),
+    ("UNITED STATES", 1),
+]
+REGIONS = ["AFRICA", "AMERICA", "ASIA", "EUROPE", "MIDDLE EAST"]
+SEGMENTS = ["AUTOMOBILE", "BUILDING", "FURNITURE", "HOUSEHOLD", "MACHINERY"]
+
+START_DATE = np.datetime64("1992-01-01")
+# Orders are placed up to 151 days before the end of the 1992-1998 range.
+ORDER_DAYS = (np.datetime64("1998-12-31") - START_DATE).astype(int) - 151
+CURRENT_DATE = np.datetime64("1995-06-17")
+
+
+def _strings(prefix: str, keys: np.ndarray) -> pa.Array:
+    return pa.array(np.char.add(prefix, np.char.zfill(keys.astype(str), 9)))
+
+
+def _money(rng: np.random.Generator, low: float, high: float, size: int) -> np.ndarray:
+    return np.round(rng.uniform(low, high, size), 2)
+
+
+def generate(scale_factor: float, seed: int = 0) -> dict[str, pa.Table]:
+    rng = np.random.default_rng(seed)
+    n_supplier = max(1, int(10_000 * scale_factor))
+    n_customer = max(1, int(150_000 * scale_factor))
+    n_orders = max(1, int(1_500_000 * scale_factor))
+    n_part = max(1, int(200_000 * scale_factor))
+
+    region = pa.table({"r_regionkey": np.arange(len(REGIONS)), "r_name": REGIONS})
+    nation = pa.table(
+        {
+            "n_nationkey": np.arange(len(NATIONS)),
+            "n_name": [name for name, _ in NATIONS],
+            "n_regionkey": [key for _, key in NATIONS],
+        }
+    )
+    s_suppkey = np.arange(1, n_supplier + 1)
+    supplier = pa.table(
+        {
+            "s_suppkey": s_suppkey,
+            "s_name": _strings("Supplier#", s_suppkey),
+            "s_nationkey": rng.integers(0, len(NATIONS), n_supplier),
+            "s_acctbal": _money(rng, -999.99, 9999.99, n_supplier),
+        }
+    )
+    c_custkey = np.arange(1, n_customer + 1)
+    customer = pa.table(
+        {
+            "c_custkey": c_custkey,
+            "c_name": _strings("Customer#", c_custkey),
+            "c_address": _strings("Address ", rng.integers(0, 10**9, n_customer)),
+            "c_nationkey": rng.integers(0, len(NATIONS), n_customer),
+            "c_phone": _strings("", rng.integers(10**8, 10**9, n_customer)),
+            "c_acctbal": _money(rng, -999.99, 9999.99, n_customer),
+            "c_mktsegment": pa.array(SEGMENTS).take(
+                rng.integers(0, len(SEGMENTS), n_customer)
+            ),
+            "c_comment": _strings("comment ", rng.integers(0, 10**9, n_customer)),
+        }
+    )
+
+    o_orderkey = np.arange(1, n_orders + 1)
+    o_orderdate = START_DATE + rng.integers(0, ORDER_DAYS, n_orders)
+    orders = pa.table(
+        {
+            "o_orderkey": o_orderkey,
+            "o_custkey": rng.integers(1, n_customer + 1, n_orders),
+            "o_orderdate": o_orderdate,
+            "o_shippriority": np.zeros(n_orders, dtype=np.int64),
+        }
+    )
+
+    # 1 to 7 line items per order.
+    n_lines = rng.integers(1, 8, n_orders)
+    n_lineitem = int(n_lines.sum())
+    l_orderkey = np.repeat(o_orderkey, n_lines)
+    starts = np.repeat(np.cumsum(n_lines) - n_lines, n_lines)
+    l_linenumber = np.arange(n_lineitem) - starts + 1
+    l_quantity = rng.integers(1, 51, n_lineitem).astype(np.float64)
+    l_shipdate = np.repeat(o_orderdate, n_lines) + rng.integers(1, 122, n_lineitem)
+    l_commitdate = np.repeat(o_orderdate, n_lines) + rng.integers(30, 91, n_lineitem)
+    l_receiptdate = l_shipdate + rng.integers(1, 31, n_lineitem)
+    returned = np.where(rng.random(n_lineitem) < 0.5, "R", "A")
+    lineitem = pa.table(
+        {
+            "l_orderkey": l_orderkey,
+            "l_partkey": rng.integers(1, n_part + 1, n_lineitem),
+            "l_suppkey": rng.integers(1, n_supplier + 1, n_lineitem),
+            "l_linenumber": l_linenumber,
+            "l_quantity": l_quantity,
+            "l_extendedprice": np.round(l_quantity * rng.uniform(900, 2100, n_lineitem), 2),
+            "l_discount": rng.integers(0, 11, n_lineitem) / 100,
+            "l_tax": rng.integers(0, 9, n_lineitem) / 100,
+            "l_returnflag": np.where(l_receiptdate <= CURRENT_DATE, returned, "N"),
+            "l_linestatus": np.where(l_shipdate > CURRENT_DATE, "O", "F"),
+            "l_shipdate": l_shipdate,
+            "l_commitdate": l_commitdate,
+            "l_receiptdate": l_receiptdate,
+        }
+    )
+    return {
+        "region": region,
+        "nation": nation,
+        "supplier": supplier,
+        "customer": customer,
+        "orders": orders,
+        "lineitem": lineitem,
+    }
+
+
+def write(data_dir: Path, scale_factor: float, seed: int = 0) -> Path:
+    """Write the tables for `scale_factor` below `data_dir`, unless already there."""
+    target = data_dir / f"sf{scale_factor:g}"
+    if (target / "lineitem.parquet").exists():
+        return target
+    target.mkdir(parents=True, exist_ok=True)
+    for name, table in generate(scale_factor, seed).items():
+        pq.write_table(table, target / f"{name}.parquet")
+    return target
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale-factor", type=float, default=0.1)
+    parser.add_argument("--data-dir", type=Path, default=Path(__file__).parent / "data")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    print(write(args.data_dir, args.scale_factor, args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Check that importing the plugin stays cheap.
+
+narwhals imports every installed plugin and calls its `is_native` on the
+objects it's given, so neither may load datafusion, pyarrow or narwhals'
+backend internals. Exits non-zero if they do, or if the time spent importing
+beyond narwhals itself exceeds the budget.
+
+    python benchmarks/import_time.py --budget-ms 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+# What a process that never touches a DataFusion frame runs.
+SCRIPT = "import narwhals; import narwhals_datafusion as p; p.is_native(object())"
+FORBIDDEN = ("datafusion", "pyarrow", "narwhals._arrow", "narwhals._compliant")
+
+
+def measure() -> tuple[float, set[str]]:
+    """Return the import time (ms) after narwhals, and the modules imported then."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    total_us = 0
+    modules: set[str] = set()
+    after_narwhals = False
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if after_narwhals:
+            modules.add(name.strip())
+            # Nested imports are indented and already part of their parent's time.
+            if not name.startswith("  "):
+                total_us += int(cumulative)
+        elif name.strip() == "narwhals":
+            after_narwhals = True
+    return total_us / 1000, modules
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=5.0)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    runs = [measure() for _ in range(args.runs)]
+    median_ms = statistics.median(ms for ms, _ in runs)
+    print(f"import and is_native: {median_ms:.2f}ms (budget {args.budget_ms:g}ms)")
+    failed = False
+    if forbidden := sorted(
+        module
+        for module in set().union(*(modules for _, modules in runs))
+        if module.startswith(FORBIDDEN)
+    ):
+        print("imported eagerly:", ", ".join(forbidden))
+        failed = True
+    if median_ms > args.budget_ms:
+        print("over budget")
+        failed = True
+    return int(failed)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,221 @@
+"""TPC-H-like queries, written once against narwhals and once as SQL.
+
+The narwhals versions run unchanged on every backend: they receive a mapping of
+table name to `nw.LazyFrame` and return a `nw.LazyFrame`.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import TYPE_CHECKING
+
+import narwhals as nw
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    Query = Callable[[Mapping[str, nw.LazyFrame]], nw.LazyFrame]
+
+
+def q1(t: Mapping[str, nw.LazyFrame]) -> nw.LazyFrame:
+    disc_price = nw.col("l_extendedprice") * (1 - nw.col("l_discount"))
+    return (
+        t["lineitem"]
+        .filter(nw.col("l_shipdate") <= date(1998, 9, 2))
+        .with_columns(
+            disc_price=disc_price, charge=disc_price * (1 + nw.col("l_tax"))
+        )
+        .group_by("l_returnflag", "l_linestatus")
+        .agg(
+            nw.col("l_quantity").sum().alias("sum_qty"),
+            nw.col("l_extendedprice").sum().alias("sum_base_price"),
+            nw.col("disc_price").sum().alias("sum_disc_price"),
+            nw.col("charge").sum().alias("sum_charge"),
+            nw.col("l_quantity").mean().alias("avg_qty"),
+            nw.col("l_extendedprice").mean().alias("avg_price"),
+            nw.col("l_discount").mean().alias("avg_disc"),
+            nw.len().alias("count_order"),
+        )
+        .sort("l_returnflag", "l_linestatus")
+    )
+
+
+def q3(t: Mapping[str, nw.LazyFrame]) -> nw.LazyFrame:
+    cutoff = date(1995, 3, 15)
+    return (
+        t["customer"]
+        .filter(nw.col("c_mktsegment") == "BUILDING")
+        .join(t["orders"], left_on="c_custkey", right_on="o_custkey")
+        .join(t["lineitem"], left_on="o_orderkey", right_on="l_orderkey")
+        .filter(nw.col("o_orderdate") < cutoff, nw.col("l_shipdate") > cutoff)
+        .with_columns(
+            revenue=nw.col("l_extendedprice") * (1 - nw.col("l_discount"))
+        )
+        .group_by("o_orderkey", "o_orderdate", "o_shippriority")
+        .agg(nw.col("revenue").sum())
+        .select("o_orderkey", "revenue", "o_orderdate", "o_shippriority")
+        .sort(by=["revenue", "o_orderdate"], descending=[True, False])
+        .head(10)
+    )
+
+
+def q5(t: Mapping[str, nw.LazyFrame]) -> nw.LazyFrame:
+    return (
+        t["region"]
+        .join(t["nation"], left_on="r_regionkey", right_on="n_regionkey")
+        .join(t["customer"], left_on="n_nationkey", right_on="c_nationkey")
+        .join(t["orders"], left_on="c_custkey", right_on="o_custkey")
+        .join(t["lineitem"], left_on="o_orderkey", right_on="l_orderkey")
+        .join(
+            t["supplier"],
+            left_on=["l_suppkey", "n_nationkey"],
+            right_on=["s_suppkey", "s_nationkey"],
+        )
+        .filter(
+            nw.col("r_name") == "ASIA",
+            nw.col("o_orderdate") >= date(1994, 1, 1),
+            nw.col("o_orderdate") < date(1995, 1, 1),
+        )
+        .with_columns(
+            revenue=nw.col("l_extendedprice") * (1 - nw.col("l_discount"))
+        )
+        .group_by("n_name")
+        .agg(nw.col("revenue").sum())
+        .sort("revenue", descending=True)
+    )
+
+
+def q6(t: Mapping[str, nw.LazyFrame]) -> nw.LazyFrame:
+    return (
+        t["lineitem"]
+        .filter(
+            nw.col("l_shipdate") >= date(1994, 1, 1),
+            nw.col("l_shipdate") < date(1995, 1, 1),
+            nw.col("l_discount") >= 0.05,
+            nw.col("l_discount") <= 0.07,
+            nw.col("l_quantity") < 24,
+        )
+        .select((nw.col("l_extendedprice") * nw.col("l_discount")).sum().alias("revenue"))
+    )
+
+
+def q10(t: Mapping[str, nw.LazyFrame]) -> nw.LazyFrame:
+    return (
+        t["customer"]
+        .join(t["orders"], left_on="c_custkey", right_on="o_custkey")
+        .join(t["lineitem"], left_on="o_orderkey", right_on="l_orderkey")
+        .join(t["nation"], left_on="c_nationkey", right_on="n_nationkey")
+        .filter(
+            nw.col("o_orderdate") >= date(1993, 10, 1),
+            nw.col("o_orderdate") < date(1994, 1, 1),
+            nw.col("l_returnflag") == "R",
+        )
+        .with_columns(
+            revenue=nw.col("l_extendedprice") * (1 - nw.col("l_discount"))
+        )
+        .group_by(
+            "c_custkey",
+            "c_name",
+            "c_acctbal",
+            "c_phone",
+            "n_name",
+            "c_address",
+            "c_comment",
+        )
+        .agg(nw.col("revenue").sum())
+        .select(
+            "c_custkey",
+            "c_name",
+            "revenue",
+            "c_acctbal",
+            "n_name",
+            "c_address",
+            "c_phone",
+            "c_comment",
+        )
+        .sort("revenue", descending=True)
+        .head(20)
+    )
+
+
+SQL = {
+    "q1": """
+        select
+            l_returnflag,
+            l_linestatus,
+            sum(l_quantity) as sum_qty,
+            sum(l_extendedprice) as sum_base_price,
+            sum(l_extendedprice * (1 - l_discount)) as sum_disc_price,
+            sum(l_extendedprice * (1 - l_discount) * (1 + l_tax)) as sum_charge,
+            avg(l_quantity) as avg_qty,
+            avg(l_extendedprice) as avg_price,
+            avg(l_discount) as avg_disc,
+            count(*) as count_order
+        from lineitem
+        where l_shipdate <= date '1998-09-02'
+        group by l_returnflag, l_linestatus
+        order by l_returnflag, l_linestatus
+    """,
+    "q3": """
+        select
+            l_orderkey as o_orderkey,
+            sum(l_extendedprice * (1 - l_discount)) as revenue,
+            o_orderdate,
+            o_shippriority
+        from customer, orders, lineitem
+        where c_mktsegment = 'BUILDING'
+            and c_custkey = o_custkey
+            and l_orderkey = o_orderkey
+            and o_orderdate < date '1995-03-15'
+            and l_shipdate > date '1995-03-15'
+        group by l_orderkey, o_orderdate, o_shippriority
+        order by revenue desc, o_orderdate
+        limit 10
+    """,
+    "q5": """
+        select n_name, sum(l_extendedprice * (1 - l_discount)) as revenue
+        from customer, orders, lineitem, supplier, nation, region
+        where c_custkey = o_custkey
+            and l_orderkey = o_orderkey
+            and l_suppkey = s_suppkey
+            and c_nationkey = s_nationkey
+            and s_nationkey = n_nationkey
+            and n_regionkey = r_regionkey
+            and r_name = 'ASIA'
+            and o_orderdate >= date '1994-01-01'
+            and o_orderdate < date '1995-01-01'
+        group by n_name
+        order by revenue desc
+    """,
+    "q6": """
+        select sum(l_extendedprice * l_discount) as revenue
+        from lineitem
+        where l_shipdate >= date '1994-01-01'
+            and l_shipdate < date '1995-01-01'
+            and l_discount between 0.05 and 0.07
+            and l_quantity < 24
+    """,
+    "q10": """
+        select
+            c_custkey,
+            c_name,
+            sum(l_extendedprice * (1 - l_discount)) as revenue,
+            c_acctbal,
+            n_name,
+            c_address,
+            c_phone,
+            c_comment
+        from customer, orders, lineitem, nation
+        where c_custkey = o_custkey
+            and l_orderkey = o_orderkey
+            and o_orderdate >= date '1993-10-01'
+            and o_orderdate < date '1994-01-01'
+            and l_returnflag = 'R'
+            and c_nationkey = n_nationkey
+        group by c_custkey, c_name, c_acctbal, c_phone, n_name, c_address, c_comment
+        order by revenue desc
+        limit 20
+    """,
+}
+
+QUERIES: dict[str, Query] = {"q1": q1, "q3": q3, "q5": q5, "q6": q6, "q10": q10}
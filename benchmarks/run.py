@@ -0,0 +1,225 @@
+"""Run the TPC-H-like queries through narwhals on DataFusion and compare.
+
+Every query runs in a fresh process per mode, so peak RSS is per query:
+
+- `narwhals[datafusion]`: narwhals on top of this plugin.
+- `datafusion[sql]`: the same query as SQL on native DataFusion.
+- `narwhals[polars]` / `narwhals[pyarrow]`: narwhals on other backends.
+
+Translation is the time to build the query (narwhals expressions, or SQL
+parsing and logical planning) and execution the time to collect it to Arrow.
+Eager backends do all their work while the query is built, so only their
+total is reported. Baselines are stored as JSON:
+
+    python benchmarks/run.py --scale-factor 1 --save-baseline main
+    python benchmarks/run.py --scale-factor 1 --compare main
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from generate import write
+from queries import QUERIES, SQL
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    import narwhals as nw
+
+BENCHMARKS_DIR = Path(__file__).parent
+TABLES = ("region", "nation", "supplier", "customer", "orders", "lineitem")
+MODES = ("narwhals[datafusion]", "datafusion[sql]", "narwhals[polars]", "narwhals[pyarrow]")
+
+
+def _narwhals_datafusion(data: Path) -> Mapping[str, nw.LazyFrame]:
+    from narwhals._utils import Version
+
+    from narwhals_datafusion import __narwhals_namespace__
+
+    # Going through the namespace rather than `nw.from_native` also works on
+    # narwhals versions without plugin discovery.
+    ns = __narwhals_namespace__(Version.MAIN)
+    return {
+        name: ns.from_native(ns.context.read_parquet(str(data / f"{name}.parquet"))).to_narwhals()
+        for name in TABLES
+    }
+
+
+def _narwhals_polars(data: Path) -> Mapping[str, nw.LazyFrame]:
+    import narwhals as nw
+    import polars as pl
+
+    return {
+        name: nw.from_native(pl.scan_parquet(data / f"{name}.parquet")) for name in TABLES
+    }
+
+
+def _narwhals_pyarrow(data: Path) -> Mapping[str, nw.LazyFrame]:
+    import narwhals as nw
+    import pyarrow.parquet as pq
+
+    return {
+        name: nw.from_native(pq.read_table(data / f"{name}.parquet")).lazy()
+        for name in TABLES
+    }
+
+
+def _time(func: Callable[[], Any]) -> tuple[float, Any]:
+    start = time.perf_counter()
+    result = func()
+    return (time.perf_counter() - start) * 1000, result
+
+
+def _peak_rss_mib() -> float:
+    # On Linux `ru_maxrss` survives `exec`, so a spawned process would report
+    # its parent's peak; the high-water mark in `/proc` starts from scratch.
+    status = Path("/proc/self/status")
+    if status.exists():
+        for line in status.read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+    # `ru_maxrss` is in KiB on Linux and in bytes on macOS.
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak_rss / (1024**2 if sys.platform == "darwin" else 1024)
+
+
+def run_query(mode: str, query: str, data: Path, repeat: int) -> dict[str, Any]:
+    """Run one query `repeat` times (after a warm-up run) in this process."""
+    if mode == "datafusion[sql]":
+        from narwhals_datafusion.utils import session_context
+
+        ctx = session_context()
+        for name in TABLES:
+            ctx.register_parquet(name, str(data / f"{name}.parquet"))
+
+        def build() -> Any:
+            return ctx.sql(SQL[query])
+
+        def execute(df: Any) -> Any:
+            return df.to_arrow_table()
+    else:
+        tables = {
+            "narwhals[datafusion]": _narwhals_datafusion,
+            "narwhals[polars]": _narwhals_polars,
+            "narwhals[pyarrow]": _narwhals_pyarrow,
+        }[mode](data)
+
+        def build() -> Any:
+            return QUERIES[query](tables)
+
+        def execute(lf: Any) -> Any:
+            return lf.collect("pyarrow").to_native()
+
+    translation: list[float] = []
+    execution: list[float] = []
+    for i in range(repeat + 1):
+        build_ms, built = _time(build)
+        execute_ms, result = _time(lambda: execute(built))
+        if i:
+            translation.append(build_ms)
+            execution.append(execute_ms)
+    eager = mode == "narwhals[pyarrow]"
+    return {
+        "translation_ms": None if eager else statistics.median(translation),
+        "execution_ms": statistics.median(
+            [t + e for t, e in zip(translation, execution)] if eager else execution
+        ),
+        "peak_rss_mib": round(_peak_rss_mib(), 1),
+        "rows": result.num_rows,
+    }
+
+
+def _format(value: float | None) -> str:
+    return "-" if value is None else f"{value:.1f}"
+
+
+def compare(
+    results: Mapping[str, Mapping[str, Mapping[str, Any]]],
+    baseline: Mapping[str, Mapping[str, Mapping[str, Any]]],
+    tolerance: float,
+) -> list[str]:
+    """Return the timings that are more than `tolerance` slower than `baseline`."""
+    regressions = []
+    for query, modes in results.items():
+        for mode, result in modes.items():
+            before = baseline.get(query, {}).get(mode)
+            if before is None:
+                continue
+            for metric in ("translation_ms", "execution_ms"):
+                old, new = before.get(metric), result[metric]
+                # Ignore sub-millisecond noise.
+                if old is not None and new is not None and new > max(old * (1 + tolerance), old + 1):
+                    regressions.append(
+                        f"{query} {mode} {metric}: {old:.1f} -> {new:.1f} ({new / old - 1:+.0%})"
+                    )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale-factor", type=float, default=0.1)
+    parser.add_argument("--data-dir", type=Path, default=BENCHMARKS_DIR / "data")
+    parser.add_argument("--queries", nargs="+", choices=list(QUERIES), default=list(QUERIES))
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save-baseline", metavar="NAME")
+    parser.add_argument("--compare", metavar="NAME")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    data = write(args.data_dir, args.scale_factor)
+    results: dict[str, dict[str, dict[str, Any]]] = {}
+    print(f"{'query':<6}{'mode':<22}{'translate ms':>14}{'execute ms':>12}{'peak RSS MiB':>14}{'rows':>8}")
+    for query in args.queries:
+        for mode in args.modes:
+            # A fresh process per run, so that peak RSS isn't carried over.
+            with ProcessPoolExecutor(1, mp_context=get_context("spawn")) as pool:
+                try:
+                    result = pool.submit(run_query, mode, query, data, args.repeat).result()
+                except ImportError as exc:
+                    print(f"{query:<6}{mode:<22}skipped: {exc}")
+                    continue
+            results.setdefault(query, {})[mode] = result
+            print(
+                f"{query:<6}{mode:<22}{_format(result['translation_ms']):>14}"
+                f"{_format(result['execution_ms']):>12}{result['peak_rss_mib']:>14.1f}"
+                f"{result['rows']:>8}"
+            )
+        if len({result["rows"] for result in results.get(query, {}).values()}) > 1:
+            print(f"warning: {query} returned different row counts across modes")
+
+    baselines = BENCHMARKS_DIR / "baselines"
+    if args.save_baseline:
+        baselines.mkdir(exist_ok=True)
+        path = baselines / f"{args.save_baseline}.json"
+        path.write_text(
+            json.dumps({"scale_factor": args.scale_factor, "results": results}, indent=2)
+        )
+        print(f"saved baseline to {path}")
+    if args.compare:
+        baseline = json.loads((baselines / f"{args.compare}.json").read_text())
+        if baseline["scale_factor"] != args.scale_factor:
+            msg = (
+                f"Baseline {args.compare!r} was recorded at scale factor "
+                f"{baseline['scale_factor']}, not {args.scale_factor}."
+            )
+            raise ValueError(msg)
+        if regressions := compare(results, baseline["results"], args.tolerance):
+            print("regressions:", *regressions, sep="\n  ")
+            return 1
+        print(f"no regressions against {args.compare!r}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -16,8 +17,11 @@ def __narwhals_namespace__(version: Version) -> DataFusionNamespace:
     return DataFusionNamespace(version=version)
 
 def is_native(native_object:object) -> TypeIs[DataFusionLazyFrame]:
-    import datafusion
-
+    # narwhals asks every plugin about every object it's given. If datafusion
+    # hasn't been imported, the object can't be one of its frames, and
+    # importing it just to find out would be slow.
+    if (datafusion := sys.modules.get(NATIVE_PACKAGE)) is None:
+        return False
     return isinstance(native_object, datafusion.DataFrame)
 
 
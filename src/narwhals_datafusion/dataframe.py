@@ -1,18 +1,62 @@
 from __future__ import annotations
 
+import asyncio
+import operator
+from contextlib import redirect_stdout
+from functools import lru_cache, reduce
+from io import StringIO
+from os import PathLike
+from pathlib import Path
 from sys import implementation
-from typing import TYPE_CHECKING
+from time import perf_counter
+from typing import TYPE_CHECKING, TypeVar
 
+import datafusion
+from datafusion.dataframe import Compression
 from narwhals._compliant import CompliantLazyFrame
-from narwhals._utils import Implementation, ValidateBackendVersion, not_implemented, parse_columns_to_drop
+from narwhals._utils import (
+    Implementation,
+    ValidateBackendVersion,
+    check_columns_exist,
+    extend_bool,
+    generate_temporary_column_name,
+    not_implemented,
+    parse_columns_to_drop,
+    zip_strict,
+)
 from narwhals._arrow.utils import native_to_narwhals_dtype
-from narwhals_datafusion.utils import evaluate_exprs
+from narwhals_datafusion.utils import (
+    QueryProfile,
+    TranslationTimer,
+    aggregate,
+    async_limiter,
+    col,
+    evaluate_exprs,
+    parse_operator_metrics,
+    persist_cache,
+    plan_cache,
+    plan_key,
+    profiler,
+    raise_from_udf,
+    session_context,
+    udf_errors,
+    window_expression,
+)
 
 if TYPE_CHECKING:
-    import datafusion
-    from collections.abc import Mapping
+    from collections.abc import (
+        AsyncIterator,
+        Awaitable,
+        Callable,
+        Hashable,
+        Iterable,
+        Iterator,
+        Mapping,
+    )
+    import pyarrow as pa
     from narwhals.dataframe import LazyFrame
     from narwhals_datafusion.expr import DataFusionExpr
+    from narwhals_datafusion.group_by import DataFusionGroupBy
     from collections.abc import Sequence
     from narwhals_datafusion.namespace import DataFusionNamespace
     from narwhals._utils import Version
@@ -21,9 +65,166 @@ if TYPE_CHECKING:
     from typing_extensions import Self, TypeIs
     from narwhals._compliant.typing import CompliantDataFrameAny
     from io import BytesIO
-    from pathlib import Path
     from typing import Any
     from types import ModuleType
+    from datafusion.plan import ExecutionPlan
+    from datafusion.record_batch import RecordBatchStream
+    from narwhals._compliant.window import WindowInputs
+    from narwhals.typing import AsofJoinStrategy, JoinStrategy, UniqueKeepStrategy
+
+T = TypeVar("T")
+
+
+def _split_batch(batch: pa.RecordBatch, batch_size: int | None) -> Iterator[pa.RecordBatch]:
+    # Zero-copy slices of at most `batch_size` rows.
+    if batch_size is None or batch.num_rows <= batch_size:
+        yield batch
+        return
+    for offset in range(0, batch.num_rows, batch_size):
+        yield batch.slice(offset, batch_size)
+
+
+def _check_lengths_match(matching: pa.Array) -> pa.Array:
+    import pyarrow.compute as pc
+    from narwhals.exceptions import ShapeError
+
+    if not pc.all(matching).as_py():
+        msg = "exploded columns must have matching element counts"
+        raise_from_udf(ShapeError(msg))
+    return matching
+
+
+@lru_cache(maxsize=None)
+def _check_lengths_match_udf() -> datafusion.ScalarUDF:
+    import pyarrow as pa
+
+    return datafusion.udf(
+        _check_lengths_match, [pa.bool_()], pa.bool_(), "immutable", name="explode_check"
+    )
+
+
+def _without_views(dtype: pa.DataType) -> pa.DataType:
+    import pyarrow as pa
+
+    if pa.types.is_string_view(dtype):
+        return pa.large_string()
+    if pa.types.is_binary_view(dtype):
+        # narwhals maps `large_binary` to `Unknown`.
+        return pa.binary()
+    if pa.types.is_list(dtype):
+        return pa.list_(dtype.value_field.with_type(_without_views(dtype.value_type)))
+    if pa.types.is_large_list(dtype):
+        return pa.large_list(dtype.value_field.with_type(_without_views(dtype.value_type)))
+    if pa.types.is_fixed_size_list(dtype):
+        return pa.list_(
+            dtype.value_field.with_type(_without_views(dtype.value_type)), dtype.list_size
+        )
+    if pa.types.is_struct(dtype):
+        return pa.struct([field.with_type(_without_views(field.type)) for field in dtype])
+    return dtype
+
+
+def _cast_views(table: pa.Table) -> pa.Table:
+    # DataFusion reads Parquet strings as `Utf8View`, which pandas can't convert
+    # inside lists, and which narwhals doesn't recognise as a pandas `ArrowDtype`.
+    import pyarrow as pa
+
+    schema = pa.schema(
+        [field.with_type(_without_views(field.type)) for field in table.schema],
+        metadata=table.schema.metadata,
+    )
+    return table if schema.equals(table.schema) else table.cast(schema)
+
+
+async def _limited(stream: RecordBatchStream) -> AsyncIterator[datafusion.RecordBatch]:
+    # Waits for a slot of the loop's `async_limiter` before each batch.
+    while True:
+        async with async_limiter():
+            try:
+                batch = await stream.__anext__()
+            except StopAsyncIteration:
+                return
+        yield batch
+
+
+def _parquet_codec(
+    compression: str, compression_level: int | None
+) -> tuple[Compression, int | None]:
+    # Shared by DataFusion's and pyarrow's writers, so that both accept the same
+    # codec names and pick the same default levels.
+    codec = Compression.from_str(compression)
+    if compression_level is None and codec in {
+        Compression.GZIP,
+        Compression.BROTLI,
+        Compression.ZSTD,
+    }:
+        compression_level = codec.get_default_level()
+    return codec, compression_level
+
+
+# pyarrow's names for the codecs whose DataFusion names differ.
+_PYARROW_CODECS = {
+    Compression.UNCOMPRESSED: "none",
+    Compression.LZ4_RAW: "lz4",
+}
+
+# DataFusion's default `max_row_group_size`.
+_DEFAULT_ROW_GROUP_SIZE = 1024 * 1024
+
+
+class _ParquetFileWriter:
+    """Write record batches to a single Parquet file with pyarrow.
+
+    Batches are buffered until `row_group_size` rows are pending, so that row
+    groups match those of DataFusion's writer rather than its batch size.
+    """
+
+    def __init__(
+        self,
+        file: str | Path | BytesIO,
+        schema: pa.Schema,
+        *,
+        compression: str,
+        compression_level: int | None,
+        row_group_size: int | None,
+    ) -> None:
+        import pyarrow.parquet as pq
+
+        codec, compression_level = _parquet_codec(compression, compression_level)
+        self._writer = pq.ParquetWriter(
+            file,
+            schema,
+            compression=_PYARROW_CODECS.get(codec, codec.value),
+            compression_level=compression_level,
+        )
+        self._row_group_size = row_group_size or _DEFAULT_ROW_GROUP_SIZE
+        self._pending: list[pa.RecordBatch] = []
+        self._pending_rows = 0
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *args: object) -> None:
+        try:
+            if exc_type is None and self._pending_rows:
+                self._flush(self._pending_rows)
+        finally:
+            self._writer.close()
+
+    def write(self, batch: pa.RecordBatch) -> None:
+        self._pending.append(batch)
+        self._pending_rows += batch.num_rows
+        while self._pending_rows >= self._row_group_size:
+            self._flush(self._row_group_size)
+
+    def _flush(self, num_rows: int) -> None:
+        import pyarrow as pa
+
+        pending = pa.Table.from_batches(self._pending, self._writer.schema)
+        self._writer.write_table(pending.slice(0, num_rows), row_group_size=num_rows)
+        rest = pending.slice(num_rows)
+        self._pending = rest.to_batches()
+        self._pending_rows = rest.num_rows
 
 
 class DataFusionLazyFrame(
@@ -43,6 +244,12 @@ class DataFusionLazyFrame(
         self._version = version
         self._cached_schema: dict[str, DType] | None = None
         self._cached_columns: list[str] | None = None
+        # The frames this one was derived from, see `PlanCache`.
+        self._sources: tuple[datafusion.DataFrame, ...] = (native_dataframe,)
+        # Accumulated over the chain of operations this frame results from.
+        self._translation_seconds = 0.0
+        # Set on the frames returned by `persist`.
+        self._persist_key: Hashable | None = None
         if validate_backend_version:
             self._validate_backend_version()
 
@@ -70,21 +277,74 @@ class DataFusionLazyFrame(
     def __narwhals_lazyframe__(self) -> Self:
         return self
 
-    def _with_native(self, df: datafusion.DataFrame) -> Self:
-        return self.__class__(df, version=self._version)
+    def _with_native(
+        self,
+        df: datafusion.DataFrame,
+        *,
+        schema: dict[str, DType] | None = None,
+        columns: list[str] | None = None,
+        translation_seconds: float = 0.0,
+    ) -> Self:
+        # Callers that know the output schema (or just the output names) pass it on,
+        # so long chains don't re-derive it from `df.schema()` after every step.
+        result = self.__class__(df, version=self._version)
+        result._sources = self._sources
+        result._translation_seconds = self._translation_seconds + translation_seconds
+        result._cached_schema = schema
+        result._cached_columns = list(schema) if columns is None and schema is not None else columns
+        return result
+
+    def _with_known_columns(self, df: datafusion.DataFrame, columns: list[str]) -> Self:
+        schema = self._cached_schema
+        return self._with_native(
+            df,
+            schema=None if schema is None else {name: schema[name] for name in columns},
+            columns=columns,
+        )
+
+    def _with_same_schema(
+        self, df: datafusion.DataFrame, *, translation_seconds: float = 0.0
+    ) -> Self:
+        return self._with_native(
+            df,
+            schema=self._cached_schema,
+            columns=self._cached_columns,
+            translation_seconds=translation_seconds,
+        )
 
     def _with_version(self, version: Version) -> Self:
-        return self.__class__(self.native, version=version)
+        result = self.__class__(self.native, version=version)
+        result._sources = self._sources
+        result._translation_seconds = self._translation_seconds
+        return result
+
+    def _derived_from(self, *others: Self) -> Self:
+        # For operations with several inputs (joins, concatenation).
+        self._sources = (*self._sources, *(s for other in others for s in other._sources))
+        self._translation_seconds += sum(other._translation_seconds for other in others)
+        return self
     
     def _evaluate_expr(self, expr: DataFusionExpr) -> datafusion.Expr:
-        result = expr(self)
+        result = expr._call(self)
+        assert len(result) == 1
+        return result[0]
+
+    def _evaluate_window_expr(
+        self, expr: DataFusionExpr, /, window_inputs: WindowInputs[datafusion.Expr]
+    ) -> datafusion.Expr:
+        result = expr.window_function(self, window_inputs)
         assert len(result) == 1
         return result[0]
 
     @property
     def columns(self) -> list[str]:
         if self._cached_columns is None:
-            self._cached_columns = list(self.schema)
+            # Names alone don't need the (per-field) dtype conversion of `schema`.
+            self._cached_columns = (
+                list(self._cached_schema)
+                if self._cached_schema is not None
+                else self.native.schema().names
+            )
         return self._cached_columns
 
     @property
@@ -103,87 +363,636 @@ class DataFusionLazyFrame(
 
     def drop(self, columns: Sequence[str], *, strict: bool) -> Self:
         columns_to_drop = parse_columns_to_drop(self, columns, strict=strict)
-        return self._with_native(self.native.drop(columns_to_drop))
+        to_drop = set(columns_to_drop)
+        remaining = [name for name in self.columns if name not in to_drop]
+        # Project explicitly: `DataFrame.drop` normalizes unquoted (e.g. mixed-case) names.
+        return self._with_known_columns(
+            self.native.select(*(col(name) for name in remaining)), remaining
+        )
+
+    def drop_nulls(self, subset: Sequence[str] | None) -> Self:
+        subset_ = subset if subset is not None else self.columns
+        keep_condition = reduce(operator.and_, (col(name).is_not_null() for name in subset_))
+        return self._with_same_schema(self.native.filter(keep_condition))
+
+    def explode(self, columns: Sequence[str]) -> Self:
+        import pyarrow as pa
+        from narwhals.exceptions import InvalidOperationError
+
+        schema = self.collect_schema()
+        for name in columns:
+            if (dtype := schema[name]) != self._version.dtypes.List:
+                msg = f"`explode` operation not supported for dtype `{dtype}`, expected List type"
+                raise InvalidOperationError(msg)
+        native = self.native
+        if len(columns) > 1:
+            # Unnesting side by side would pad the shorter lists with nulls. A
+            # null list only matches another null list, as in polars.
+            lengths = [
+                datafusion.functions.coalesce(
+                    # `cardinality` is null for empty lists as well.
+                    datafusion.functions.array_length(col(name)).cast(pa.int64()),
+                    datafusion.lit(-1),
+                )
+                for name in columns
+            ]
+            matching = reduce(operator.and_, (length == lengths[0] for length in lengths[1:]))
+            native = native.filter(_check_lengths_match_udf()(matching))
+        # Like polars, empty lists become a null row; `unnest` would drop them.
+        native = native.select(
+            *(
+                datafusion.functions.when(
+                    datafusion.functions.cardinality(col(name)) > datafusion.lit(0),
+                    col(name),
+                )
+                .end()
+                .alias(name)
+                if name in columns
+                else col(name)
+                for name in self.columns
+            )
+        ).unnest_columns(*columns, preserve_nulls=True)
+        return self._with_native(native, columns=self.columns)
+
+    def filter(self, predicate: DataFusionExpr) -> Self:
+        # A single native predicate lets DataFusion push it down into the scan
+        # (e.g. Parquet row-group and page pruning).
+        with TranslationTimer() as timer:
+            mask = self._evaluate_expr(predicate)
+        return self._with_same_schema(
+            self.native.filter(mask), translation_seconds=timer.seconds
+        )
 
-    drop_nulls: not_implemented = not_implemented()
-    explode: not_implemented = not_implemented()
-    filter: not_implemented = not_implemented()
-    group_by: not_implemented = not_implemented()
+    def group_by(
+        self, keys: Sequence[str] | Sequence[DataFusionExpr], *, drop_null_keys: bool
+    ) -> DataFusionGroupBy:
+        from narwhals_datafusion.group_by import DataFusionGroupBy
+
+        return DataFusionGroupBy(self, keys, drop_null_keys=drop_null_keys)
     
     def head(self, n: int) -> Self:
-        return self._with_native(self.native.head(n))
+        return self._with_same_schema(self.native.head(n))
+
+    def _rename_right(self, other: Self, keys: Sequence[str], suffix: str) -> tuple[Self, dict[str, str]]:
+        """Rename `other`'s columns so a join never produces ambiguous names.
+
+        Join keys get temporary names (they're dropped after the join), other
+        columns clashing with `self` get `suffix` appended.
+        """
+        taken = [*self.columns, *other.columns]
+        mapping = {
+            name: generate_temporary_column_name(8, taken, prefix="join_key_")
+            if name in keys
+            else f"{name}{suffix}"
+            for name in other.columns
+            if name in keys or name in self.columns
+        }
+        return other.rename(mapping), mapping
+
+    def join(
+        self,
+        other: Self,
+        *,
+        how: JoinStrategy,
+        left_on: Sequence[str] | None,
+        right_on: Sequence[str] | None,
+        suffix: str,
+    ) -> Self:
+        if how == "cross":
+            rhs, _ = self._rename_right(other, [], suffix)
+            return self._with_native(
+                self.native.join_on(rhs.native, datafusion.lit(True))
+            )._derived_from(rhs)
+
+        assert left_on is not None
+        assert right_on is not None
+        # A full join keeps the right-hand keys, all other strategies drop them.
+        rhs, mapping = self._rename_right(other, [] if how == "full" else right_on, suffix)
+        # Equality predicates are planned as equi-join keys, same as `DataFrame.join`,
+        # but these don't go through SQL identifier parsing.
+        native = self.native.join_on(
+            rhs.native,
+            *(
+                col(left) == col(mapping.get(right, right))
+                for left, right in zip_strict(left_on, right_on)
+            ),
+            how=how,
+        )
+        result = self._with_native(native)._derived_from(rhs)
+        if how in {"full", "semi", "anti"}:
+            return result
+        return result.drop([mapping[name] for name in right_on], strict=True)
+
+    def join_asof(
+        self,
+        other: Self,
+        *,
+        left_on: str,
+        right_on: str,
+        by_left: Sequence[str] | None,
+        by_right: Sequence[str] | None,
+        strategy: AsofJoinStrategy,
+        suffix: str,
+    ) -> Self:
+        # Both sides are stacked and sorted once per `by` group. A running count
+        # of right rows then gives each right row its rank and each left row
+        # the rank of its match, which is fetched with an equi-join:
+        # O((n + m) log(n + m)) rather than a range join of every pair of rows.
+        F = datafusion.functions
+        by_left = by_left or []
+        by_right = by_right or []
+        rhs, mapping = self._rename_right(other, [right_on, *by_right], suffix)
+        key_names = {mapping[key] for key in (right_on, *by_right)}
+        payload = [name for name in rhs.columns if name not in key_names]
+        taken = [*self.columns, *rhs.columns]
 
-    join: not_implemented = not_implemented()
-    join_asof: not_implemented = not_implemented()
+        def temporary(prefix: str) -> str:
+            name = generate_temporary_column_name(8, taken, prefix=prefix)
+            taken.append(name)
+            return name
+
+        on, is_right, rank, match = (
+            temporary(prefix) for prefix in ("on_", "side_", "rank_", "match_")
+        )
+        keys = [temporary("by_") for _ in by_left]
+        left_schema, right_schema = self.native.schema(), rhs.native.schema()
+
+        def null(name: str, schema: pa.Schema) -> datafusion.Expr:
+            return datafusion.lit(None).cast(schema.field(name).type).alias(name)
+
+        lhs = self.native.select(
+            *(col(name) for name in self.columns),
+            *(null(name, right_schema) for name in payload),
+            *(col(left).alias(key) for left, key in zip_strict(by_left, keys)),
+            col(left_on).alias(on),
+            datafusion.lit(False).alias(is_right),
+        )
+        # Right rows with a null key can never match.
+        rhs_native = rhs.native.filter(
+            *(col(mapping[name]).is_not_null() for name in (right_on, *by_right))
+        ).select(
+            *(null(name, left_schema) for name in self.columns),
+            *(col(name) for name in payload),
+            *(col(mapping[right]).alias(key) for right, key in zip_strict(by_right, keys)),
+            col(mapping[right_on]).alias(on),
+            datafusion.lit(True).alias(is_right),
+        )
+
+        def running(expr: datafusion.Expr) -> datafusion.Expr:
+            # On ties, right rows come first unless matching forwards. Only
+            # running (rather than trailing) frames are used: DataFusion's
+            # `min` over `CURRENT ROW AND UNBOUNDED FOLLOWING` can be wrong.
+            return window_expression(
+                expr,
+                keys,
+                [on, is_right],
+                None,
+                0,
+                descending=[False, strategy != "forward"],
+                nulls_last=[True, True],
+            )
+
+        def right_only(name: str) -> datafusion.Expr:
+            return F.when(col(is_right), col(name)).end()
+
+        stacked = lhs.union(rhs_native).with_column(
+            rank, running(F.count(right_only(is_right)))
+        )
+        matchable = reduce(
+            operator.and_, (col(name).is_not_null() for name in [on, *keys])
+        )
+        right_keys = [temporary("right_by_") for _ in keys]
+        right_rank = temporary("right_rank_")
+
+        def right_rows(*names: str) -> datafusion.DataFrame:
+            return stacked.filter(col(is_right)).select(
+                *(col(name) for name in names),
+                *(col(key).alias(right) for key, right in zip_strict(keys, right_keys)),
+                col(rank).alias(right_rank),
+            )
+
+        def join_on_rank(
+            left: datafusion.DataFrame, right: datafusion.DataFrame, left_rank: datafusion.Expr
+        ) -> datafusion.DataFrame:
+            return left.join_on(
+                right,
+                left_rank == col(right_rank),
+                *(col(key) == col(right) for key, right in zip_strict(keys, right_keys)),
+                how="left",
+            )
+
+        left_side = stacked.filter(~col(is_right))
+        if strategy == "backward":
+            candidate = col(rank)
+        elif strategy == "forward":
+            candidate = col(rank) + datafusion.lit(1)
+        else:
+            # Compare with the next right row, whose key is looked up by rank.
+            # Like polars, ties are resolved in favour of the later right-hand row.
+            below, next_on = temporary("below_"), temporary("next_on_")
+            left_side = (
+                stacked.with_column(below, col(on) - running(F.max(right_only(on))))
+                .filter(~col(is_right))
+            )
+            lookup = join_on_rank(
+                left_side,
+                right_rows(on).with_column_renamed(on, next_on),
+                col(rank) + datafusion.lit(1),
+            )
+            left_side = lookup.select(
+                *(col(name) for name in [*self.columns, *keys, on, rank, below]),
+                (col(next_on) - col(on)).alias(next_on),
+            )
+            candidate = (
+                F.when(
+                    col(below).is_null() | (col(next_on) <= col(below)),
+                    col(rank) + datafusion.lit(1),
+                )
+                .otherwise(col(rank))
+            )
+        left_rows = left_side.select(
+            *(col(name) for name in [*self.columns, *keys]),
+            F.when(matchable, candidate).end().alias(match),
+        )
+        joined = join_on_rank(left_rows, right_rows(*payload), col(match))
+        return self._with_native(
+            joined.select(*(col(name) for name in [*self.columns, *payload]))
+        )._derived_from(rhs)
 
     def rename(self, mapping: Mapping[str, str]) -> Self:
         selection = [
-            datafusion.col(col).alias(mapping[col]) if col in mapping else col
-            for col in self.columns
+            col(name).alias(mapping[name]) if name in mapping else col(name)
+            for name in self.columns
         ]
-        return self._with_native(self.native.select(*selection))
+        schema = self._cached_schema
+        return self._with_native(
+            self.native.select(*selection),
+            schema=None
+            if schema is None
+            else {mapping.get(name, name): dtype for name, dtype in schema.items()},
+            columns=[mapping.get(name, name) for name in self.columns],
+        )
 
     def select(self, *exprs: DataFusionExpr) -> Self:
-        new_columns_map = evaluate_exprs(self, *exprs)
+        with TranslationTimer() as timer:
+            new_columns_map = evaluate_exprs(self, *exprs)
         if not new_columns_map:
             msg = "At least one expression must be passed to LazyFrame.select"
             raise ValueError(msg)
         try:
-            return self._with_native(self.native.select(*(val.alias(col) for col, val in new_columns_map)))
+            return self._with_native(
+                self.native.select(*(val.alias(name) for name, val in new_columns_map)),
+                translation_seconds=timer.seconds,
+            )
         except Exception as e:
             # TODO: Improve error handling
             raise e
     
     def simple_select(self, *column_names: str) -> Self:
-        return self._with_native(self.native.select_columns(*column_names))
+        return self._with_known_columns(
+            self.native.select(*(col(name) for name in column_names)), list(column_names)
+        )
 
-    sort: not_implemented = not_implemented()
+    def sort(self, *by: str, descending: bool | Sequence[bool], nulls_last: bool) -> Self:
+        # A `sort` followed by `head` is planned as a bounded Top-K sort.
+        descending = extend_bool(descending, len(by))
+        return self._with_same_schema(
+            self.native.sort(
+                *(
+                    col(name).sort(ascending=not desc, nulls_first=not nulls_last)
+                    for name, desc in zip_strict(by, descending)
+                )
+            )
+        )
+
+    def top_k(self, k: int, *, by: Iterable[str], reverse: bool | Sequence[bool]) -> Self:
+        by = list(by)
+        descending = [not rev for rev in extend_bool(reverse, len(by))]
+        return self.sort(*by, descending=descending, nulls_last=True).head(k)
 
     def tail(self, n: int) -> Self:
-        return self._with_native(self.native.tail(n))
+        return self._with_same_schema(self.native.tail(n))
 
-    unique: not_implemented = not_implemented()
-    unpivot: not_implemented = not_implemented()
+    def unique(
+        self,
+        subset: Sequence[str] | None,
+        *,
+        keep: UniqueKeepStrategy,
+        order_by: Sequence[str] | None,
+    ) -> Self:
+        subset_ = subset or self.columns
+        if error := check_columns_exist(subset_, available=self.columns):
+            raise error
+        if keep == "any" and not order_by:
+            if set(subset_) == set(self.columns):
+                return self._with_same_schema(self.native.distinct())
+            # A hash aggregate needs no shuffle or sort by the keys, unlike the
+            # window below, and any row per group will do.
+            others = [name for name in self.columns if name not in subset_]
+            native = self.native.aggregate(
+                [col(name) for name in subset_],
+                [datafusion.functions.first_value(col(name)).alias(name) for name in others],
+            )
+            return self._with_same_schema(native.select(*(col(name) for name in self.columns)))
+        tmp_name = generate_temporary_column_name(8, self.columns, prefix="row_index_")
+        if keep == "none":
+            # Ordering would turn the count into a running one.
+            window = window_expression(datafusion.functions.count_star(), subset_)
+        else:
+            flags = extend_bool(True, len(order_by)) if order_by and keep == "last" else None
+            window = window_expression(
+                datafusion.functions.row_number(),
+                subset_,
+                order_by or (),
+                descending=flags,
+                nulls_last=flags,
+            )
+        native = self.native.select(
+            *(col(name) for name in self.columns), window.alias(tmp_name)
+        ).filter(col(tmp_name) == datafusion.lit(1))
+        return self._with_same_schema(native.select(*(col(name) for name in self.columns)))
+
+    def unpivot(
+        self,
+        on: Sequence[str] | None,
+        index: Sequence[str] | None,
+        variable_name: str,
+        value_name: str,
+    ) -> Self:
+        import pyarrow as pa
+
+        index_ = [] if index is None else list(index)
+        on_ = [name for name in self.columns if name not in index_] if on is None else on
+        columns = [*index_, variable_name, value_name]
+        if not on_:
+            native = self.native.select(
+                *(col(name) for name in index_),
+                datafusion.lit(None).cast(pa.string()).alias(variable_name),
+                datafusion.lit(None).alias(value_name),
+            ).limit(0)
+            return self._with_native(native, columns=columns)
+        # A single pass: every row becomes an array of names and one of values,
+        # which are unnested side by side.
+        native = (
+            self.native.select(
+                *(col(name) for name in index_),
+                datafusion.functions.make_array(*(datafusion.lit(name) for name in on_)).alias(variable_name),
+                datafusion.functions.make_array(*(col(name) for name in on_)).alias(value_name),
+            )
+            .unnest_columns(variable_name, value_name)
+            .select(
+                *(col(name) for name in index_),
+                col(variable_name).cast(pa.string()).alias(variable_name),
+                col(value_name),
+            )
+        )
+        return self._with_native(native, columns=columns)
 
     def with_columns(self, *exprs: DataFusionExpr) -> Self:
-        new_columns_map = dict(evaluate_exprs(self, *exprs))
-        return self._with_native(self.native.with_columns(**new_columns_map))
+        with TranslationTimer() as timer:
+            new_columns_map = dict(evaluate_exprs(self, *exprs))
+        # Replaced columns keep their position, new ones are appended. Their
+        # dtypes aren't known without resolving the plan, so only names carry over.
+        columns = [*self.columns, *(name for name in new_columns_map if name not in self.columns)]
+        # A single projection rather than `native.with_columns`, which also
+        # keeps an unaliased copy of any window expression in its output.
+        native = self.native.select(
+            *(
+                new_columns_map[name].alias(name) if name in new_columns_map else col(name)
+                for name in columns
+            )
+        )
+        return self._with_native(
+            native, columns=columns, translation_seconds=timer.seconds
+        )
+
+    def with_row_index(self, name: str, order_by: Sequence[str] | None) -> Self:
+        import pyarrow as pa
+
+        # `row_number` is unsigned; cast before subtracting, which would
+        # otherwise widen to a decimal.
+        row_number = window_expression(datafusion.functions.row_number(), (), order_by or ())
+        index = row_number.cast(pa.int64()) - datafusion.lit(1)
+        native = self.native.select(index.alias(name), *(col(name) for name in self.columns))
+        return self._with_native(native, columns=[name, *self.columns])
 
-    with_row_index: not_implemented = not_implemented()
-    _iter_columns: not_implemented = not_implemented()
+    def _iter_columns(self) -> Iterator[datafusion.Expr]:
+        for name in self.columns:
+            yield col(name)
 
     def aggregate(self, *exprs: DataFusionExpr) -> Self:
-        new_columns_map = evaluate_exprs(self, *exprs)
+        with TranslationTimer() as timer:
+            new_columns_map = evaluate_exprs(self, *exprs)
         return self._with_native(
-            self._native_frame.aggregate([], [val.alias(col) for col, val in new_columns_map])
+            aggregate(
+                self._native_frame, [], [val.alias(name) for name, val in new_columns_map]
+            ),
+            translation_seconds=timer.seconds,
+        )
+
+    def _cached_plan(self) -> tuple[datafusion.SessionContext, ExecutionPlan] | None:
+        cache = plan_cache()
+        return None if cache is None else cache.execution_plan(self.native, self._sources)
+
+    def _collect_arrow(self) -> pa.Table:
+        """Execute the plan and return its result as a chunked Arrow table.
+
+        Each output partition runs on its own task and its batches become
+        chunks of the table as they are: nothing is concatenated or copied.
+        """
+        import pyarrow as pa
+
+        with udf_errors():
+            if (cached := self._cached_plan()) is not None:
+                context, plan = cached
+                batches = [batch.to_pyarrow() for batch in context.execute(plan, 0)]
+            else:
+                batches = [
+                    batch
+                    for partition in self.native.collect_partitioned()
+                    for batch in partition
+                ]
+        return pa.Table.from_batches(batches, schema=self.native.schema())
+
+    def persist(self) -> Self:
+        """Execute the plan once and return a frame that scans its result.
+
+        The result is kept in the session's `PersistCache`, so persisting the
+        same query again (e.g. a shared prefix of several branches) reuses it
+        instead of executing it again, until it is evicted or unpersisted.
+        """
+        cache = persist_cache()
+        key = plan_key(self.native, self._sources)
+        if (table := cache.get(key)) is None:
+            table = self._collect_arrow()
+            cache.put(key, self._sources, table)
+        result = self.from_native(session_context().from_arrow(table), context=self)
+        result._cached_schema = self._cached_schema
+        result._cached_columns = self._cached_columns
+        result._persist_key = key
+        return result
+
+    cache = persist
+
+    def unpersist(self) -> None:
+        """Drop the result persisted for this frame's query, if any."""
+        persist_cache().pop(self._persist_key or plan_key(self.native, self._sources))
+
+    def explain(self, *, analyze: bool = False, verbose: bool = False) -> str:
+        """Return the optimized logical and the physical plan.
+
+        With `analyze`, the query is executed and the physical plan annotated
+        with each operator's metrics (rows, compute time, spills, pruning).
+        """
+        if not analyze:
+            logical = self.native.optimized_logical_plan()
+            return (
+                "logical plan:\n"
+                + (logical.display_indent_schema() if verbose else logical.display_indent())
+                + "\nphysical plan:\n"
+                + self.native.execution_plan().display_indent()
+            )
+        # The bindings only print the result of `EXPLAIN ANALYZE`, as a table.
+        # (SQL over a registered view would drop the view's ordering.)
+        output = StringIO()
+        with redirect_stdout(output):
+            self.native.explain(verbose=verbose, analyze=True)
+        lines = output.getvalue().splitlines()
+        border = next(line for line in lines if line.startswith("+"))
+        start = border.index("+", 1) + 2
+        rows = [line for line in lines if line.startswith("|")][1:]
+        return "\n".join(line[start:-1].rstrip() for line in rows).strip("\n")
+
+    def _profiled(self, operation: str, run: Callable[[], T]) -> T:
+        if (profiler_ := profiler()) is None:
+            return run()
+        callback, analyze = profiler_
+        start = perf_counter()
+        result = run()
+        execution_seconds = perf_counter() - start
+        # Metrics can only be collected by executing the query once more.
+        plan = self.explain(analyze=True) if analyze else None
+        self._report(callback, operation, execution_seconds, plan)
+        return result
+
+    async def _profiled_async(self, operation: str, run: Callable[[], Awaitable[T]]) -> T:
+        if (profiler_ := profiler()) is None:
+            return await run()
+        callback, analyze = profiler_
+        start = perf_counter()
+        result = await run()
+        execution_seconds = perf_counter() - start
+        plan = await asyncio.to_thread(self.explain, analyze=True) if analyze else None
+        self._report(callback, operation, execution_seconds, plan)
+        return result
+
+    def _report(
+        self,
+        callback: Callable[[QueryProfile], None],
+        operation: str,
+        execution_seconds: float,
+        plan: str | None,
+    ) -> None:
+        callback(
+            QueryProfile(
+                operation=operation,
+                translation_seconds=self._translation_seconds,
+                execution_seconds=execution_seconds,
+                plan=plan,
+                operators=[] if plan is None else parse_operator_metrics(plan),
+            )
+        )
+
+    def collect(
+        self,
+        backend: ModuleType | Implementation | str | None,
+        *,
+        consolidate: bool = False,
+        **kwargs: Any,
+    ) -> CompliantDataFrameAny:
+        """Execute the plan and collect its result into an eager dataframe.
+
+        By default the result's Arrow chunks are handed over without copying:
+        polars frames aren't rechunked and pandas columns use `pd.ArrowDtype`.
+        With `consolidate`, Arrow and polars columns are made contiguous and
+        pandas frames are converted to NumPy-backed blocks.
+        """
+        return self._profiled(
+            "collect",
+            lambda: self._from_arrow(self._collect_arrow(), backend, consolidate=consolidate),
+        )
+
+    async def collect_async(
+        self,
+        backend: ModuleType | Implementation | str | None = None,
+        *,
+        consolidate: bool = False,
+    ) -> CompliantDataFrameAny:
+        """Like `collect`, but awaits the result instead of blocking the event loop."""
+        backend = None if backend is None else Implementation.from_backend(backend)
+        table = await self._profiled_async("collect", self._collect_arrow_async)
+        return self._from_arrow(table, backend, consolidate=consolidate)
+
+    async def _collect_arrow_async(self) -> pa.Table:
+        # Like `_collect_arrow`, every output partition is drained concurrently
+        # and its batches become chunks of the table.
+        import pyarrow as pa
+
+        if (cached := self._cached_plan()) is not None:
+            context, plan = cached
+            streams = [context.execute(plan, 0)]
+        else:
+            streams = self.native.execute_stream_partitioned()
+
+        async def drain(stream: RecordBatchStream) -> list[pa.RecordBatch]:
+            return [batch.to_pyarrow() async for batch in _limited(stream)]
+
+        with udf_errors():
+            partitions = await asyncio.gather(*map(drain, streams))
+        return pa.Table.from_batches(
+            [batch for partition in partitions for batch in partition],
+            schema=self.native.schema(),
         )
 
-    def collect(self, backend: ModuleType | Implementation | str | None, **kwargs: Any) -> CompliantDataFrameAny:
+    def _from_arrow(
+        self,
+        table: pa.Table,
+        backend: ModuleType | Implementation | str | None,
+        *,
+        consolidate: bool,
+    ) -> CompliantDataFrameAny:
         if backend is None or backend is Implementation.PYARROW:
             from narwhals._arrow.dataframe import ArrowDataFrame
 
             return ArrowDataFrame(
-                native_dataframe=self.native.to_arrow_table(),
+                native_dataframe=table.combine_chunks() if consolidate else table,
                 validate_backend_version=True,
                 version=self._version,
                 validate_column_names=True,
             )
         if backend is Implementation.PANDAS:
+            import pandas as pd
             from narwhals._pandas_like.dataframe import PandasLikeDataFrame
 
+            # `self_destruct` frees each column's Arrow buffers once converted,
+            # so the table and the frame don't both have to fit in memory.
+            table = _cast_views(table)
             return PandasLikeDataFrame(
-                native_dataframe=self.native.to_pandas(),
+                native_dataframe=table.to_pandas(split_blocks=True, self_destruct=True)
+                if consolidate
+                else table.to_pandas(types_mapper=pd.ArrowDtype),
                 implementation=Implementation.PANDAS,
                 validate_backend_version=True,
                 version=self._version,
                 validate_column_names=True,
             )
-        
+
         if backend is Implementation.POLARS:
+            import polars as pl
             from narwhals._polars.dataframe import PolarsDataFrame
 
             return PolarsDataFrame(
-                df=self.native.to_polars(),
+                df=pl.from_arrow(table, rechunk=consolidate),
                 validate_backend_version=True,
                 version=self._version,
             )
@@ -191,5 +1000,207 @@ class DataFusionLazyFrame(
         msg = f"Unsupported `backend` value: {backend}"
         raise ValueError(msg)
 
-    def sink_parquet(self, file: str | Path | BytesIO) -> None:
-        return self.native.write_parquet(file)
+    def iter_batches(self, batch_size: int | None = None) -> Iterator[pa.RecordBatch]:
+        """Execute the plan and yield its result as Arrow record batches.
+
+        Batches are pulled from DataFusion's execution stream one at a time, so
+        peak memory is bounded by the batch size rather than the result size.
+        Batches with more than `batch_size` rows are split into zero-copy slices.
+        """
+        with udf_errors():
+            for batch in self._execute_stream():
+                yield from _split_batch(batch.to_pyarrow(), batch_size)
+
+    async def iter_batches_async(
+        self, batch_size: int | None = None
+    ) -> AsyncIterator[pa.RecordBatch]:
+        """Like `iter_batches`, but awaits each batch instead of blocking.
+
+        Batches are computed on DataFusion's own threads while the event loop
+        keeps running, and at most `configure_async_concurrency` of them at
+        once per loop. Cancelling the consuming task (or closing the iterator)
+        drops the stream, which stops the plan after the batch in progress.
+        """
+        with udf_errors():
+            async for batch in _limited(self._execute_stream()):
+                for native_batch in _split_batch(batch.to_pyarrow(), batch_size):
+                    yield native_batch
+
+    def _execute_stream(self) -> RecordBatchStream:
+        if (cached := self._cached_plan()) is None:
+            return self.native.execute_stream()
+        context, plan = cached
+        return context.execute(plan, 0)
+
+    def to_batch_reader(self, batch_size: int | None = None) -> pa.RecordBatchReader:
+        import pyarrow as pa
+
+        return pa.RecordBatchReader.from_batches(
+            self.native.schema(), self.iter_batches(batch_size)
+        )
+
+    def __arrow_c_stream__(self, requested_schema: object | None = None) -> object:
+        # Unlike `datafusion.DataFrame.__arrow_c_stream__`, this doesn't collect first.
+        return self.to_batch_reader().__arrow_c_stream__(requested_schema)
+
+    def _write_options(
+        self, partition_by: str | Sequence[str] | None, *, single_file: bool
+    ) -> datafusion.DataFrameWriteOptions | None:
+        if partition_by is not None and single_file:
+            msg = "`partition_by` cannot be combined with `single_file=True`."
+            raise ValueError(msg)
+        if partition_by is None and not single_file:
+            return None
+        return datafusion.DataFrameWriteOptions(
+            single_file_output=single_file, partition_by=partition_by
+        )
+
+    def sink_parquet(
+        self,
+        file: str | Path | BytesIO,
+        *,
+        partition_by: str | Sequence[str] | None = None,
+        compression: str = "zstd",
+        compression_level: int | None = None,
+        row_group_size: int | None = None,
+        single_file: bool = False,
+    ) -> None:
+        """Execute the plan and write the result to Parquet.
+
+        Paths without a file extension are written as a directory, into which
+        DataFusion writes files in parallel. `partition_by` writes a hive-style
+        `key=value/` directory per group, `single_file` forces a single file.
+        """
+        self._profiled(
+            "sink_parquet",
+            lambda: self._sink_parquet(
+                file,
+                partition_by=partition_by,
+                compression=compression,
+                compression_level=compression_level,
+                row_group_size=row_group_size,
+                single_file=single_file,
+            ),
+        )
+
+    def _sink_parquet(
+        self,
+        file: str | Path | BytesIO,
+        *,
+        partition_by: str | Sequence[str] | None,
+        compression: str,
+        compression_level: int | None,
+        row_group_size: int | None,
+        single_file: bool,
+    ) -> None:
+        if not isinstance(file, (str, PathLike)):
+            if partition_by is not None:
+                msg = "`partition_by` requires `file` to be a path."
+                raise ValueError(msg)
+            with _ParquetFileWriter(
+                file,
+                self.native.schema(),
+                compression=compression,
+                compression_level=compression_level,
+                row_group_size=row_group_size,
+            ) as writer:
+                for batch in self.iter_batches():
+                    writer.write(batch)
+            return
+        codec, compression_level = _parquet_codec(compression, compression_level)
+        options = datafusion.ParquetWriterOptions(
+            compression=codec.value
+            if compression_level is None
+            else f"{codec.value}({compression_level})"
+        )
+        if row_group_size is not None:
+            options.max_row_group_size = row_group_size
+        with udf_errors():
+            self.native.write_parquet_with_options(
+                file,
+                options,
+                self._write_options(partition_by, single_file=single_file),
+            )
+
+    async def sink_parquet_async(
+        self,
+        file: str | Path | BytesIO,
+        *,
+        partition_by: str | Sequence[str] | None = None,
+        compression: str = "zstd",
+        compression_level: int | None = None,
+        row_group_size: int | None = None,
+        single_file: bool = False,
+    ) -> None:
+        """Like `sink_parquet`, but awaits the write instead of blocking.
+
+        Single-file outputs are written from `iter_batches_async`, so that
+        cancelling stops the plan. DataFusion's Python API can't write
+        partitioned or multi-file outputs asynchronously, so those are
+        written on a worker thread, which cancellation doesn't interrupt.
+        """
+        async def run() -> None:
+            if partition_by is not None or not (
+                single_file or not isinstance(file, (str, PathLike)) or Path(file).suffix
+            ):
+                await asyncio.to_thread(
+                    self._sink_parquet,
+                    file,
+                    partition_by=partition_by,
+                    compression=compression,
+                    compression_level=compression_level,
+                    row_group_size=row_group_size,
+                    single_file=single_file,
+                )
+                return
+            with _ParquetFileWriter(
+                file,
+                self.native.schema(),
+                compression=compression,
+                compression_level=compression_level,
+                row_group_size=row_group_size,
+            ) as writer:
+                async for batch in self.iter_batches_async():
+                    writer.write(batch)
+
+        await self._profiled_async("sink_parquet", run)
+
+    def sink_csv(
+        self,
+        file: str | Path,
+        *,
+        partition_by: str | Sequence[str] | None = None,
+        include_header: bool = True,
+        single_file: bool = False,
+    ) -> None:
+        with udf_errors():
+            self.native.write_csv(
+                file,
+                with_header=include_header,
+                write_options=self._write_options(partition_by, single_file=single_file),
+            )
+
+    def sink_ndjson(
+        self,
+        file: str | Path,
+        *,
+        partition_by: str | Sequence[str] | None = None,
+        single_file: bool = False,
+    ) -> None:
+        with udf_errors():
+            self.native.write_json(
+                file,
+                write_options=self._write_options(partition_by, single_file=single_file),
+            )
+
+    def sink_ipc(
+        self, file: str | Path | BytesIO, *, compression: str | None = "zstd"
+    ) -> None:
+        # DataFusion's Python API has no Arrow IPC writer, so stream the batches
+        # through pyarrow's; only one batch is held in memory at a time.
+        import pyarrow as pa
+
+        options = pa.ipc.IpcWriteOptions(compression=compression)
+        with pa.ipc.new_file(file, self.native.schema(), options=options) as writer:
+            for batch in self.iter_batches():
+                writer.write_batch(batch)
@@ -1,26 +1,371 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING, cast, Literal
 import operator
 from narwhals._arrow.utils import narwhals_to_native_dtype
 from narwhals._compliant import LazyExpr
-from narwhals._utils import Implementation, not_implemented
+from narwhals._compliant.window import WindowInputs
+from narwhals._expression_parsing import (
+    ExprKind,
+    combine_alias_output_names,
+    combine_evaluate_output_names,
+)
+from narwhals._utils import Implementation, extend_bool, not_implemented
+from narwhals_datafusion.expr_dt import DataFusionExprDateTimeNamespace
+from narwhals_datafusion.expr_str import DataFusionExprStringNamespace
+from narwhals_datafusion.utils import (
+    approximate_aggregations,
+    cast_aggregate,
+    col,
+    raise_from_udf,
+    window_expression,
+)
 import datafusion
+import pyarrow as pa
+from datafusion.user_defined import Accumulator, WindowEvaluator
 from narwhals.dtypes import DType
 from narwhals.typing import IntoDType
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence, Callable
+    from collections.abc import Iterable, Mapping, Sequence, Callable
     import datafusion
+    from narwhals._arrow.series import ArrowSeries
     from narwhals._compliant.typing import AliasNames, EvalNames, EvalSeries, WindowFunction
     from narwhals_datafusion.dataframe import DataFusionLazyFrame
     from narwhals._expression_parsing import ExprMetadata
-    from narwhals._expression_parsing import ExprKind
     from narwhals._utils import Version
     from narwhals_datafusion.namespace import DataFusionNamespace
     from typing_extensions import Self, TypeIs
     from typing import Any
     from narwhals._utils import Version, _LimitedContext
+    from narwhals.typing import ModeKeepStrategy, RankMethod, RollingInterpolationMethod
+
+
+class _CumProd(WindowEvaluator):
+    def evaluate_all(self, values: list[pa.Array], num_rows: int) -> pa.Array:
+        import pyarrow.compute as pc
+
+        return pc.cumulative_prod(values[0], skip_nulls=True)
+
+
+@lru_cache(maxsize=None)
+def _cum_prod_udwf(dtype: pa.DataType) -> datafusion.WindowUDF:
+    # DataFusion has no product aggregate. This evaluates a whole (sorted)
+    # partition at once with a vectorized pyarrow kernel.
+    return datafusion.udwf(_CumProd, [dtype], dtype, "immutable", name="cum_prod")
+
+class _Moments(Accumulator):
+    """Count, mean and central moment sums (M2, M3, M4) of the non-null values.
+
+    Partial results are combined with Pébay's pairwise update formulas, so the
+    state stays the same size and is numerically stable.
+    """
+
+    def __init__(self, statistic: Literal["skew", "kurtosis"]) -> None:
+        self._statistic = statistic
+        self._moments = (0.0, 0.0, 0.0, 0.0, 0.0)
+
+    def _combine(self, other: tuple[float, float, float, float, float]) -> None:
+        n_a, mean_a, m2_a, m3_a, m4_a = self._moments
+        n_b, mean_b, m2_b, m3_b, m4_b = other
+        if not n_b:
+            return
+        n = n_a + n_b
+        delta = mean_b - mean_a
+        self._moments = (
+            n,
+            mean_a + delta * n_b / n,
+            m2_a + m2_b + delta**2 * n_a * n_b / n,
+            m3_a
+            + m3_b
+            + delta**3 * n_a * n_b * (n_a - n_b) / n**2
+            + 3 * delta * (n_a * m2_b - n_b * m2_a) / n,
+            m4_a
+            + m4_b
+            + delta**4 * n_a * n_b * (n_a**2 - n_a * n_b + n_b**2) / n**3
+            + 6 * delta**2 * (n_a**2 * m2_b + n_b**2 * m2_a) / n**2
+            + 4 * delta * (n_a * m3_b - n_b * m3_a) / n,
+        )
+
+    def update(self, *values: pa.Array) -> None:
+        import pyarrow.compute as pc
+
+        array = values[0].drop_null().cast(pa.float64())
+        if not (n := len(array)):
+            return
+        mean = pc.mean(array).as_py()
+        deviations = pc.subtract(array, mean)
+        squares = pc.multiply(deviations, deviations)
+        self._combine(
+            (
+                float(n),
+                mean,
+                pc.sum(squares).as_py(),
+                pc.sum(pc.multiply(squares, deviations)).as_py(),
+                pc.sum(pc.multiply(squares, squares)).as_py(),
+            )
+        )
+
+    def merge(self, states: list[pa.Array]) -> None:
+        for moments in zip(*(state.to_pylist() for state in states)):
+            self._combine(moments)
+
+    def state(self) -> list[pa.Scalar]:
+        return [pa.scalar(moment, pa.float64()) for moment in self._moments]
+
+    def evaluate(self) -> pa.Scalar:
+        n, _, m2, m3, m4 = self._moments
+        if not n:
+            return pa.scalar(None, pa.float64())
+        # Population (biased) statistics, like polars' defaults.
+        if self._statistic == "skew":
+            value = m3 / n / (m2 / n) ** 1.5 if m2 else float("nan")
+        else:
+            value = m4 / n / (m2 / n) ** 2 - 3 if m2 else float("nan")
+        return pa.scalar(value, pa.float64())
+
+
+@lru_cache(maxsize=None)
+def _moments_udaf(statistic: Literal["skew", "kurtosis"]) -> datafusion.AggregateUDF:
+    return datafusion.udaf(
+        lambda: _Moments(statistic),
+        [pa.float64()],
+        pa.float64(),
+        [pa.float64()] * 5,
+        "immutable",
+        name=statistic,
+    )
+
+
+class _Quantile(Accumulator):
+    # DataFusion has no exact percentile aggregate (other than `median`).
+    def __init__(self, quantile: float, interpolation: RollingInterpolationMethod) -> None:
+        self._quantile = quantile
+        self._interpolation = interpolation
+        self._chunks: list[pa.Array] = []
+
+    def update(self, *values: pa.Array) -> None:
+        self._chunks.append(values[0].drop_null())
+
+    def merge(self, states: list[pa.Array]) -> None:
+        self._chunks.append(states[0].flatten())
+
+    def _values(self) -> pa.Array:
+        return pa.concat_arrays(self._chunks) if self._chunks else pa.array([], pa.float64())
+
+    def state(self) -> list[pa.Scalar]:
+        values = self._values()
+        return [pa.ListArray.from_arrays([0, len(values)], values)[0]]
+
+    def evaluate(self) -> pa.Scalar:
+        import pyarrow.compute as pc
+
+        values = self._values()
+        if not len(values):
+            return pa.scalar(None, pa.float64())
+        return pc.quantile(values, q=self._quantile, interpolation=self._interpolation)[0]
+
+
+@lru_cache(maxsize=None)
+def _quantile_udaf(
+    quantile: float, interpolation: RollingInterpolationMethod
+) -> datafusion.AggregateUDF:
+    return datafusion.udaf(
+        lambda: _Quantile(quantile, interpolation),
+        [pa.float64()],
+        pa.float64(),
+        [pa.list_(pa.float64())],
+        "immutable",
+        name="quantile",
+    )
+
+
+class _Mode(Accumulator):
+    # Keeps one count per distinct non-null value.
+    def __init__(self, dtype: pa.DataType) -> None:
+        self._counts = pa.table(
+            {"value": pa.array([], dtype), "count": pa.array([], pa.int64())}
+        )
+
+    def _add(self, values: pa.Array, counts: pa.Array) -> None:
+        table = pa.concat_tables([self._counts, pa.table({"value": values, "count": counts})])
+        self._counts = (
+            table.group_by("value")
+            .aggregate([("count", "sum")])
+            .rename_columns(["value", "count"])
+        )
+
+    def update(self, *values: pa.Array) -> None:
+        import pyarrow.compute as pc
+
+        counts = pc.value_counts(values[0].drop_null())
+        self._add(counts.field("values"), counts.field("counts"))
+
+    def merge(self, states: list[pa.Array]) -> None:
+        self._add(states[0].flatten(), states[1].flatten())
+
+    def state(self) -> list[pa.Scalar]:
+        n = self._counts.num_rows
+        return [
+            pa.ListArray.from_arrays([0, n], self._counts[name].combine_chunks())[0]
+            for name in ("value", "count")
+        ]
+
+    def evaluate(self) -> pa.Scalar:
+        import pyarrow.compute as pc
+
+        if not self._counts.num_rows:
+            return pa.scalar(None, self._counts.schema.field("value").type)
+        index = pc.index(self._counts["count"], pc.max(self._counts["count"]))
+        return self._counts["value"][index.as_py()]
+
+
+@lru_cache(maxsize=None)
+def _mode_udaf(dtype: pa.DataType) -> datafusion.AggregateUDF:
+    return datafusion.udaf(
+        lambda: _Mode(dtype),
+        [dtype],
+        dtype,
+        [pa.list_(dtype), pa.list_(pa.int64())],
+        "immutable",
+        name="mode",
+    )
+
+
+def _arrow_series(values: pa.Array, name: str, version: Version) -> ArrowSeries:
+    from narwhals._arrow.series import ArrowSeries
+
+    return ArrowSeries(pa.chunked_array([values]), name=name, version=version)
+
+
+def _to_arrow(result: Any) -> pa.Array | pa.Scalar:
+    # What `map_batches` functions may return, as in the eager backends.
+    from narwhals._arrow.series import ArrowSeries
+    from narwhals.dependencies import is_numpy_array
+
+    if isinstance(result, ArrowSeries):
+        return result.native.combine_chunks()
+    if isinstance(result, (pa.Array, pa.Scalar)):
+        return result
+    if isinstance(result, pa.ChunkedArray):
+        return result.combine_chunks()
+    if is_numpy_array(result):
+        return pa.array(result)
+    return pa.scalar(result)
+
+
+def _map_batches_return_type(
+    function: Callable[[ArrowSeries], Any], dtype: pa.DataType, name: str, version: Version
+) -> pa.DataType:
+    try:
+        return _to_arrow(function(_arrow_series(pa.array([], dtype), name, version))).type
+    except Exception as exc:
+        msg = (
+            "Could not infer the return type of the `map_batches` function by "
+            "calling it on an empty series.\n\nHint: Pass `return_dtype`."
+        )
+        raise ValueError(msg) from exc
+
+
+def _map_batches_udf(
+    function: Callable[[ArrowSeries], Any],
+    dtype: pa.DataType,
+    return_type: pa.DataType,
+    name: str,
+    version: Version,
+) -> datafusion.ScalarUDF:
+    def evaluate(values: pa.Array) -> pa.Array:
+        result = _to_arrow(function(_arrow_series(values, name, version)))
+        if not isinstance(result, pa.Array) or len(result) != len(values):
+            msg = (
+                "`map_batches` with `returns_scalar=False` must return one value "
+                f"per row, got {type(result).__name__!r} for a batch of {len(values)} rows."
+                "\n\nIf `returns_scalar` is set to `True`, a returned value can be a scalar value."
+            )
+            raise_from_udf(TypeError(msg))
+        return result.cast(return_type)
+
+    return datafusion.udf(evaluate, [dtype], return_type, "immutable", name="map_batches")
+
+
+class _MapBatches(Accumulator):
+    # Keeps every value of the group, to call the function on all of them at once.
+    def __init__(
+        self,
+        function: Callable[[ArrowSeries], Any],
+        dtype: pa.DataType,
+        return_type: pa.DataType,
+        name: str,
+        version: Version,
+    ) -> None:
+        self._function = function
+        self._dtype = dtype
+        self._return_type = return_type
+        self._name = name
+        self._version = version
+        self._chunks: list[pa.Array] = []
+
+    def update(self, *values: pa.Array) -> None:
+        self._chunks.append(values[0])
+
+    def merge(self, states: list[pa.Array]) -> None:
+        self._chunks.append(states[0].flatten())
+
+    def _values(self) -> pa.Array:
+        return pa.concat_arrays(self._chunks) if self._chunks else pa.array([], self._dtype)
+
+    def state(self) -> list[pa.Scalar]:
+        values = self._values()
+        return [pa.ListArray.from_arrays([0, len(values)], values)[0]]
+
+    def evaluate(self) -> pa.Scalar:
+        values = _arrow_series(self._values(), self._name, self._version)
+        result = _to_arrow(self._function(values))
+        if isinstance(result, pa.Array):
+            if len(result) != 1:
+                msg = f"`map_batches` with `returns_scalar=True` returned {len(result)} values."
+                raise_from_udf(TypeError(msg))
+            result = result[0]
+        return result.cast(self._return_type)
+
+
+def _map_batches_udaf(
+    function: Callable[[ArrowSeries], Any],
+    dtype: pa.DataType,
+    return_type: pa.DataType,
+    name: str,
+    version: Version,
+) -> datafusion.AggregateUDF:
+    return datafusion.udaf(
+        lambda: _MapBatches(function, dtype, return_type, name, version),
+        [dtype],
+        return_type,
+        [pa.list_(dtype)],
+        "immutable",
+        name="map_batches",
+    )
+
+
+def _replace_strict_udf(
+    dtype: pa.DataType, old: pa.Array, new: pa.Array
+) -> datafusion.ScalarUDF:
+    def evaluate(values: pa.Array) -> pa.Array:
+        import pyarrow.compute as pc
+        from narwhals.exceptions import InvalidOperationError
+
+        indices = pc.index_in(values, value_set=old)
+        if (unmatched := pc.and_(values.is_valid(), indices.is_null())).true_count:
+            msg = (
+                "replace_strict did not replace all non-null values.\n\n"
+                "The following did not get replaced: "
+                f"{pc.unique(values.filter(unmatched)).to_pylist()}"
+            )
+            raise_from_udf(InvalidOperationError(msg))
+        return new.take(indices)
+
+    return datafusion.udf(evaluate, [dtype], new.type, "immutable", name="replace_strict")
+
 
 class DataFusionExpr(LazyExpr["DataFusionLazyFrame", "datafusion.Expr"]):
     _implementation = Implementation.UNKNOWN
@@ -28,12 +373,14 @@ class DataFusionExpr(LazyExpr["DataFusionLazyFrame", "datafusion.Expr"]):
     def __init__(
         self,
         call: Callable[[DataFusionLazyFrame], Sequence[datafusion.Expr]],
+        window_function: WindowFunction[DataFusionLazyFrame, datafusion.Expr] | None = None,
         *,
         evaluate_output_names: EvalNames[DataFusionLazyFrame],
         alias_output_names: AliasNames | None,
         version: Version,
     ) -> None:
         self._call = call
+        self._window_function = window_function
         self._evaluate_output_names = evaluate_output_names
         self._alias_output_names = alias_output_names
         self._version = version
@@ -61,10 +408,11 @@ class DataFusionExpr(LazyExpr["DataFusionLazyFrame", "datafusion.Expr"]):
         context: _LimitedContext,
     ) -> Self:
         def func(df: DataFusionLazyFrame) -> list[datafusion.Expr]:
-            return [datafusion.col(col_name) for col_name in evaluate_column_names(df)]
+            return [col(col_name) for col_name in evaluate_column_names(df)]
 
         return cls(
             func,
+            cls._window_invariant(func),
             evaluate_output_names=evaluate_column_names,
             alias_output_names=None,
             version=context._version,
@@ -76,10 +424,11 @@ class DataFusionExpr(LazyExpr["DataFusionLazyFrame", "datafusion.Expr"]):
     ) -> Self:
         def func(df: DataFusionLazyFrame) -> list[datafusion.Expr]:
             columns = df.columns
-            return [datafusion.col(columns[i]) for i in column_indices]
+            return [col(columns[i]) for i in column_indices]
 
         return cls(
             func,
+            cls._window_invariant(func),
             evaluate_output_names=lambda df: [df.columns[i] for i in column_indices],
             alias_output_names=None,
             version=context._version,
@@ -88,6 +437,87 @@ class DataFusionExpr(LazyExpr["DataFusionLazyFrame", "datafusion.Expr"]):
 
 
 
+    @staticmethod
+    def _window_invariant(
+        call: Callable[[DataFusionLazyFrame], Sequence[datafusion.Expr]],
+    ) -> WindowFunction[DataFusionLazyFrame, datafusion.Expr]:
+        # Columns and literals are the same in every window. DataFusion only
+        # accepts aggregate and window functions with `OVER`, so elementwise
+        # operations on them (e.g. `(col('a') - col('a').mean()).over('g')`)
+        # must leave them as they are.
+        def window_f(
+            df: DataFusionLazyFrame, _inputs: WindowInputs[datafusion.Expr]
+        ) -> Sequence[datafusion.Expr]:
+            return call(df)
+
+        return window_f
+
+    @property
+    def window_function(self) -> WindowFunction[DataFusionLazyFrame, datafusion.Expr]:
+        def default_window_func(
+            df: DataFusionLazyFrame, inputs: WindowInputs[datafusion.Expr]
+        ) -> list[datafusion.Expr]:
+            assert not inputs.order_by
+            return [
+                self._window_expression(expr, inputs.partition_by)
+                for expr in self._call(df)
+            ]
+
+        return self._window_function or default_window_func
+
+    @staticmethod
+    def _window_expression(
+        expr: datafusion.Expr,
+        partition_by: Sequence[str | datafusion.Expr] = (),
+        order_by: Sequence[str | datafusion.Expr] = (),
+        rows_start: int | None = None,
+        rows_end: int | None = None,
+        *,
+        descending: Sequence[bool] | None = None,
+        nulls_last: Sequence[bool] | None = None,
+    ) -> datafusion.Expr:
+        return window_expression(
+            expr,
+            partition_by,
+            order_by,
+            rows_start,
+            rows_end,
+            descending=descending,
+            nulls_last=nulls_last,
+        )
+
+    def _push_down_window_function(
+        self, call: Callable[..., datafusion.Expr], /, **expressifiable_args: Self | Any
+    ) -> WindowFunction[DataFusionLazyFrame, datafusion.Expr]:
+        def window_f(
+            df: DataFusionLazyFrame, window_inputs: WindowInputs[datafusion.Expr]
+        ) -> list[datafusion.Expr]:
+            # `f(g) over (window)` is `f(g over (window))` for elementwise `f`.
+            native_series_list = self.window_function(df, window_inputs)
+            other_native_series = {
+                key: df._evaluate_window_expr(value, window_inputs)
+                if self._is_expr(value)
+                else datafusion.lit(value)
+                for key, value in expressifiable_args.items()
+            }
+            return [
+                call(native_series, **other_native_series)
+                for native_series in native_series_list
+            ]
+
+        return window_f
+
+    def _with_window_function(
+        self, window_function: WindowFunction[DataFusionLazyFrame, datafusion.Expr]
+    ) -> Self:
+        return self.__class__(
+            self._call,
+            window_function,
+            evaluate_output_names=self._evaluate_output_names,
+            alias_output_names=self._alias_output_names,
+            version=self._version,
+        )
+
     @classmethod
     def _is_expr(cls, obj: Self | Any) -> TypeIs[Self]:
         return hasattr(obj, "__narwhals_expr__")
@@ -96,7 +526,7 @@ class DataFusionExpr(LazyExpr["DataFusionLazyFrame", "datafusion.Expr"]):
         self, call: Callable[..., datafusion.Expr], /, **expressifiable_args: Self | Any
     ) -> EvalSeries[DataFusionLazyFrame, datafusion.Expr]:
         def func(df: DataFusionLazyFrame) -> list[datafusion.Expr]:
-            native_series_list = self(df)
+            native_series_list = self._call(df)
             other_native_series = {
                 key: df._evaluate_expr(value) if self._is_expr(value) else datafusion.lit(value)
                 for key, value in expressifiable_args.items()
@@ -109,10 +539,15 @@ class DataFusionExpr(LazyExpr["DataFusionLazyFrame", "datafusion.Expr"]):
         return func
     
     def _with_callable(
-        self, call: Callable[..., datafusion.Expr], /, **expressifiable_args: Self | Any
+        self,
+        call: Callable[..., datafusion.Expr],
+        window_func: WindowFunction[DataFusionLazyFrame, datafusion.Expr] | None = None,
+        /,
+        **expressifiable_args: Self | Any,
     ) -> Self:
         return self.__class__(
             self._callable_to_eval_series(call, **expressifiable_args),
+            window_func,
             evaluate_output_names=self._evaluate_output_names,
             alias_output_names=self._alias_output_names,
             version=self._version,
@@ -123,6 +558,7 @@ class DataFusionExpr(LazyExpr["DataFusionLazyFrame", "datafusion.Expr"]):
     ) -> Self:
         return self.__class__(
             self._callable_to_eval_series(call, **expressifiable_args),
+            self._push_down_window_function(call, **expressifiable_args),
             evaluate_output_names=self._evaluate_output_names,
             alias_output_names=self._alias_output_names,
             version=self._version,
@@ -131,14 +567,43 @@ class DataFusionExpr(LazyExpr["DataFusionLazyFrame", "datafusion.Expr"]):
     def _with_binary(self, op: Callable[..., datafusion.Expr], other: Self | Any) -> Self:
         return self.__class__(
             self._callable_to_eval_series(op, other=other),
+            self._push_down_window_function(op, other=other),
             evaluate_output_names=self._evaluate_output_names,
             alias_output_names=self._alias_output_names,
             version=self._version,
         )
     
+    @classmethod
+    def _from_elementwise_horizontal_op(
+        cls, func: Callable[[Iterable[datafusion.Expr]], datafusion.Expr], *exprs: Self
+    ) -> Self:
+        def call(df: DataFusionLazyFrame) -> list[datafusion.Expr]:
+            cols = (native for _expr in exprs for native in _expr._call(df))
+            return [func(cols)]
+
+        def window_function(
+            df: DataFusionLazyFrame, window_inputs: WindowInputs[datafusion.Expr]
+        ) -> list[datafusion.Expr]:
+            cols = (
+                native
+                for _expr in exprs
+                for native in _expr.window_function(df, window_inputs)
+            )
+            return [func(cols)]
+
+        context = exprs[0]
+        return cls(
+            call,
+            window_function,
+            evaluate_output_names=combine_evaluate_output_names(*exprs),
+            alias_output_names=combine_alias_output_names(*exprs),
+            version=context._version,
+        )
+
     def _with_alias_output_names(self, func: AliasNames | None, /) -> Self:
         return self.__class__(
             self._call,
+            self._window_function,
             evaluate_output_names=self._evaluate_output_names,
             alias_output_names=func,
             version=self._version,
@@ -215,6 +680,12 @@ class DataFusionExpr(LazyExpr["DataFusionLazyFrame", "datafusion.Expr"]):
     def abs(self) -> Self:
         return self._with_elementwise(lambda _input: _input.abs())
     
+    def count(self) -> Self:
+        return self._with_callable(lambda _input: datafusion.functions.count(_input))
+
+    def len(self) -> Self:
+        return self._with_callable(lambda _input: datafusion.functions.count_star())
+
     def cast(self, dtype: IntoDType) -> Self:
         native_dtype = narwhals_to_native_dtype(dtype, self._version)
         return self._with_elementwise(lambda _input: _input.cast(native_dtype))
@@ -251,11 +722,208 @@ class DataFusionExpr(LazyExpr["DataFusionLazyFrame", "datafusion.Expr"]):
         return self._with_callable(lambda _input: datafusion.functions.mean(_input))
 
     def median(self) -> Self:
-        return self._with_callable(lambda _input: datafusion.functions.median(_input))
+        # DataFusion truncates the median of integers.
+        def func(_input: datafusion.Expr) -> datafusion.Expr:
+            if approximate_aggregations():
+                return datafusion.functions.approx_median(_input.cast(pa.float64()))
+            return datafusion.functions.median(_input.cast(pa.float64()))
+
+        return self._with_callable(func)
 
     def min(self) -> Self:
         return self._with_callable(lambda _input: datafusion.functions.min(_input))
 
+    def n_unique(self) -> Self:
+        def func(_input: datafusion.Expr) -> datafusion.Expr:
+            if approximate_aggregations():
+                # HyperLogLog; unlike below, nulls aren't counted.
+                return cast_aggregate(datafusion.functions.approx_distinct(_input), pa.int64())
+            # `count(distinct ...)` ignores nulls, but narwhals counts null as a
+            # value. Wrapping the input in a struct keeps this a single native
+            # aggregate, which is what `DataFrame.aggregate` requires.
+            return datafusion.functions.count(
+                datafusion.functions.struct(_input), distinct=True
+            )
+
+        def window_f(
+            df: DataFusionLazyFrame, inputs: WindowInputs[datafusion.Expr]
+        ) -> list[datafusion.Expr]:
+            if approximate_aggregations():
+                return [
+                    self._window_expression(func(native), inputs.partition_by)
+                    for native in self._call(df)
+                ]
+            # `OVER` drops the `DISTINCT` of an aggregate, so count the distinct
+            # values (null included) of the partition's values instead.
+            return [
+                datafusion.functions.cardinality(
+                    datafusion.functions.array_distinct(
+                        self._window_expression(
+                            datafusion.functions.array_agg(native), inputs.partition_by
+                        )
+                    )
+                ).cast(pa.int64())
+                for native in self._call(df)
+            ]
+
+        return self._with_callable(func, window_f)
+
+    def std(self, *, ddof: int) -> Self:
+        if ddof == 0:
+            return self._with_callable(lambda _input: datafusion.functions.stddev_pop(_input))
+        if ddof == 1:
+            return self._with_callable(lambda _input: datafusion.functions.stddev_samp(_input))
+        msg = f"`std` with `ddof={ddof}` is not supported for DataFusion, only 0 or 1."
+        raise NotImplementedError(msg)
+
+    def var(self, *, ddof: int) -> Self:
+        if ddof == 0:
+            return self._with_callable(lambda _input: datafusion.functions.var_pop(_input))
+        if ddof == 1:
+            return self._with_callable(lambda _input: datafusion.functions.var_samp(_input))
+        msg = f"`var` with `ddof={ddof}` is not supported for DataFusion, only 0 or 1."
+        raise NotImplementedError(msg)
+
+    def quantile(
+        self, quantile: float, interpolation: RollingInterpolationMethod
+    ) -> Self:
+        def func(_input: datafusion.Expr) -> datafusion.Expr:
+            if approximate_aggregations():
+                # A t-digest, which approximates linear interpolation.
+                return datafusion.functions.approx_percentile_cont(
+                    _input.cast(pa.float64()), quantile
+                )
+            return _quantile_udaf(quantile, interpolation)(_input.cast(pa.float64()))
+
+        return self._with_callable(func)
+
+    def skew(self) -> Self:
+        return self._with_callable(
+            lambda _input: _moments_udaf("skew")(_input.cast(pa.float64()))
+        )
+
+    def kurtosis(self) -> Self:
+        return self._with_callable(
+            lambda _input: _moments_udaf("kurtosis")(_input.cast(pa.float64()))
+        )
+
+    def mode(self, *, keep: ModeKeepStrategy) -> Self:
+        if keep != "any":
+            msg = (
+                f"`Expr.mode(keep='{keep}')` is not implemented for DataFusion.\n\n"
+                "Hint: Use `nw.col(...).mode(keep='any')` instead."
+            )
+            raise NotImplementedError(msg)
+
+        def func(df: DataFusionLazyFrame) -> list[datafusion.Expr]:
+            exprs = self._call(df)
+            dtypes = df.native.select(*exprs).schema().types
+            return [_mode_udaf(dtype)(expr) for expr, dtype in zip(exprs, dtypes)]
+
+        return self.__class__(
+            func,
+            evaluate_output_names=self._evaluate_output_names,
+            alias_output_names=self._alias_output_names,
+            version=self._version,
+        )
+
+    def map_batches(
+        self,
+        function: Callable[[ArrowSeries], Any],
+        return_dtype: IntoDType | None,
+        *,
+        returns_scalar: bool,
+    ) -> Self:
+        """Call `function` on the values of each record batch, as an `ArrowSeries`.
+
+        Without `returns_scalar`, `function` must be elementwise: it's called
+        on every batch as DataFusion produces it, concurrently across
+        partitions, and must return one value per row. With `returns_scalar`,
+        it's called once per group on all of its values. The return type is
+        inferred by calling `function` on an empty series unless given.
+        """
+        return_type = (
+            None
+            if return_dtype is None
+            else narwhals_to_native_dtype(return_dtype, self._version)
+        )
+        make_udf = _map_batches_udaf if returns_scalar else _map_batches_udf
+
+        def with_udfs(
+            df: DataFusionLazyFrame, exprs: Sequence[datafusion.Expr]
+        ) -> list[datafusion.Expr]:
+            dtypes = df.native.select(*exprs).schema().types
+            return [
+                make_udf(
+                    function,
+                    dtype,
+                    return_type
+                    or _map_batches_return_type(function, dtype, name, self._version),
+                    name,
+                    self._version,
+                )(expr)
+                for expr, dtype, name in zip(exprs, dtypes, self._evaluate_aliases(df))
+            ]
+
+        def func(df: DataFusionLazyFrame) -> list[datafusion.Expr]:
+            return with_udfs(df, self._call(df))
+
+        def window_f(
+            df: DataFusionLazyFrame, inputs: WindowInputs[datafusion.Expr]
+        ) -> list[datafusion.Expr]:
+            if not returns_scalar:
+                return with_udfs(df, self.window_function(df, inputs))
+            # The group's values are passed in no particular order either way.
+            return [
+                self._window_expression(expr, inputs.partition_by)
+                for expr in with_udfs(df, self._call(df))
+            ]
+
+        return self.__class__(
+            func,
+            window_f,
+            evaluate_output_names=self._evaluate_output_names,
+            alias_output_names=self._alias_output_names,
+            version=self._version,
+        )
+
+    def replace_strict(
+        self,
+        old: Sequence[Any] | Mapping[Any, Any],
+        new: Sequence[Any],
+        *,
+        return_dtype: IntoDType | None,
+    ) -> Self:
+        # A hash lookup on each batch, rather than a `CASE` with a branch per value.
+        new_ = (
+            pa.array(new)
+            if return_dtype is None
+            else pa.array(new, narwhals_to_native_dtype(return_dtype, self._version))
+        )
+
+        def call(expr: datafusion.Expr, dtype: pa.DataType) -> datafusion.Expr:
+            return _replace_strict_udf(dtype, pa.array(old, dtype), new_)(expr)
+
+        def func(df: DataFusionLazyFrame) -> list[datafusion.Expr]:
+            exprs = self._call(df)
+            dtypes = df.native.select(*exprs).schema().types
+            return [call(expr, dtype) for expr, dtype in zip(exprs, dtypes)]
+
+        def window_f(
+            df: DataFusionLazyFrame, inputs: WindowInputs[datafusion.Expr]
+        ) -> list[datafusion.Expr]:
+            exprs = self.window_function(df, inputs)
+            dtypes = df.native.select(*exprs).schema().types
+            return [call(expr, dtype) for expr, dtype in zip(exprs, dtypes)]
+
+        return self.__class__(
+            func,
+            window_f,
+            evaluate_output_names=self._evaluate_output_names,
+            alias_output_names=self._alias_output_names,
+            version=self._version,
+        )
+
     def sqrt(self) -> Self:
         return self._with_elementwise(lambda _input: _input.sqrt())
 
@@ -263,44 +931,270 @@ class DataFusionExpr(LazyExpr["DataFusionLazyFrame", "datafusion.Expr"]):
         return self._with_callable(lambda _input: datafusion.functions.sum(_input))
 
     def broadcast(self, kind: Literal[ExprKind.AGGREGATION, ExprKind.LITERAL]) -> Self:
-        # datafusion does its own broadcasting.
-        return self
-
-    cum_count = not_implemented()
-    cum_max = not_implemented()
-    cum_min = not_implemented()
-    cum_prod = not_implemented()
-    cum_sum = not_implemented()
-    diff = not_implemented()
+        if kind is ExprKind.LITERAL:
+            return self
+        # An aggregate next to columns becomes a window over the whole frame.
+        return self.over([], [])
+
+    def over(self, partition_by: Sequence[str | datafusion.Expr], order_by: Sequence[str]) -> Self:
+        def func(df: DataFusionLazyFrame) -> Sequence[datafusion.Expr]:
+            return self.window_function(df, WindowInputs(partition_by, order_by))
+
+        return self.__class__(
+            func,
+            evaluate_output_names=self._evaluate_output_names,
+            alias_output_names=self._alias_output_names,
+            version=self._version,
+        )
+
+    def _cum_window_func(
+        self,
+        func: Callable[[datafusion.Expr], datafusion.Expr],
+        *,
+        reverse: bool,
+        skip_nulls: bool = True,
+    ) -> WindowFunction[DataFusionLazyFrame, datafusion.Expr]:
+        def window_f(
+            df: DataFusionLazyFrame, inputs: WindowInputs[datafusion.Expr]
+        ) -> list[datafusion.Expr]:
+            flags = extend_bool(reverse, len(inputs.order_by))
+            results = []
+            for expr in self._call(df):
+                result = self._window_expression(
+                    func(expr),
+                    inputs.partition_by,
+                    inputs.order_by,
+                    descending=flags,
+                    nulls_last=flags,
+                    rows_end=0,
+                )
+                if skip_nulls:
+                    result = datafusion.functions.when(expr.is_not_null(), result).end()
+                results.append(result)
+            return results
+
+        return window_f
+
+    def cum_count(self, *, reverse: bool) -> Self:
+        return self._with_window_function(
+            self._cum_window_func(datafusion.functions.count, reverse=reverse, skip_nulls=False)
+        )
+
+    def cum_max(self, *, reverse: bool) -> Self:
+        return self._with_window_function(
+            self._cum_window_func(datafusion.functions.max, reverse=reverse)
+        )
+
+    def cum_min(self, *, reverse: bool) -> Self:
+        return self._with_window_function(
+            self._cum_window_func(datafusion.functions.min, reverse=reverse)
+        )
+
+    def cum_sum(self, *, reverse: bool) -> Self:
+        return self._with_window_function(
+            self._cum_window_func(datafusion.functions.sum, reverse=reverse)
+        )
+
+    def cum_prod(self, *, reverse: bool) -> Self:
+        def window_f(
+            df: DataFusionLazyFrame, inputs: WindowInputs[datafusion.Expr]
+        ) -> list[datafusion.Expr]:
+            flags = extend_bool(reverse, len(inputs.order_by))
+            exprs = self._call(df)
+            dtypes = df.native.select(*exprs).schema().types
+            return [
+                datafusion.functions.when(
+                    expr.is_not_null(),
+                    self._window_expression(
+                        _cum_prod_udwf(dtype)(expr),
+                        inputs.partition_by,
+                        inputs.order_by,
+                        descending=flags,
+                        nulls_last=flags,
+                    ),
+                ).end()
+                for expr, dtype in zip(exprs, dtypes)
+            ]
+
+        return self._with_window_function(window_f)
+
+    def _rolling_window_func(
+        self,
+        func: Callable[[datafusion.Expr], datafusion.Expr],
+        window_size: int,
+        min_samples: int,
+        *,
+        center: bool,
+    ) -> WindowFunction[DataFusionLazyFrame, datafusion.Expr]:
+        if center:
+            half = (window_size - 1) // 2
+            remainder = (window_size - 1) % 2
+            start = -(half + remainder)
+            end = half
+        else:
+            start = -(window_size - 1)
+            end = 0
+
+        def window_f(
+            df: DataFusionLazyFrame, inputs: WindowInputs[datafusion.Expr]
+        ) -> list[datafusion.Expr]:
+            window_kwargs: Any = {
+                "partition_by": inputs.partition_by,
+                "order_by": inputs.order_by,
+                "rows_start": start,
+                "rows_end": end,
+            }
+            return [
+                datafusion.functions.when(
+                    self._window_expression(datafusion.functions.count(expr), **window_kwargs)
+                    >= datafusion.lit(min_samples),
+                    self._window_expression(func(expr), **window_kwargs),
+                ).end()
+                for expr in self._call(df)
+            ]
+
+        return window_f
+
+    def rolling_sum(self, window_size: int, *, min_samples: int, center: bool) -> Self:
+        return self._with_window_function(
+            self._rolling_window_func(
+                datafusion.functions.sum, window_size, min_samples, center=center
+            )
+        )
+
+    def rolling_mean(self, window_size: int, *, min_samples: int, center: bool) -> Self:
+        return self._with_window_function(
+            self._rolling_window_func(
+                datafusion.functions.mean, window_size, min_samples, center=center
+            )
+        )
+
+    def rolling_min(self, window_size: int, *, min_samples: int, center: bool) -> Self:
+        return self._with_window_function(
+            self._rolling_window_func(
+                datafusion.functions.min, window_size, min_samples, center=center
+            )
+        )
+
+    def rolling_max(self, window_size: int, *, min_samples: int, center: bool) -> Self:
+        return self._with_window_function(
+            self._rolling_window_func(
+                datafusion.functions.max, window_size, min_samples, center=center
+            )
+        )
+
+    def rolling_std(
+        self, window_size: int, *, min_samples: int, center: bool, ddof: int
+    ) -> Self:
+        if ddof not in {0, 1}:
+            msg = f"`rolling_std` with `ddof={ddof}` is not supported for DataFusion, only 0 or 1."
+            raise NotImplementedError(msg)
+        func = datafusion.functions.stddev_pop if ddof == 0 else datafusion.functions.stddev_samp
+        return self._with_window_function(
+            self._rolling_window_func(func, window_size, min_samples, center=center)
+        )
+
+    def rolling_var(
+        self, window_size: int, *, min_samples: int, center: bool, ddof: int
+    ) -> Self:
+        if ddof not in {0, 1}:
+            msg = f"`rolling_var` with `ddof={ddof}` is not supported for DataFusion, only 0 or 1."
+            raise NotImplementedError(msg)
+        func = datafusion.functions.var_pop if ddof == 0 else datafusion.functions.var_samp
+        return self._with_window_function(
+            self._rolling_window_func(func, window_size, min_samples, center=center)
+        )
+
+    def shift(self, n: int) -> Self:
+        def window_f(
+            df: DataFusionLazyFrame, inputs: WindowInputs[datafusion.Expr]
+        ) -> list[datafusion.Expr]:
+            shift = (
+                datafusion.functions.lag
+                if n >= 0
+                else datafusion.functions.lead
+            )
+            return [
+                self._window_expression(
+                    shift(expr, abs(n)), inputs.partition_by, inputs.order_by
+                )
+                for expr in self._call(df)
+            ]
+
+        return self._with_window_function(window_f)
+
+    def diff(self) -> Self:
+        def window_f(
+            df: DataFusionLazyFrame, inputs: WindowInputs[datafusion.Expr]
+        ) -> list[datafusion.Expr]:
+            return [
+                expr
+                - self._window_expression(
+                    datafusion.functions.lag(expr), inputs.partition_by, inputs.order_by
+                )
+                for expr in self._call(df)
+            ]
+
+        return self._with_window_function(window_f)
+
+    def rank(self, method: RankMethod, *, descending: bool) -> Self:
+        F = datafusion.functions
+        if method in {"min", "max", "average"}:
+            func = F.rank()
+        elif method == "dense":
+            func = F.dense_rank()
+        else:  # method == "ordinal"
+            func = F.row_number()
+
+        def _rank(
+            expr: datafusion.Expr, partition_by: Sequence[str | datafusion.Expr] = ()
+        ) -> datafusion.Expr:
+            rank_expr = self._window_expression(
+                func, partition_by, (expr,), descending=[descending], nulls_last=[True]
+            )
+            if method in {"max", "average"}:
+                # Number of ties of the current value, minus one.
+                ties = self._window_expression(
+                    F.count_star(), (*partition_by, expr)
+                ) - datafusion.lit(1)
+                rank_expr = (
+                    # `rank()` is unsigned, which would promote the sum to a decimal.
+                    rank_expr.cast(pa.int64()) + ties
+                    if method == "max"
+                    else rank_expr + ties / datafusion.lit(2.0)
+                )
+            return F.when(expr.is_not_null(), rank_expr).end()
+
+        def window_f(
+            df: DataFusionLazyFrame, inputs: WindowInputs[datafusion.Expr]
+        ) -> list[datafusion.Expr]:
+            if inputs.order_by:
+                msg = "`rank` followed by `over` with `order_by` specified is not supported for DataFusion."
+                raise NotImplementedError(msg)
+            return [_rank(expr, inputs.partition_by) for expr in self._call(df)]
+
+        return self._with_callable(_rank, window_f)
+
     drop_nulls = not_implemented()
     ewm_mean = not_implemented()
     is_first_distinct = not_implemented()
     is_last_distinct = not_implemented()
     is_unique = not_implemented()
-    kurtosis = not_implemented()
-    rank = not_implemented()
-    map_batches = not_implemented()
-    mode = not_implemented()
-    over = not_implemented()
-    quantile = not_implemented()
-    replace_strict = not_implemented()
-    rolling_max = not_implemented()
-    rolling_mean = not_implemented()
-    rolling_min = not_implemented()
-    rolling_sum = not_implemented()
-    rolling_std = not_implemented()
-    rolling_var = not_implemented()
     round = not_implemented()
-    shift = not_implemented()
-    skew = not_implemented()
     unique = not_implemented()
     first = not_implemented()
     last = not_implemented()
 
 
     # namespaces
-    str = not_implemented() # pyright: ignore[reportAssignmentType]
-    dt = not_implemented()  # pyright: ignore[reportAssignmentType]
+    @property
+    def str(self) -> DataFusionExprStringNamespace:
+        return DataFusionExprStringNamespace(self)
+
+    @property
+    def dt(self) -> DataFusionExprDateTimeNamespace:
+        return DataFusionExprDateTimeNamespace(self)
+
     cat = not_implemented()  # pyright: ignore[reportAssignmentType]
     list = not_implemented()  # pyright: ignore[reportAssignmentType]
     struct = not_implemented()  # pyright: ignore[reportAssignmentType]
\ No newline at end of file
@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+import datafusion
+import datafusion.functions as F
+import pyarrow as pa
+from narwhals._compliant import LazyExprNamespace
+from narwhals._compliant.any_namespace import DateTimeNamespace
+from narwhals._constants import (
+    MS_PER_SECOND,
+    NS_PER_MICROSECOND,
+    NS_PER_MILLISECOND,
+    NS_PER_MINUTE,
+    NS_PER_SECOND,
+    US_PER_SECOND,
+)
+from narwhals._duration import Interval
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from narwhals._compliant.window import WindowInputs
+    from narwhals._duration import IntervalUnit
+    from narwhals.typing import TimeUnit
+
+    from narwhals_datafusion.dataframe import DataFusionLazyFrame
+    from narwhals_datafusion.expr import DataFusionExpr
+
+CALENDAR_UNITS: dict[IntervalUnit, str] = {"mo": "month", "q": "quarter", "y": "year"}
+NS_PER_UNIT: dict[IntervalUnit, int] = {
+    "ns": 1,
+    "us": NS_PER_MICROSECOND,
+    "ms": NS_PER_MILLISECOND,
+    "s": NS_PER_SECOND,
+    "m": NS_PER_MINUTE,
+    "h": 60 * NS_PER_MINUTE,
+}
+MONTHS_PER_UNIT: dict[IntervalUnit, int] = {"mo": 1, "q": 3, "y": 12}
+EPOCH = pa.scalar(0, pa.timestamp("ns"))
+
+
+def _interval(interval: Interval) -> datafusion.Expr:
+    multiple, unit = interval.multiple, interval.unit
+    value = (
+        (multiple * MONTHS_PER_UNIT[unit], 0, 0)
+        if unit in MONTHS_PER_UNIT
+        else (0, multiple, 0)
+        if unit == "d"
+        else (0, 0, multiple * NS_PER_UNIT[unit])
+    )
+    return datafusion.lit(pa.scalar(value, pa.month_day_nano_interval()))
+
+
+def _local_timestamp(values: pa.Array) -> pa.Array:
+    import pyarrow.compute as pc
+
+    return pc.local_timestamp(values)
+
+
+@lru_cache(maxsize=None)
+def _local_timestamp_udf(dtype: pa.TimestampType) -> datafusion.ScalarUDF:
+    # DataFusion's `to_local_time` isn't exposed in Python, and casting to a
+    # naive timestamp keeps the UTC value rather than the wall time.
+    return datafusion.udf(
+        _local_timestamp,
+        [dtype],
+        pa.timestamp(dtype.unit),
+        "immutable",
+        name="to_local_time",
+    )
+
+
+def _strftime(values: pa.Array, format: pa.Array) -> pa.Array:
+    import pyarrow.compute as pc
+
+    if not len(format):
+        return pa.array([], pa.string())
+    return pc.strftime(values, format[0].as_py())
+
+
+@lru_cache(maxsize=None)
+def _strftime_udf(dtype: pa.DataType) -> datafusion.ScalarUDF:
+    # `to_char` isn't exposed in Python.
+    return datafusion.udf(
+        _strftime, [dtype, pa.string()], pa.string(), "immutable", name="to_char"
+    )
+
+
+class DataFusionExprDateTimeNamespace(
+    LazyExprNamespace["DataFusionExpr"], DateTimeNamespace["DataFusionExpr"]
+):
+    def _date_part(self, part: str) -> DataFusionExpr:
+        return self.compliant._with_elementwise(
+            lambda expr: F.date_part(datafusion.lit(part), expr)
+        )
+
+    def _with_native_dtype(
+        self, call: Callable[[datafusion.Expr, pa.DataType], datafusion.Expr]
+    ) -> DataFusionExpr:
+        # For operations whose result depends on the input's unit or time zone.
+        compliant = self.compliant
+
+        def func(df: DataFusionLazyFrame) -> list[datafusion.Expr]:
+            exprs = compliant._call(df)
+            dtypes = df.native.select(*exprs).schema().types
+            return [call(expr, dtype) for expr, dtype in zip(exprs, dtypes)]
+
+        def window_f(
+            df: DataFusionLazyFrame, inputs: WindowInputs[datafusion.Expr]
+        ) -> list[datafusion.Expr]:
+            exprs = compliant.window_function(df, inputs)
+            dtypes = df.native.select(*exprs).schema().types
+            return [call(expr, dtype) for expr, dtype in zip(exprs, dtypes)]
+
+        return compliant.__class__(
+            func,
+            window_f,
+            evaluate_output_names=compliant._evaluate_output_names,
+            alias_output_names=compliant._alias_output_names,
+            version=compliant._version,
+        )
+
+    def year(self) -> DataFusionExpr:
+        return self._date_part("year")
+
+    def month(self) -> DataFusionExpr:
+        return self._date_part("month")
+
+    def day(self) -> DataFusionExpr:
+        return self._date_part("day")
+
+    def hour(self) -> DataFusionExpr:
+        return self._date_part("hour")
+
+    def minute(self) -> DataFusionExpr:
+        return self._date_part("minute")
+
+    def second(self) -> DataFusionExpr:
+        return self._date_part("second")
+
+    def _subsecond(self, part: str, per_second: int) -> DataFusionExpr:
+        # DataFusion's sub-second parts include the seconds.
+        return self.compliant._with_elementwise(
+            lambda expr: F.date_part(datafusion.lit(part), expr)
+            - F.date_part(datafusion.lit("second"), expr) * datafusion.lit(per_second)
+        )
+
+    def millisecond(self) -> DataFusionExpr:
+        return self._subsecond("millisecond", MS_PER_SECOND)
+
+    def microsecond(self) -> DataFusionExpr:
+        return self._subsecond("microsecond", US_PER_SECOND)
+
+    def nanosecond(self) -> DataFusionExpr:
+        # There's no `nanosecond` part, so take it from the epoch instead.
+        ns_per_second = datafusion.lit(NS_PER_SECOND)
+
+        def func(expr: datafusion.Expr) -> datafusion.Expr:
+            epoch_ns = expr.cast(pa.timestamp("ns")).cast(pa.int64())
+            return (epoch_ns % ns_per_second + ns_per_second) % ns_per_second
+
+        return self.compliant._with_elementwise(func)
+
+    def ordinal_day(self) -> DataFusionExpr:
+        return self._date_part("doy")
+
+    def weekday(self) -> DataFusionExpr:
+        # DataFusion's `isodow` starts from Monday = 0.
+        return self.compliant._with_elementwise(
+            lambda expr: F.date_part(datafusion.lit("isodow"), expr) + datafusion.lit(1)
+        )
+
+    def date(self) -> DataFusionExpr:
+        return self.compliant._with_elementwise(lambda expr: expr.cast(pa.date32()))
+
+    def timestamp(self, time_unit: TimeUnit) -> DataFusionExpr:
+        def func(expr: datafusion.Expr, dtype: pa.DataType) -> datafusion.Expr:
+            # Casting drops the time zone but keeps the UTC value.
+            if not pa.types.is_timestamp(dtype) or dtype.unit == time_unit:
+                return expr.cast(pa.timestamp(time_unit)).cast(pa.int64())
+            value = expr.cast(pa.timestamp(dtype.unit)).cast(pa.int64())
+            if NS_PER_UNIT[time_unit] < NS_PER_UNIT[dtype.unit]:
+                return value * datafusion.lit(NS_PER_UNIT[dtype.unit] // NS_PER_UNIT[time_unit])
+            # A cast to a coarser unit truncates pre-epoch values towards zero,
+            # polars floors them.
+            factor = datafusion.lit(NS_PER_UNIT[time_unit] // NS_PER_UNIT[dtype.unit])
+            return (value - (value % factor + factor) % factor) / factor
+
+        return self._with_native_dtype(func)
+
+    def _total(self, ns_per_unit: int) -> DataFusionExpr:
+        return self.compliant._with_elementwise(
+            lambda expr: expr.cast(pa.duration("ns")).cast(pa.int64())
+            / datafusion.lit(ns_per_unit)
+        )
+
+    def total_minutes(self) -> DataFusionExpr:
+        return self._total(NS_PER_MINUTE)
+
+    def total_seconds(self) -> DataFusionExpr:
+        return self._total(NS_PER_SECOND)
+
+    def total_milliseconds(self) -> DataFusionExpr:
+        return self._total(NS_PER_MILLISECOND)
+
+    def total_microseconds(self) -> DataFusionExpr:
+        return self._total(NS_PER_MICROSECOND)
+
+    def total_nanoseconds(self) -> DataFusionExpr:
+        return self._total(1)
+
+    def to_string(self, format: str) -> DataFusionExpr:
+        return self._with_native_dtype(
+            lambda expr, dtype: _strftime_udf(dtype)(expr, datafusion.lit(format))
+        )
+
+    def truncate(self, every: str) -> DataFusionExpr:
+        interval = Interval.parse(every)
+        multiple, unit = interval.multiple, interval.unit
+
+        def func(expr: datafusion.Expr, dtype: pa.DataType) -> datafusion.Expr:
+            # Like polars, truncate the wall time of time zone aware timestamps.
+            if pa.types.is_timestamp(dtype) and dtype.tz:
+                expr = _local_timestamp_udf(dtype)(expr)
+            if unit not in CALENDAR_UNITS:
+                # `date_trunc` rounds sub-second parts of pre-epoch timestamps up.
+                truncated = F.date_bin(_interval(interval), expr, datafusion.lit(EPOCH))
+            elif multiple == 1:
+                truncated = F.date_trunc(datafusion.lit(CALENDAR_UNITS[unit]), expr)
+            else:
+                # The allowed multiples divide a year, so bins never straddle one.
+                months = multiple * MONTHS_PER_UNIT[unit]
+                start = F.date_trunc(datafusion.lit("month"), expr)
+                offset = (F.date_part(datafusion.lit("month"), expr) - 1) % months
+                result = F.when(offset == 0, start)
+                for n in range(1, months):
+                    result = result.when(offset == n, start - _interval(Interval(n, "mo")))
+                truncated = result.end()
+            # Both functions return nanoseconds, even for dates.
+            return truncated.cast(dtype)
+
+        return self._with_native_dtype(func)
+
+    def offset_by(self, by: str) -> DataFusionExpr:
+        interval = _interval(Interval.parse_no_constraints(by))
+        return self.compliant._with_elementwise(lambda expr: expr + interval)
+
+    def convert_time_zone(self, time_zone: str) -> DataFusionExpr:
+        def func(expr: datafusion.Expr, dtype: pa.DataType) -> datafusion.Expr:
+            unit = dtype.unit
+            # Naive timestamps are taken to be in UTC.
+            utc = expr if dtype.tz else expr.cast(pa.timestamp(unit, "UTC"))
+            return utc.cast(pa.timestamp(unit, time_zone))
+
+        return self._with_native_dtype(func)
+
+    def replace_time_zone(self, time_zone: str | None) -> DataFusionExpr:
+        def func(expr: datafusion.Expr, dtype: pa.DataType) -> datafusion.Expr:
+            # Casting a naive timestamp to a time zone keeps its wall time.
+            local = _local_timestamp_udf(dtype)(expr) if dtype.tz else expr
+            return local.cast(pa.timestamp(dtype.unit, time_zone))
+
+        return self._with_native_dtype(func)
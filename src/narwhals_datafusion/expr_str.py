@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+import datafusion
+import datafusion.functions as F
+import pyarrow as pa
+from narwhals._compliant import LazyExprNamespace
+from narwhals._compliant.any_namespace import StringNamespace
+
+if TYPE_CHECKING:
+    from narwhals_datafusion.expr import DataFusionExpr
+
+
+def _split(values: pa.Array, by: pa.Array) -> pa.Array:
+    import pyarrow.compute as pc
+
+    if not len(by):
+        return pa.array([], pa.list_(pa.string()))
+    return pc.split_pattern(values, by[0].as_py())
+
+
+@lru_cache(maxsize=None)
+def _split_udf() -> datafusion.ScalarUDF:
+    # DataFusion's `string_to_array` isn't exposed in Python. The separator is
+    # passed as a literal argument so that it shows up in the plan.
+    return datafusion.udf(
+        _split,
+        [pa.string(), pa.string()],
+        pa.list_(pa.string()),
+        "immutable",
+        name="str_split",
+    )
+
+
+def _strip_pattern(characters: str | None) -> str:
+    chars = r"\s" if characters is None else re.sub(r"([\\\]\[^-])", r"\\\1", characters)
+    return f"^[{chars}]+|[{chars}]+$"
+
+
+class DataFusionExprStringNamespace(
+    LazyExprNamespace["DataFusionExpr"], StringNamespace["DataFusionExpr"]
+):
+    def contains(self, pattern: str, *, literal: bool) -> DataFusionExpr:
+        def func(expr: datafusion.Expr) -> datafusion.Expr:
+            if literal:
+                return F.strpos(expr, datafusion.lit(pattern)) > datafusion.lit(0)
+            return F.regexp_like(expr, datafusion.lit(pattern))
+
+        return self.compliant._with_elementwise(func)
+
+    def starts_with(self, prefix: str) -> DataFusionExpr:
+        # Simplified to `LIKE 'prefix%'`, which Parquet row groups can be pruned on.
+        return self.compliant._with_elementwise(
+            lambda expr: F.starts_with(expr, datafusion.lit(prefix))
+        )
+
+    def ends_with(self, suffix: str) -> DataFusionExpr:
+        return self.compliant._with_elementwise(
+            lambda expr: F.ends_with(expr, datafusion.lit(suffix))
+        )
+
+    def len_chars(self) -> DataFusionExpr:
+        return self.compliant._with_elementwise(F.character_length)
+
+    def replace(
+        self, pattern: str, value: str | DataFusionExpr, *, literal: bool, n: int
+    ) -> DataFusionExpr:
+        if n == -1:
+            return self.replace_all(pattern, value, literal=literal)
+        if n != 1:
+            msg = f"`replace` with `n={n}` is not supported for DataFusion, only `n=1` and `n=-1`."
+            raise NotImplementedError(msg)
+        if literal:
+            pattern = re.escape(pattern)
+
+        def func(expr: datafusion.Expr, value: datafusion.Expr) -> datafusion.Expr:
+            if literal:
+                # Otherwise `$1` or `$name` in the value refer to groups. This
+                # is constant folded for string values.
+                value = F.replace(value, datafusion.lit("$"), datafusion.lit("$$"))
+            return F.regexp_replace(expr, datafusion.lit(pattern), value)
+
+        return self.compliant._with_elementwise(func, value=value)
+
+    def replace_all(
+        self, pattern: str, value: str | DataFusionExpr, *, literal: bool
+    ) -> DataFusionExpr:
+        def func(expr: datafusion.Expr, value: datafusion.Expr) -> datafusion.Expr:
+            if literal:
+                return F.replace(expr, datafusion.lit(pattern), value)
+            return F.regexp_replace(
+                expr, datafusion.lit(pattern), value, datafusion.lit("g")
+            )
+
+        return self.compliant._with_elementwise(func, value=value)
+
+    def strip_chars(self, characters: str | None) -> DataFusionExpr:
+        pattern = _strip_pattern(characters)
+        return self.compliant._with_elementwise(
+            lambda expr: F.regexp_replace(
+                expr, datafusion.lit(pattern), datafusion.lit(""), datafusion.lit("g")
+            )
+        )
+
+    def slice(self, offset: int, length: int | None) -> DataFusionExpr:
+        def func(expr: datafusion.Expr) -> datafusion.Expr:
+            start = (
+                F.character_length(expr) + datafusion.lit(offset + 1)
+                if offset < 0
+                else datafusion.lit(offset + 1)
+            )
+            if length is None:
+                return F.substr(expr, start)
+            return F.substring(expr, start, datafusion.lit(length))
+
+        return self.compliant._with_elementwise(func)
+
+    def split(self, by: str) -> DataFusionExpr:
+        return self.compliant._with_elementwise(
+            lambda expr: _split_udf()(expr.cast(pa.string()), datafusion.lit(by))
+        )
+
+    def to_datetime(self, format: str | None) -> DataFusionExpr:
+        # DataFusion parses with chrono, whose specifiers match `strftime`'s.
+        # Without a format, RFC 3339 and `YYYY-MM-DD hh:mm:ss` strings are inferred.
+        formats = () if format is None else (datafusion.lit(format),)
+        return self.compliant._with_elementwise(
+            lambda expr: F.to_timestamp_micros(expr, *formats)
+        )
+
+    def to_date(self, format: str | None) -> DataFusionExpr:
+        if format is not None:
+            return self.to_datetime(format).dt.date()
+        return self.compliant.cast(self.compliant._version.dtypes.Date())
+
+    def to_lowercase(self) -> DataFusionExpr:
+        return self.compliant._with_elementwise(F.lower)
+
+    def to_uppercase(self) -> DataFusionExpr:
+        return self.compliant._with_elementwise(F.upper)
+
+    def to_titlecase(self) -> DataFusionExpr:
+        return self.compliant._with_elementwise(F.initcap)
+
+    def zfill(self, width: int) -> DataFusionExpr:
+        def func(expr: datafusion.Expr) -> datafusion.Expr:
+            zero, width_ = datafusion.lit("0"), datafusion.lit(width)
+            sign = F.left(expr, datafusion.lit(1))
+            unsigned = F.substr(expr, datafusion.lit(2))
+            padded_sign = F.concat(sign, F.lpad(unsigned, datafusion.lit(width - 1), zero))
+            return (
+                F.when(F.character_length(expr) >= width_, expr)
+                .when(F.in_list(sign, [datafusion.lit("-"), datafusion.lit("+")]), padded_sign)
+                .otherwise(F.lpad(expr, width_, zero))
+            )
+
+        return self.compliant._with_elementwise(func)
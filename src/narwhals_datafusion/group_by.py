@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from narwhals._compliant.group_by import CompliantGroupBy, ParseKeysGroupBy
+from narwhals._utils import zip_strict
+from narwhals_datafusion.utils import TranslationTimer, aggregate, col
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    import datafusion
+
+    from narwhals_datafusion.dataframe import DataFusionLazyFrame
+    from narwhals_datafusion.expr import DataFusionExpr
+
+
+class DataFusionGroupBy(
+    ParseKeysGroupBy["DataFusionLazyFrame", "DataFusionExpr"],
+    CompliantGroupBy["DataFusionLazyFrame", "DataFusionExpr"],
+):
+    _keys: list[str]
+    _output_key_names: list[str]
+
+    def __init__(
+        self,
+        df: DataFusionLazyFrame,
+        keys: Sequence[DataFusionExpr] | Sequence[str],
+        /,
+        *,
+        drop_null_keys: bool,
+    ) -> None:
+        frame, self._keys, self._output_key_names = self._parse_keys(df, keys=keys)
+        if drop_null_keys:
+            frame = frame._with_native(
+                frame.native.filter(*(col(key).is_not_null() for key in self._keys))
+            )
+        self._compliant_frame = frame
+
+    def _evaluate_expr(self, expr: DataFusionExpr, /) -> Iterator[datafusion.Expr]:
+        output_names = expr._evaluate_output_names(self.compliant)
+        aliases = (
+            expr._alias_output_names(output_names)
+            if expr._alias_output_names
+            else output_names
+        )
+        native_exprs = expr(self.compliant)
+        if expr._metadata is not None and expr._metadata.expansion_kind.is_multi_unnamed():
+            # e.g. `group_by('a').agg(nw.all().sum())` must not aggregate the key `'a'`.
+            exclude = {*self._keys, *self._output_key_names}
+            for native_expr, name, alias in zip_strict(native_exprs, output_names, aliases):
+                if name not in exclude:
+                    yield expr._alias_native(native_expr, alias)
+        else:
+            for native_expr, alias in zip_strict(native_exprs, aliases):
+                yield expr._alias_native(native_expr, alias)
+
+    def _evaluate_exprs(self, exprs: Iterable[DataFusionExpr], /) -> Iterator[datafusion.Expr]:
+        for expr in exprs:
+            yield from self._evaluate_expr(expr)
+
+    def agg(self, *exprs: DataFusionExpr) -> DataFusionLazyFrame:
+        # A single native aggregate lets DataFusion plan a (repartitioned) hash
+        # aggregation over all groups instead of anything driven from Python.
+        with TranslationTimer() as timer:
+            aggregations = list(self._evaluate_exprs(exprs))
+        native = aggregate(
+            self.compliant.native, [col(key) for key in self._keys], aggregations
+        )
+        return self.compliant._with_native(
+            native, translation_seconds=timer.seconds
+        ).rename(
+            dict(zip(self._keys, self._output_key_names))
+        )
@@ -1,17 +1,76 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import operator
+import re
+from collections import OrderedDict
+from functools import reduce
+from glob import glob
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+from uuid import uuid4
 from narwhals._arrow.utils import narwhals_to_native_dtype
 from narwhals._compliant.namespace import LazyNamespace
+from narwhals._sql.when_then import SQLThen, SQLWhen
 from narwhals._utils import Implementation, not_implemented
 
 import datafusion
+import pyarrow as pa
 from narwhals_datafusion.dataframe import DataFusionLazyFrame
 from narwhals_datafusion.expr import DataFusionExpr
+from narwhals_datafusion.utils import (
+    PersistCache,
+    PersistCacheInfo,
+    PlanCache,
+    PlanCacheInfo,
+    QueryProfile,
+    build_session_context,
+    col,
+    persist_cache,
+    plan_cache,
+    session_context,
+    set_approximate_aggregations,
+    set_async_concurrency,
+    set_frame_context,
+    set_persist_cache,
+    set_plan_cache,
+    set_profiler,
+    set_session_context,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterable, Mapping, Sequence
+    from narwhals._compliant.window import WindowInputs
     from narwhals._utils import Version
     from narwhals.dtypes import DType
+    from narwhals.typing import ConcatMethod
+
+# Scanned datasets by source and options, least recently used first. Reusing
+# the same listing table keeps its inferred schema and per-file statistics
+# cache, so repeated scans of a large dataset don't infer the schema or read
+# file footers again. That also means files added later only show up under the
+# old schema, until `invalidate_scans` drops the table.
+_SCANS: OrderedDict[Hashable, datafusion.DataFrame] = OrderedDict()
+_MAX_SCANS = 64
+
+_WILDCARD = re.compile(r"[*?\[]")
+
+
+def _directory_glob(source: str | Path) -> tuple[Path, list[Path]] | None:
+    # DataFusion only expands wildcards in the file name of a listing table's
+    # path; one in a directory silently matches no files. Such globs are
+    # expanded here into the root before the first wildcard and the files.
+    parts = Path(source).parts
+    wildcard = next(
+        (i for i, part in enumerate(parts[:-1]) if _WILDCARD.search(part)), None
+    )
+    if wildcard is None:
+        return None
+    files = sorted(path for path in map(Path, glob(str(source))) if path.is_file())
+    if not files:
+        msg = f"No files match {str(source)!r}."
+        raise FileNotFoundError(msg)
+    return Path(*parts[:wildcard]), files
+
 
 class DataFusionNamespace(
     LazyNamespace[DataFusionLazyFrame, DataFusionExpr, "datafusion.DataFrame"]
@@ -24,6 +83,368 @@ class DataFusionNamespace(
     def from_native(self, native_object: datafusion.DataFrame) -> DataFusionLazyFrame:
         return DataFusionLazyFrame(native_object, version=self._version)
     
+    @property
+    def context(self) -> datafusion.SessionContext:
+        """The session context that frames created by the plugin run on."""
+        return session_context()
+
+    def configure_session(
+        self,
+        *,
+        target_partitions: int | None = None,
+        batch_size: int | None = None,
+        memory_limit: int | None = None,
+        memory_pool: Literal["fair", "greedy"] = "fair",
+        spill_path: str | Path | None = None,
+        repartition_joins: bool = True,
+        repartition_aggregations: bool = True,
+    ) -> datafusion.SessionContext:
+        """Replace the shared session context with a newly configured one.
+
+        `target_partitions` defaults to the number of CPUs available to the
+        process, taking a cgroup CPU quota into account. With `memory_limit`
+        (in bytes), sorts, aggregations and joins spill to `spill_path` (or
+        the OS temporary directory) instead of growing past the limit.
+        Frames created before reconfiguring keep running on their old context.
+        """
+        context = build_session_context(
+            target_partitions=target_partitions,
+            batch_size=batch_size,
+            memory_limit=memory_limit,
+            memory_pool=memory_pool,
+            spill_path=spill_path,
+            repartition_joins=repartition_joins,
+            repartition_aggregations=repartition_aggregations,
+        )
+        set_session_context(context)
+        # Scanned tables are registered on the old context.
+        _SCANS.clear()
+        if (cache := plan_cache()) is not None:
+            cache.clear()
+        return context
+
+    def enable_plan_cache(self, maxsize: int = 128) -> None:
+        """Cache the physical plans of up to `maxsize` executed queries.
+
+        Re-running a query with the same operations, columns and literals on
+        the same input frames skips optimization and physical planning. Only
+        queries over frames from `scan_*` are cached, as other frames don't
+        tell which session context they belong to. A cached plan keeps the
+        file listing it was planned with, so clear the cache (with
+        `disable_plan_cache`) after adding files to a scanned source.
+
+        Expressions are still translated on every call, and a query with
+        different literal values (the same shape with other parameters) is a
+        different key, so it is planned again. Plans with several output
+        partitions, over in-memory tables, with Python UDFs or larger than
+        `PlanCache.max_plan_bytes` can't be cached; their lookups are counted
+        as `uncacheable` rather than as hits.
+        """
+        set_plan_cache(PlanCache(maxsize))
+
+    def disable_plan_cache(self) -> None:
+        set_plan_cache(None)
+
+    def plan_cache_info(self) -> PlanCacheInfo | None:
+        """Hit/miss counters and size of the plan cache, if enabled."""
+        cache = plan_cache()
+        return None if cache is None else cache.info()
+
+    def configure_persist_cache(
+        self, *, memory_budget: int | None = None, spill_dir: str | Path | None = None
+    ) -> None:
+        """Bound the memory used by persisted results to `memory_budget` bytes.
+
+        Past the budget, the least recently used results are spilled to Arrow
+        IPC files in `spill_dir`, or dropped (to be recomputed when persisted
+        again) if it isn't given. Results persisted so far are dropped.
+        """
+        set_persist_cache(PersistCache(memory_budget, spill_dir))
+
+    def unpersist_all(self) -> None:
+        persist_cache().clear()
+
+    def persist_cache_info(self) -> PersistCacheInfo:
+        """Hit/miss counters, memory use and number of persisted results."""
+        return persist_cache().info()
+
+    def enable_approximate_aggregations(self) -> None:
+        """Compute `n_unique`, `quantile` and `median` approximately.
+
+        They become DataFusion's `approx_distinct` (HyperLogLog, which doesn't
+        count nulls), `approx_percentile_cont` (a t-digest, whatever the
+        interpolation) and `approx_median`, which use bounded memory per group
+        rather than keeping every value. `n_unique` is still returned as
+        Int64. Applies to every frame operation (`select`, `agg`, ...) from
+        then on, including those using expressions built earlier.
+        """
+        set_approximate_aggregations(enabled=True)
+
+    def disable_approximate_aggregations(self) -> None:
+        set_approximate_aggregations(enabled=False)
+
+    def configure_async_concurrency(self, limit: int | None = None) -> None:
+        """Compute at most `limit` batches at once across the `*_async` methods.
+
+        Queries awaited on the same event loop beyond the limit wait for a slot
+        before each batch, so that many concurrent requests share the CPUs
+        instead of all executing at once. Defaults to the number of available CPUs.
+        """
+        set_async_concurrency(limit)
+
+    def set_profiler(
+        self, callback: Callable[[QueryProfile], None] | None, *, analyze: bool = False
+    ) -> None:
+        """Call `callback` with a `QueryProfile` after every `collect`/`sink_parquet`.
+
+        Profiles hold the time spent translating expressions and executing the
+        query. With `analyze`, each query is executed a second time under
+        `EXPLAIN ANALYZE` to also record per-operator metrics. Pass `None` to
+        stop profiling.
+        """
+        set_profiler(callback, analyze=analyze)
+
+    def _native_schema(self, schema: Mapping[str, DType] | None) -> pa.Schema | None:
+        if schema is None:
+            return None
+        return pa.schema(
+            (name, narwhals_to_native_dtype(dtype, self._version))
+            for name, dtype in schema.items()
+        )
+
+    def _partition_cols(
+        self,
+        source: str | Path,
+        globbed: tuple[Path, list[Path]] | None,
+        hive_partitioning: bool,
+        hive_schema: Mapping[str, DType] | None,
+    ) -> list[tuple[str, pa.DataType]]:
+        if not hive_partitioning:
+            return []
+        if hive_schema is not None:
+            return [
+                (name, narwhals_to_native_dtype(dtype, self._version))
+                for name, dtype in hive_schema.items()
+            ]
+        if globbed is not None:
+            root, files = globbed
+            return [
+                (part.partition("=")[0], pa.string())
+                for part in files[0].relative_to(root).parent.parts
+                if "=" in part
+            ]
+        # Discover `key=value/` directories below the (non-glob part of the)
+        # source. Only local paths can be walked; pass `hive_schema` otherwise.
+        root = Path(_WILDCARD.split(str(source), maxsplit=1)[0])
+        names: list[str] = []
+        while root.is_dir():
+            child = next(
+                (p for p in sorted(root.iterdir()) if p.is_dir() and "=" in p.name), None
+            )
+            if child is None:
+                break
+            names.append(child.name.partition("=")[0])
+            root = child
+        return [(name, pa.string()) for name in names]
+
+    def _scan(
+        self,
+        key: Hashable,
+        source: str | Path,
+        globbed: tuple[Path, list[Path]] | None,
+        partition_cols: list[tuple[str, pa.DataType]],
+        read: Callable[
+            [datafusion.SessionContext, str, list[tuple[str, pa.DataType]]],
+            datafusion.DataFrame,
+        ],
+    ) -> DataFusionLazyFrame:
+        if (native := _SCANS.get(key)) is None:
+            context = self.context
+            native = _SCANS[key] = (
+                read(context, str(source), partition_cols)
+                if globbed is None
+                else self._read_files(context, *globbed, partition_cols, read)
+            )
+            set_frame_context(native, context)
+            if len(_SCANS) > _MAX_SCANS:
+                _SCANS.popitem(last=False)
+        else:
+            _SCANS.move_to_end(key)
+        return self.from_native(native)
+
+    @staticmethod
+    def _read_files(
+        context: datafusion.SessionContext,
+        root: Path,
+        files: list[Path],
+        partition_cols: list[tuple[str, pa.DataType]],
+        read: Callable[
+            [datafusion.SessionContext, str, list[tuple[str, pa.DataType]]],
+            datafusion.DataFrame,
+        ],
+    ) -> datafusion.DataFrame:
+        # One scan per file, with the partition values of its path appended
+        # as literals, like a listing table's partition columns.
+        natives = []
+        for file in files:
+            values = dict(
+                part.split("=", 1) for part in file.relative_to(root).parent.parts if "=" in part
+            )
+            native = read(context, str(file), [])
+            natives.append(
+                native.select(
+                    *(col(field.name) for field in native.schema()),
+                    *(
+                        datafusion.lit(values.get(name)).cast(dtype).alias(name)
+                        for name, dtype in partition_cols
+                    ),
+                )
+            )
+        return reduce(lambda left, right: left.union(right), natives)
+
+    def invalidate_scans(self, source: str | Path | None = None) -> None:
+        """Forget the cached scans of `source`, or of every source.
+
+        Scans of a source reuse the schema and file statistics from its first
+        scan, so call this after files with new columns or types land there.
+        """
+        if source is None:
+            _SCANS.clear()
+            return
+        for key in [key for key in _SCANS if key[1] == str(source)]:
+            del _SCANS[key]
+
+    def scan_parquet(
+        self,
+        source: str | Path,
+        *,
+        schema: Mapping[str, DType] | None = None,
+        hive_partitioning: bool = True,
+        hive_schema: Mapping[str, DType] | None = None,
+        file_extension: str = ".parquet",
+    ) -> DataFusionLazyFrame:
+        """Lazily scan a Parquet file, directory or glob as a listing table.
+
+        Without `schema`, it is inferred from the file footers once per source
+        and kept for later scans, until `invalidate_scans` is called. Filters
+        and projections are pushed into the scan, and filters on hive
+        partition columns prune whole directories. Globs with wildcards in
+        directories are expanded when first scanned, into one scan per file.
+        """
+        globbed = _directory_glob(source)
+        partition_cols = self._partition_cols(
+            source, globbed, hive_partitioning, hive_schema
+        )
+        native_schema = self._native_schema(schema)
+        return self._scan(
+            ("parquet", str(source), tuple(partition_cols), native_schema, file_extension),
+            source,
+            globbed,
+            partition_cols,
+            lambda ctx, location, cols: ctx.read_parquet(
+                location,
+                table_partition_cols=cols,
+                file_extension=file_extension if globbed is None else "",
+                schema=native_schema,
+            ),
+        )
+
+    def scan_csv(
+        self,
+        source: str | Path,
+        *,
+        schema: Mapping[str, DType] | None = None,
+        has_header: bool = True,
+        separator: str = ",",
+        infer_schema_length: int = 1000,
+        hive_partitioning: bool = True,
+        hive_schema: Mapping[str, DType] | None = None,
+        file_extension: str = ".csv",
+    ) -> DataFusionLazyFrame:
+        globbed = _directory_glob(source)
+        partition_cols = self._partition_cols(
+            source, globbed, hive_partitioning, hive_schema
+        )
+        native_schema = self._native_schema(schema)
+        return self._scan(
+            (
+                "csv",
+                str(source),
+                tuple(partition_cols),
+                native_schema,
+                has_header,
+                separator,
+                infer_schema_length,
+                file_extension,
+            ),
+            source,
+            globbed,
+            partition_cols,
+            lambda ctx, location, cols: ctx.read_csv(
+                location,
+                schema=native_schema,
+                has_header=has_header,
+                delimiter=separator,
+                schema_infer_max_records=infer_schema_length,
+                file_extension=file_extension if globbed is None else "",
+                table_partition_cols=cols,
+            ),
+        )
+
+    def scan_ipc(
+        self,
+        source: str | Path,
+        *,
+        hive_partitioning: bool = True,
+        hive_schema: Mapping[str, DType] | None = None,
+        file_extension: str = ".arrow",
+    ) -> DataFusionLazyFrame:
+        globbed = _directory_glob(source)
+        partition_cols = self._partition_cols(
+            source, globbed, hive_partitioning, hive_schema
+        )
+        extension = file_extension if globbed is None else ""
+
+        def read(
+            ctx: datafusion.SessionContext,
+            location: str,
+            partition_cols: list[tuple[str, pa.DataType]],
+        ) -> datafusion.DataFrame:
+            # The Python API has no Arrow IPC reader; the SQL DDL registers the
+            # same kind of listing table. Partition values come back dictionary
+            # encoded, so cast them to the requested types.
+            name = f"__narwhals_ipc_{uuid4().hex}"
+            partitioned_by = (
+                f" PARTITIONED BY ({', '.join(key for key, _ in partition_cols)})"
+                if partition_cols
+                else ""
+            )
+            location = location.replace("'", "''")
+            ctx.sql(
+                f'CREATE EXTERNAL TABLE "{name}" STORED AS ARROW{partitioned_by} '
+                f"LOCATION '{location}' OPTIONS ('format.file_extension' '{extension}')"
+            ).collect()
+            native = ctx.table(name)
+            if not partition_cols:
+                return native
+            types = dict(partition_cols)
+            return native.select(
+                *(
+                    col(field.name).cast(types[field.name]).alias(field.name)
+                    if field.name in types
+                    else col(field.name)
+                    for field in native.schema()
+                )
+            )
+
+        return self._scan(
+            ("ipc", str(source), tuple(partition_cols), file_extension),
+            source,
+            globbed,
+            partition_cols,
+            read,
+        )
+
     @property
     def _expr(self) -> type[DataFusionExpr]:
         return DataFusionExpr
@@ -32,7 +453,16 @@ class DataFusionNamespace(
     def _lazyframe(self) -> type[DataFusionLazyFrame]:
         return DataFusionLazyFrame
     
-    len: not_implemented = not_implemented()
+    def len(self) -> DataFusionExpr:
+        def func(_df: DataFusionLazyFrame) -> list[datafusion.Expr]:
+            return [datafusion.functions.count_star()]
+
+        return DataFusionExpr(
+            func,
+            evaluate_output_names=lambda _df: ["len"],
+            alias_output_names=None,
+            version=self._version,
+        )
 
     def lit(self, value: Any, dtype: DType | type[DType] | None) -> DataFusionExpr:
         def func(_df: DataFusionLazyFrame) -> list[datafusion.Expr]:
@@ -42,20 +472,213 @@ class DataFusionNamespace(
         
         return DataFusionExpr(
             func,
+            DataFusionExpr._window_invariant(func),
             evaluate_output_names=lambda _df: ["literal"],
             alias_output_names=None,
             version=self._version,
         )
 
-    all_horizontal: not_implemented = not_implemented()
-    any_horizontal: not_implemented = not_implemented()
-    sum_horizontal: not_implemented = not_implemented()
-    mean_horizontal: not_implemented = not_implemented()
-    min_horizontal: not_implemented = not_implemented()
-    max_horizontal: not_implemented = not_implemented()
-    concat: not_implemented = not_implemented()
-    when: not_implemented = not_implemented()
-    concat_str: not_implemented = not_implemented()
+    def _when(
+        self,
+        condition: datafusion.Expr,
+        value: datafusion.Expr,
+        otherwise: datafusion.Expr | None = None,
+    ) -> datafusion.Expr:
+        if otherwise is None:
+            return datafusion.functions.when(condition, value).end()
+        value = self._with_common_type(value, otherwise)
+        return datafusion.functions.when(condition, value).otherwise(otherwise)
+
+    def _with_common_type(
+        self, value: datafusion.Expr, *others: datafusion.Expr
+    ) -> datafusion.Expr:
+        # Until the plan is optimized, a CASE has the type of its first branch
+        # (e.g. int64 for `then(1).otherwise(0.5)`), while execution coerces
+        # all branches to a common type. `coalesce` does coerce, so padding the
+        # first branch with typed nulls gives the CASE the executed type.
+        typed_nulls = (
+            datafusion.functions.when(datafusion.lit(False), other).end() for other in others
+        )
+        return datafusion.functions.coalesce(value, *typed_nulls)
+
+    def when(self, predicate: DataFusionExpr) -> DataFusionWhen:
+        return DataFusionWhen.from_expr(predicate, context=self)
+
+    def all_horizontal(self, *exprs: DataFusionExpr, ignore_nulls: bool) -> DataFusionExpr:
+        def func(cols: Iterable[datafusion.Expr]) -> datafusion.Expr:
+            if ignore_nulls:
+                cols = (
+                    datafusion.functions.coalesce(native, datafusion.lit(True))
+                    for native in cols
+                )
+            return reduce(operator.and_, cols)
+
+        return self._expr._from_elementwise_horizontal_op(func, *exprs)
+
+    def any_horizontal(self, *exprs: DataFusionExpr, ignore_nulls: bool) -> DataFusionExpr:
+        def func(cols: Iterable[datafusion.Expr]) -> datafusion.Expr:
+            if ignore_nulls:
+                cols = (
+                    datafusion.functions.coalesce(native, datafusion.lit(False))
+                    for native in cols
+                )
+            return reduce(operator.or_, cols)
+
+        return self._expr._from_elementwise_horizontal_op(func, *exprs)
+
+    def sum_horizontal(self, *exprs: DataFusionExpr) -> DataFusionExpr:
+        def func(cols: Iterable[datafusion.Expr]) -> datafusion.Expr:
+            return reduce(
+                operator.add,
+                (datafusion.functions.coalesce(native, datafusion.lit(0)) for native in cols),
+            )
+
+        return self._expr._from_elementwise_horizontal_op(func, *exprs)
+
+    def mean_horizontal(self, *exprs: DataFusionExpr) -> DataFusionExpr:
+        def func(cols: Iterable[datafusion.Expr]) -> datafusion.Expr:
+            cols = tuple(cols)
+            total = reduce(
+                operator.add,
+                (datafusion.functions.coalesce(native, datafusion.lit(0)) for native in cols),
+            )
+            count = reduce(
+                operator.add, (native.is_not_null().cast(pa.int64()) for native in cols)
+            )
+            # Integer division would truncate; rows that are all null give null.
+            return total.cast(pa.float64()) / datafusion.functions.nullif(
+                count, datafusion.lit(0)
+            )
+
+        return self._expr._from_elementwise_horizontal_op(func, *exprs)
+
+    def _extremum_horizontal(
+        self, exprs: Sequence[DataFusionExpr], op: Callable[[Any, Any], Any]
+    ) -> DataFusionExpr:
+        # The bindings have no `greatest`/`least`. A single CASE picks the first
+        # non-null value that beats every other non-null value, so nulls are
+        # ignored and each input is referenced directly (no nesting).
+        def func(cols: Iterable[datafusion.Expr]) -> datafusion.Expr:
+            cols = tuple(cols)
+            if len(cols) == 1:
+                return cols[0]
+            conditions = [
+                reduce(
+                    operator.and_,
+                    (
+                        other.is_null() | op(col, other)
+                        for j, other in enumerate(cols)
+                        if j != i
+                    ),
+                    col.is_not_null(),
+                )
+                for i, col in enumerate(cols)
+            ]
+            case = datafusion.functions.when(
+                conditions[0], self._with_common_type(*cols)
+            )
+            for condition, col in zip(conditions[1:], cols[1:]):
+                case = case.when(condition, col)
+            return case.end()
+
+        return self._expr._from_elementwise_horizontal_op(func, *exprs)
+
+    def max_horizontal(self, *exprs: DataFusionExpr) -> DataFusionExpr:
+        return self._extremum_horizontal(exprs, operator.ge)
+
+    def min_horizontal(self, *exprs: DataFusionExpr) -> DataFusionExpr:
+        return self._extremum_horizontal(exprs, operator.le)
+
+    def coalesce(self, *exprs: DataFusionExpr) -> DataFusionExpr:
+        def func(cols: Iterable[datafusion.Expr]) -> datafusion.Expr:
+            return datafusion.functions.coalesce(*cols)
+
+        return self._expr._from_elementwise_horizontal_op(func, *exprs)
+
+    def concat_str(
+        self, *exprs: DataFusionExpr, separator: str, ignore_nulls: bool
+    ) -> DataFusionExpr:
+        def func(cols: Iterable[datafusion.Expr]) -> datafusion.Expr:
+            cols = tuple(native.cast(pa.string()) for native in cols)
+            # `concat_ws` skips nulls.
+            result = datafusion.functions.concat_ws(separator, *cols)
+            if ignore_nulls:
+                return result
+            any_null = reduce(operator.or_, (native.is_null() for native in cols))
+            return self._when(~any_null, result)
+
+        return self._expr._from_elementwise_horizontal_op(func, *exprs)
+
+    def concat(
+        self, items: Iterable[DataFusionLazyFrame], *, how: ConcatMethod
+    ) -> DataFusionLazyFrame:
+        items = list(items)
+        first = items[0]
+        if how == "horizontal":
+            # DataFusion rows have no positional identity to align on, and
+            # narwhals doesn't allow horizontal concatenation of lazy frames.
+            msg = "Horizontal concatenation is not supported for DataFusion."
+            raise NotImplementedError(msg)
+        if how == "vertical":
+            schema = first.schema
+            if not all(item.schema == schema for item in items[1:]):
+                msg = "inputs should all have the same schema"
+                raise TypeError(msg)
+            natives = [item.native for item in items]
+        else:  # how == "diagonal"
+            # Align every input to the union of all columns (in order of first
+            # appearance), filling missing ones with nulls of the right type.
+            fields: dict[str, pa.DataType] = {}
+            for item in items:
+                for field in item.native.schema():
+                    fields.setdefault(field.name, field.type)
+            natives = []
+            for item in items:
+                present = set(item.columns)
+                natives.append(
+                    item.native.select(
+                        *(
+                            col(name)
+                            if name in present
+                            else datafusion.lit(None).cast(dtype).alias(name)
+                            for name, dtype in fields.items()
+                        )
+                    )
+                )
+        # The optimizer flattens the nested binary unions into a single union
+        # whose inputs are executed in parallel and streamed through.
+        native = reduce(lambda left, right: left.union(right), natives)
+        return first._with_native(native)._derived_from(*items[1:])
+
     selectors: not_implemented = not_implemented()
-    coalesce: not_implemented = not_implemented()
     is_native: not_implemented = not_implemented() # TODO: Do we need this?
+
+
+class DataFusionWhen(SQLWhen["DataFusionLazyFrame", "datafusion.Expr", DataFusionExpr]):
+    # `SQLWhen` calls `.otherwise` on the result of `_when`, but a DataFusion
+    # CASE is finished by either `otherwise` or `end`, so pass it in one go.
+    @property
+    def _then(self) -> type[DataFusionThen]:
+        return DataFusionThen
+
+    def _values(self, evaluate: Callable[[DataFusionExpr], datafusion.Expr]) -> list[datafusion.Expr]:
+        def value(obj: DataFusionExpr | Any) -> datafusion.Expr:
+            return evaluate(obj) if self._condition._is_expr(obj) else datafusion.lit(obj)
+
+        condition = evaluate(self._condition)
+        otherwise = None if self._otherwise_value is None else value(self._otherwise_value)
+        namespace = self._condition.__narwhals_namespace__()
+        return [namespace._when(condition, value(self._then_value), otherwise)]
+
+    def __call__(self, df: DataFusionLazyFrame) -> list[datafusion.Expr]:
+        return self._values(df._evaluate_expr)
+
+    def _window_function(
+        self, df: DataFusionLazyFrame, window_inputs: WindowInputs[datafusion.Expr]
+    ) -> list[datafusion.Expr]:
+        return self._values(lambda expr: expr.window_function(df, window_inputs)[0])
+
+
+class DataFusionThen(
+    SQLThen["DataFusionLazyFrame", "datafusion.Expr", DataFusionExpr], DataFusionExpr
+): ...
@@ -1,12 +1,647 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+import math
+import os
+import re
+import threading
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import count
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Literal, NamedTuple, NoReturn
+
+import datafusion
+from datafusion.expr import Window, WindowFrame
+from narwhals._utils import extend_bool
 
 if TYPE_CHECKING:
-    import datafusion
+    from collections.abc import Callable, Hashable, Iterator, Sequence
+
+    import pyarrow as pa
+    from datafusion.plan import ExecutionPlan
+
     from narwhals_datafusion.dataframe import DataFusionLazyFrame
     from narwhals_datafusion.expr import DataFusionExpr
 
+@lru_cache(maxsize=None)
+def col(name: str) -> datafusion.Expr:
+    # `datafusion.col` parses its argument as a SQL identifier, which lowercases
+    # unquoted names and splits on dots. Quote it so the name is taken verbatim.
+    # Native expressions are immutable, so leaves are shared between every
+    # occurrence of a column instead of being re-parsed for each one. Unbounded,
+    # as a bounded cache would thrash on frames with thousands of columns.
+    escaped = name.replace('"', '""')
+    return datafusion.col(f'"{escaped}"')
+
+
+def available_cpus() -> int:
+    # `os.cpu_count` reports the host's CPUs; in a container the cgroup (v2)
+    # CPU quota is what actually bounds the number of useful threads.
+    try:
+        quota, period = Path("/sys/fs/cgroup/cpu.max").read_text().split()
+    except (OSError, ValueError):
+        quota = "max"
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+    if quota != "max":
+        cpus = min(cpus, max(1, math.ceil(int(quota) / int(period))))
+    return cpus
+
+
+def build_session_context(
+    *,
+    target_partitions: int | None = None,
+    batch_size: int | None = None,
+    memory_limit: int | None = None,
+    memory_pool: Literal["fair", "greedy"] = "fair",
+    spill_path: str | Path | None = None,
+    repartition_joins: bool = True,
+    repartition_aggregations: bool = True,
+) -> datafusion.SessionContext:
+    if memory_pool not in {"fair", "greedy"}:
+        msg = f"Expected `memory_pool` to be 'fair' or 'greedy', got: {memory_pool!r}."
+        raise ValueError(msg)
+    config = (
+        datafusion.SessionConfig()
+        .with_target_partitions(target_partitions or available_cpus())
+        .with_repartition_joins(repartition_joins)
+        .with_repartition_aggregations(repartition_aggregations)
+    )
+    if batch_size is not None:
+        config = config.with_batch_size(batch_size)
+    runtime = datafusion.RuntimeEnvBuilder()
+    runtime = (
+        runtime.with_disk_manager_specified(spill_path)
+        if spill_path is not None
+        else runtime.with_disk_manager_os()
+    )
+    if memory_limit is not None:
+        # Both pools make memory-hungry operators (sorts, aggregations, joins)
+        # spill to disk once the limit is reached. The fair pool splits the
+        # limit evenly between spilling operators, the greedy pool is
+        # first-come, first-served.
+        runtime = (
+            runtime.with_fair_spill_pool(memory_limit)
+            if memory_pool == "fair"
+            else runtime.with_greedy_memory_pool(memory_limit)
+        )
+    return datafusion.SessionContext(config, runtime)
+
+
+_session_context: datafusion.SessionContext | None = None
+
+
+def session_context() -> datafusion.SessionContext:
+    """Return the session context shared by everything the plugin creates."""
+    global _session_context
+    if _session_context is None:
+        _session_context = build_session_context()
+    return _session_context
+
+
+def set_session_context(context: datafusion.SessionContext) -> None:
+    global _session_context
+    _session_context = context
+
+
+# DataFusion frames don't expose the session context they run on, so it is
+# recorded for the frames the plugin creates itself (scans).
+_frame_contexts: weakref.WeakKeyDictionary[
+    datafusion.DataFrame, datafusion.SessionContext
+] = weakref.WeakKeyDictionary()
+
+
+def set_frame_context(native: datafusion.DataFrame, context: datafusion.SessionContext) -> None:
+    _frame_contexts[native] = context
+
+
+def frame_context(native: datafusion.DataFrame) -> datafusion.SessionContext | None:
+    return _frame_contexts.get(native)
+
+
+def plan_key(
+    native: datafusion.DataFrame, sources: tuple[datafusion.DataFrame, ...]
+) -> Hashable:
+    # Listing tables all render as `?table?`, so the sources disambiguate.
+    return (tuple(map(id, sources)), str(native.logical_plan()))
+
+
+class PlanCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    # Lookups of queries whose plans were found not to be cacheable.
+    uncacheable: int
+
+
+class PlanCache:
+    """LRU cache of optimized physical plans.
+
+    Plans are keyed by the frames a query was built from and DataFusion's
+    rendering of its logical plan, which spells out every operation, column
+    and literal. A hit skips optimization and physical planning.
+    """
+
+    # Plans over in-memory tables serialize their data; decoding those on every
+    # hit would cost more than planning them again.
+    max_plan_bytes = 1 << 20
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize < 1:
+            msg = f"Expected `maxsize` to be at least 1, got: {maxsize}."
+            raise ValueError(msg)
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.uncacheable = 0
+        # The source frames are kept alive with their plans so that their ids,
+        # which are part of the key, can't be reused by other frames.
+        self._plans: OrderedDict[
+            Hashable, tuple[tuple[datafusion.DataFrame, ...], bytes]
+        ] = OrderedDict()
+        # Queries whose plans can't be cached, so that they aren't planned twice
+        # on every execution. Kept apart so they can't evict cached plans.
+        self._uncacheable: OrderedDict[
+            Hashable, tuple[datafusion.DataFrame, ...]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def execution_plan(
+        self, native: datafusion.DataFrame, sources: tuple[datafusion.DataFrame, ...]
+    ) -> tuple[datafusion.SessionContext, ExecutionPlan] | None:
+        """Return a physical plan for `native` and the context to execute it on.
+
+        `None` means the plan isn't cached and `native` should be executed as
+        usual: plans over frames of unknown or several session contexts, plans
+        with several output partitions (which `native` merges in parallel), and
+        plans that can't be serialized.
+        """
+        from datafusion.plan import ExecutionPlan
+
+        contexts = {id(context): context for context in map(frame_context, sources)}
+        if len(contexts) != 1 or (context := contexts.popitem()[1]) is None:
+            return None
+        # Plans are decoded on, and carry the configuration of, their context.
+        key = (id(context), plan_key(native, sources))
+        with self._lock:
+            if key in self._uncacheable:
+                self.uncacheable += 1
+                self._uncacheable.move_to_end(key)
+                return None
+            if hit := key in self._plans:
+                self.hits += 1
+                self._plans.move_to_end(key)
+                proto = self._plans[key][1]
+            else:
+                self.misses += 1
+        if not hit:
+            proto = self._serialize(native.execution_plan())
+            entries = self._uncacheable if proto is None else self._plans
+            with self._lock:
+                entries[key] = sources if proto is None else (sources, proto)
+                if len(entries) > self.maxsize:
+                    entries.popitem(last=False)
+        # Operators keep state (e.g. Top-K dynamic filters) between executions,
+        # so every run gets a fresh plan decoded from the cached one.
+        return None if proto is None else (context, ExecutionPlan.from_proto(context, proto))
+
+    def _serialize(self, plan: ExecutionPlan) -> bytes | None:
+        if plan.partition_count != 1:
+            return None
+        # Scans of in-memory tables (such as persisted results) would carry
+        # their data along.
+        if "partition_sizes=" in plan.display_indent():
+            return None
+        try:
+            proto = plan.to_proto()
+        except Exception:  # noqa: BLE001
+            # e.g. Python UDFs have no serialized form.
+            return None
+        return proto if len(proto) <= self.max_plan_bytes else None
+
+    def info(self) -> PlanCacheInfo:
+        return PlanCacheInfo(
+            self.hits, self.misses, self.maxsize, len(self._plans), self.uncacheable
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._plans.clear()
+            self._uncacheable.clear()
+            self.hits = self.misses = self.uncacheable = 0
+
+
+_plan_cache: PlanCache | None = None
+
+
+def plan_cache() -> PlanCache | None:
+    return _plan_cache
+
+
+def set_plan_cache(cache: PlanCache | None) -> None:
+    global _plan_cache
+    _plan_cache = cache
+
+
+class PersistCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    memory_bytes: int
+    memory_budget: int | None
+    in_memory: int
+    spilled: int
+
+
+class PersistCache:
+    """Results of persisted frames, kept for the frames derived from them.
+
+    Results are keyed like `PlanCache`'s plans. Once the in-memory results
+    exceed `memory_budget` bytes, the least recently used ones are written to
+    Arrow IPC files in `spill_dir` (and memory-mapped when used again), or
+    dropped if there's no `spill_dir`. Frames already derived from a result
+    keep it alive until they are garbage collected.
+    """
+
+    def __init__(
+        self, memory_budget: int | None = None, spill_dir: str | Path | None = None
+    ) -> None:
+        if memory_budget is not None and memory_budget < 0:
+            msg = f"Expected `memory_budget` to be non-negative, got: {memory_budget}."
+            raise ValueError(msg)
+        self.memory_budget = memory_budget
+        self.spill_dir = None if spill_dir is None else Path(spill_dir)
+        self.hits = 0
+        self.misses = 0
+        self.memory_bytes = 0
+        # Either the table or the path of the IPC file it was spilled to. The
+        # sources are kept alive for the same reason as in `PlanCache`.
+        self._results: OrderedDict[
+            Hashable, tuple[tuple[datafusion.DataFrame, ...], pa.Table | Path]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> pa.Table | None:
+        import pyarrow as pa
+
+        with self._lock:
+            if key not in self._results:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._results.move_to_end(key)
+            result = self._results[key][1]
+        if isinstance(result, Path):
+            return pa.ipc.open_file(pa.memory_map(str(result))).read_all()
+        return result
+
+    def put(
+        self, key: Hashable, sources: tuple[datafusion.DataFrame, ...], table: pa.Table
+    ) -> None:
+        with self._lock:
+            self._discard(key)
+            # `nbytes` isn't supported for view types, which DataFusion reads
+            # Parquet strings as.
+            if (
+                self.memory_budget is not None
+                and table.get_total_buffer_size() > self.memory_budget
+            ):
+                if self.spill_dir is not None:
+                    self._results[key] = (sources, self._spill(table))
+                return
+            self._results[key] = (sources, table)
+            self.memory_bytes += table.get_total_buffer_size()
+            self._evict()
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._discard(key)
+
+    def _evict(self) -> None:
+        import pyarrow as pa
+
+        budget = self.memory_budget
+        if budget is None:
+            return
+        for key, (sources, result) in list(self._results.items()):
+            if self.memory_bytes <= budget:
+                break
+            if not isinstance(result, pa.Table):
+                continue
+            self.memory_bytes -= result.get_total_buffer_size()
+            if self.spill_dir is None:
+                del self._results[key]
+            else:
+                # Re-assigning keeps the entry's place in the recency order.
+                self._results[key] = (sources, self._spill(result))
+
+    def _spill(self, table: pa.Table) -> Path:
+        import tempfile
+
+        import pyarrow as pa
+
+        assert self.spill_dir is not None
+        self.spill_dir.mkdir(parents=True, exist_ok=True)
+        fd, path = tempfile.mkstemp(suffix=".arrow", dir=self.spill_dir)
+        with os.fdopen(fd, "wb") as file, pa.ipc.new_file(file, table.schema) as writer:
+            writer.write_table(table)
+        return Path(path)
+
+    def _discard(self, key: Hashable) -> None:
+        if key not in self._results:
+            return
+        result = self._results.pop(key)[1]
+        if isinstance(result, Path):
+            # Memory-mapped tables stay readable after the file is removed.
+            result.unlink(missing_ok=True)
+        else:
+            self.memory_bytes -= result.get_total_buffer_size()
+
+    def info(self) -> PersistCacheInfo:
+        with self._lock:
+            spilled = sum(isinstance(result, Path) for _, result in self._results.values())
+            return PersistCacheInfo(
+                self.hits,
+                self.misses,
+                self.memory_bytes,
+                self.memory_budget,
+                len(self._results) - spilled,
+                spilled,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._results):
+                self._discard(key)
+            self.hits = self.misses = 0
+
+
+_persist_cache = PersistCache()
+
+
+def persist_cache() -> PersistCache:
+    return _persist_cache
+
+
+def set_persist_cache(cache: PersistCache) -> None:
+    global _persist_cache
+    _persist_cache.clear()
+    _persist_cache = cache
+
+
+class OperatorMetrics(NamedTuple):
+    name: str
+    depth: int
+    """Nesting level in the physical plan, 0 being the root."""
+    metrics: dict[str, int | float | str]
+    """Durations in seconds and sizes in bytes, as reported by DataFusion."""
+
+
+class QueryProfile(NamedTuple):
+    operation: str
+    translation_seconds: float
+    """Time spent translating narwhals expressions into DataFusion ones."""
+    execution_seconds: float
+    plan: str | None
+    """The plan annotated with metrics, if the profiler was set with `analyze`."""
+    operators: list[OperatorMetrics]
+
+
+_profiler: tuple[Callable[[QueryProfile], None], bool] | None = None
+
+
+def profiler() -> tuple[Callable[[QueryProfile], None], bool] | None:
+    return _profiler
+
+
+def set_profiler(callback: Callable[[QueryProfile], None] | None, *, analyze: bool) -> None:
+    global _profiler
+    _profiler = None if callback is None else (callback, analyze)
+
+
+_approximate_aggregations = False
+
+
+def approximate_aggregations() -> bool:
+    return _approximate_aggregations
+
+
+def set_approximate_aggregations(*, enabled: bool) -> None:
+    global _approximate_aggregations
+    _approximate_aggregations = enabled
+
+
+_async_concurrency: int | None = None
+_async_limiters: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, asyncio.Semaphore
+] = weakref.WeakKeyDictionary()
+
+
+def async_limiter() -> asyncio.Semaphore:
+    """Return the running event loop's limit on batches being computed at once."""
+    # Semaphores are bound to the loop they're first awaited on.
+    loop = asyncio.get_running_loop()
+    if (limiter := _async_limiters.get(loop)) is None:
+        limiter = _async_limiters[loop] = asyncio.Semaphore(
+            _async_concurrency or available_cpus()
+        )
+    return limiter
+
+
+def set_async_concurrency(limit: int | None) -> None:
+    global _async_concurrency
+    if limit is not None and limit < 1:
+        msg = f"Expected `limit` to be a positive integer, got: {limit!r}."
+        raise ValueError(msg)
+    _async_concurrency = limit
+    _async_limiters.clear()
+
+
+# DataFusion reports an error raised in a Python UDF as a generic `Exception`,
+# with the original only formatted into its message. UDFs raise it through
+# `raise_from_udf`, so that `udf_errors` can re-raise the original.
+_udf_errors: OrderedDict[int, Exception] = OrderedDict()
+_udf_errors_lock = threading.Lock()
+_udf_error_ids = count()
+_UDF_ERROR = re.compile(r"\[narwhals-datafusion error (\d+)\]")
+
+
+def raise_from_udf(error: Exception) -> NoReturn:
+    with _udf_errors_lock:
+        error_id = next(_udf_error_ids)
+        _udf_errors[error_id] = error
+        # Only the first failing partition's error is reported.
+        while len(_udf_errors) > 64:
+            _udf_errors.popitem(last=False)
+    msg = f"[narwhals-datafusion error {error_id}] {error}"
+    raise RuntimeError(msg)
+
+
+@contextmanager
+def udf_errors() -> Iterator[None]:
+    """Re-raise errors passed to `raise_from_udf` while executing a plan."""
+    try:
+        yield
+    except Exception as exc:
+        if (match := _UDF_ERROR.search(str(exc))) is None:
+            raise
+        with _udf_errors_lock:
+            error = _udf_errors.pop(int(match[1]), None)
+        if error is None:
+            raise
+        raise error from None
+
+
+class TranslationTimer:
+    """Measure how long expressions take to translate to native ones.
+
+    The time belongs to the frame built from the native expressions, which
+    callers pass it to: the input frame may be shared by other branches.
+    Only wraps the outermost evaluation, expressions evaluate their inputs
+    through `df._evaluate_expr` as well.
+    """
+
+    def __init__(self) -> None:
+        self.seconds = 0.0
+
+    def __enter__(self) -> TranslationTimer:
+        self._start = perf_counter()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.seconds = perf_counter() - self._start
+
+
+_DURATION_UNITS = {"ns": 1e-9, "µs": 1e-6, "ms": 1e-3, "s": 1.0}
+_SIZE_UNITS = {"B": 1, "KB": 1024, "MB": 1024**2, "GB": 1024**3, "TB": 1024**4}
+_QUANTITY = re.compile(r"(\d+(?:\.\d+)?)\s?([a-zµ]+|[A-Z]+)")
+
+
+def _metric_value(value: str) -> int | float | str:
+    if value.isdigit():
+        return int(value)
+    if (match := _QUANTITY.fullmatch(value)) is not None:
+        number, unit = match.groups()
+        if unit in _DURATION_UNITS:
+            return float(number) * _DURATION_UNITS[unit]
+        if unit in _SIZE_UNITS:
+            return round(float(number) * _SIZE_UNITS[unit])
+    # e.g. pruning metrics, "10 total → 2 matched".
+    return value
+
+
+def parse_operator_metrics(plan: str) -> list[OperatorMetrics]:
+    """Parse the operators and their metrics out of an `EXPLAIN ANALYZE` plan."""
+    operators = []
+    for line in plan.splitlines():
+        if not line.strip():
+            continue
+        body = line.lstrip(" ")
+        details, _, metrics = body.rpartition(", metrics=[")
+        pairs = (item.partition("=") for item in metrics.rstrip("]").split(", ") if item)
+        operators.append(
+            OperatorMetrics(
+                name=(details or body).partition(":")[0],
+                depth=(len(line) - len(body)) // 2,
+                metrics={key: _metric_value(value) for key, _, value in pairs},
+            )
+        )
+    return operators
+
+
+# Result types of `cast_aggregate`, by the cast's name.
+_aggregate_casts: dict[str, pa.DataType] = {}
+
+
+def cast_aggregate(expr: datafusion.Expr, dtype: pa.DataType) -> datafusion.Expr:
+    # DataFusion only accepts aggregate functions themselves in aggregations
+    # and windows. `aggregate` and `window_expression` apply these casts to
+    # the aggregated (or windowed) result instead.
+    result = expr.cast(dtype)
+    _aggregate_casts[result.schema_name()] = dtype
+    return result
+
+
+def window_expression(
+    expr: datafusion.Expr,
+    partition_by: Sequence[str | datafusion.Expr] = (),
+    order_by: Sequence[str | datafusion.Expr] = (),
+    rows_start: int | None = None,
+    rows_end: int | None = None,
+    *,
+    descending: Sequence[bool] | None = None,
+    nulls_last: Sequence[bool] | None = None,
+) -> datafusion.Expr:
+    # `rows_start`/`rows_end` are row offsets relative to the current row,
+    # `None` meaning unbounded, as in narwhals' SQL backends.
+    if (
+        expr.variant_name() == "Cast"
+        and (dtype := _aggregate_casts.get(expr.schema_name())) is not None
+    ):
+        return window_expression(
+            datafusion.Expr(expr.to_variant().expr()),
+            partition_by,
+            order_by,
+            rows_start,
+            rows_end,
+            descending=descending,
+            nulls_last=nulls_last,
+        ).cast(dtype)
+    flags = extend_bool(False, len(order_by))
+    descending = descending or flags
+    nulls_last = nulls_last or flags
+    window_frame = (
+        WindowFrame(
+            "rows",
+            None if rows_start is None else -rows_start,
+            rows_end,
+        )
+        if rows_start is not None or rows_end is not None
+        else None
+    )
+    # DataFusion rejects empty (as opposed to missing) partition/order lists.
+    return expr.over(
+        Window(
+            partition_by=[col(key) if isinstance(key, str) else key for key in partition_by]
+            or None,
+            order_by=[
+                (col(key) if isinstance(key, str) else key).sort(
+                    ascending=not desc, nulls_first=not last
+                )
+                for key, desc, last in zip(order_by, descending, nulls_last)
+            ]
+            or None,
+            window_frame=window_frame,
+        )
+    )
+
+
+def aggregate(
+    native: datafusion.DataFrame,
+    keys: list[datafusion.Expr],
+    aggregations: list[datafusion.Expr],
+) -> datafusion.DataFrame:
+    # `DataFrame.aggregate` only takes (aliased) aggregate functions. Casts of
+    # them (see `cast_aggregate`) are applied in a projection after aggregating
+    # what they wrap, which DataFusion resolves to the aggregated columns by name.
+    inputs: dict[str, datafusion.Expr] = {}
+    wrapped = False
+    for expr in aggregations:
+        inner = expr
+        if inner.variant_name() == "Alias":
+            inner = datafusion.Expr(inner.to_variant().expr())
+        if inner.variant_name() == "Cast":
+            inner = datafusion.Expr(inner.to_variant().expr())
+            wrapped = True
+        inputs.setdefault(inner.schema_name(), inner)
+    if not wrapped:
+        return native.aggregate(keys, aggregations)
+    return native.aggregate(keys, list(inputs.values())).select(*keys, *aggregations)
+
+
 def evaluate_exprs(
     df: DataFusionLazyFrame, /, *exprs: DataFusionExpr
 ) -> list[tuple[str, datafusion.Expr]]:
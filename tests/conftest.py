@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import narwhals as nw
+import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from narwhals._utils import Version
+from polars.testing import assert_frame_equal
+
+from narwhals_datafusion import __narwhals_namespace__
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from narwhals_datafusion.namespace import DataFusionNamespace
+
+
+@pytest.fixture
+def ns() -> DataFusionNamespace:
+    return __narwhals_namespace__(Version.MAIN)
+
+
+@pytest.fixture
+def parquet_path(tmp_path: Path) -> Path:
+    path = tmp_path / "data.parquet"
+    table = pa.table(
+        {
+            "a": list(range(100)),
+            "b": [str(i) for i in range(100)],
+            "g": [i % 3 for i in range(100)],
+        }
+    )
+    pq.write_table(table, path, row_group_size=10)
+    return path
+
+
+@pytest.fixture
+def scan(ns: DataFusionNamespace, parquet_path: Path) -> nw.LazyFrame:
+    # Going through the namespace also works without plugin discovery.
+    return ns.from_native(ns.context.read_parquet(str(parquet_path))).to_narwhals()
+
+
+@pytest.fixture
+def compare(ns: DataFusionNamespace) -> Callable[..., None]:
+    """Check a query's result against narwhals' polars backend.
+
+    Rows are compared in order unless `sort_by` is given.
+    """
+
+    def compare(
+        data: dict[str, list[Any]] | pa.Table,
+        query: Callable[[nw.LazyFrame[Any]], nw.LazyFrame[Any]],
+        *,
+        sort_by: list[str] | None = None,
+        check_dtypes: bool = True,
+    ) -> None:
+        table = data if isinstance(data, pa.Table) else pa.table(data)
+        expected = query(nw.from_native(pl.from_arrow(table)).lazy()).collect().to_native()
+        lf = ns.from_native(ns.context.from_arrow(table)).to_narwhals()
+        result = query(lf).collect("polars").to_native()
+        if sort_by is not None:
+            expected = expected.sort(sort_by, nulls_last=True)
+            result = result.sort(sort_by, nulls_last=True)
+        assert_frame_equal(result, expected, check_dtypes=check_dtypes)
+
+    return compare
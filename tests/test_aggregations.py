@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import narwhals as nw
+import polars as pl
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from narwhals_datafusion.namespace import DataFusionNamespace
+
+DATA = {"g": [1, 1, 1, 2, 2, 2], "a": [1, 2, 2, None, 5, 6]}
+
+
+@pytest.fixture
+def lf(ns: DataFusionNamespace) -> nw.LazyFrame:
+    import pyarrow as pa
+
+    return ns.from_native(ns.context.from_arrow(pa.table(DATA))).to_narwhals()
+
+
+@pytest.fixture
+def approximate(ns: DataFusionNamespace) -> Iterator[None]:
+    ns.enable_approximate_aggregations()
+    yield
+    ns.disable_approximate_aggregations()
+
+
+def _exprs() -> list[nw.Expr]:
+    return [
+        nw.col("a").n_unique().alias("n_unique"),
+        nw.col("a").median().alias("median"),
+        nw.col("a").quantile(0.5, "linear").alias("quantile"),
+    ]
+
+
+def _expected() -> pl.DataFrame:
+    return (
+        pl.DataFrame(DATA)
+        .group_by("g")
+        .agg(
+            pl.col("a").n_unique().cast(pl.Int64).alias("n_unique"),
+            pl.col("a").median().alias("median"),
+            pl.col("a").quantile(0.5, "linear").alias("quantile"),
+        )
+        .sort("g")
+    )
+
+
+def test_exact(lf: nw.LazyFrame) -> None:
+    result = lf.group_by("g").agg(*_exprs()).sort("g").collect("polars").to_native()
+    assert result.equals(_expected())
+
+
+@pytest.mark.usefixtures("approximate")
+def test_approximate(lf: nw.LazyFrame) -> None:
+    result = lf.group_by("g").agg(*_exprs()).sort("g").collect("polars").to_native()
+    assert result.schema == _expected().schema
+    # HyperLogLog doesn't count nulls; the rest are exact on so few values.
+    assert result["n_unique"].to_list() == [2, 2]
+    assert result["median"].to_list() == [2.0, 5.5]
+    assert result["quantile"].to_list() == [2.0, 5.5]
+
+
+def test_mode_is_resolved_at_translation(
+    ns: DataFusionNamespace, lf: nw.LazyFrame
+) -> None:
+    exprs = _exprs()
+    ns.enable_approximate_aggregations()
+    try:
+        approx = lf.select(*exprs).collect("polars")
+    finally:
+        ns.disable_approximate_aggregations()
+    exact = lf.select(*exprs).collect("polars")
+    assert approx["n_unique"].to_list() == [4]
+    assert exact["n_unique"].to_list() == [5]
+    assert approx.schema == exact.schema
+
+
+@pytest.mark.parametrize("approximate_mode", [False, True])
+def test_over(ns: DataFusionNamespace, lf: nw.LazyFrame, *, approximate_mode: bool) -> None:
+    if approximate_mode:
+        ns.enable_approximate_aggregations()
+    try:
+        result = lf.with_columns(
+            *(expr.over("g") for expr in _exprs())
+        ).collect("polars").to_native()
+    finally:
+        ns.disable_approximate_aggregations()
+    expected = pl.DataFrame(DATA).with_columns(
+        pl.col("a").n_unique().over("g").cast(pl.Int64).alias("n_unique"),
+        pl.col("a").median().over("g").alias("median"),
+        pl.col("a").quantile(0.5, "linear").over("g").alias("quantile"),
+    )
+    assert result.schema == expected.schema
+    assert result["median"].to_list() == expected["median"].to_list()
+    # HyperLogLog doesn't count the null.
+    n_unique = [2, 2, 2, 2, 2, 2] if approximate_mode else [2, 2, 2, 3, 3, 3]
+    assert result["n_unique"].to_list() == n_unique
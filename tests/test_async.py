@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import polars as pl
+import pytest
+from narwhals._utils import Implementation
+
+from narwhals_datafusion.dataframe import DataFusionLazyFrame
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from narwhals_datafusion.namespace import DataFusionNamespace
+    from narwhals_datafusion.utils import QueryProfile
+
+
+@pytest.fixture
+def frame(ns: DataFusionNamespace, parquet_path: Path) -> DataFusionLazyFrame:
+    return ns.from_native(ns.context.read_parquet(str(parquet_path)))
+
+
+@pytest.mark.parametrize("backend", ["polars", pl, "pandas", "pyarrow", None])
+def test_collect_async_backends(frame: DataFusionLazyFrame, backend: object) -> None:
+    result = asyncio.run(frame.collect_async(backend)).to_narwhals()
+    assert result.implementation.is_polars() == (backend in {"polars", pl})
+    expected = frame.collect(Implementation.POLARS).native
+    assert result.to_polars().sort("a").equals(expected.sort("a"))
+
+
+def test_collect_async_multiple_partitions(ns: DataFusionNamespace) -> None:
+    # A union has the partitions of all its inputs, whatever the CPU count.
+    native = ns.context.sql("select value as a from range(50000) where value % 7 = 0")
+    native = native.union(
+        ns.context.sql("select value as a from range(50000, 100000) where value % 7 = 0")
+    )
+    frame = ns.from_native(native)
+    assert native.execution_plan().partition_count > 1
+    result = asyncio.run(frame.collect_async("polars")).native
+    assert result.sort("a")["a"].to_list() == list(range(0, 100000, 7))
+
+
+def test_collect_async_is_profiled(
+    ns: DataFusionNamespace, frame: DataFusionLazyFrame
+) -> None:
+    profiles: list[QueryProfile] = []
+    ns.set_profiler(profiles.append, analyze=True)
+    try:
+        asyncio.run(frame.collect_async("polars"))
+    finally:
+        ns.set_profiler(None)
+    [profile] = profiles
+    assert profile.operation == "collect"
+    assert profile.execution_seconds > 0
+    assert any("DataSourceExec" in op.name for op in profile.operators)
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import polars as pl
+import pyarrow as pa
+import pytest
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from narwhals_datafusion.dataframe import DataFusionLazyFrame
+    from narwhals_datafusion.namespace import DataFusionNamespace
+
+
+@pytest.fixture
+def frame(ns: DataFusionNamespace, parquet_path: Path) -> DataFusionLazyFrame:
+    return ns.from_native(ns.context.read_parquet(str(parquet_path)))
+
+
+def _sorted(data: object) -> pl.DataFrame:
+    # pyarrow can't sort `string_view` columns.
+    return pl.DataFrame(pa.table(data)).sort("a")
+
+
+def _expected(frame: DataFusionLazyFrame) -> pl.DataFrame:
+    return _sorted(frame.native.to_arrow_table())
+
+
+@pytest.mark.parametrize("batch_size", [None, 1, 7, 1000])
+def test_iter_batches(frame: DataFusionLazyFrame, batch_size: int | None) -> None:
+    batches = list(frame.iter_batches(batch_size))
+    if batch_size is not None:
+        assert all(batch.num_rows <= batch_size for batch in batches)
+    assert _sorted(pa.Table.from_batches(batches)).equals(_expected(frame))
+
+
+def test_iter_batches_async(frame: DataFusionLazyFrame) -> None:
+    async def drain() -> list[pa.RecordBatch]:
+        return [batch async for batch in frame.iter_batches_async(7)]
+
+    batches = asyncio.run(drain())
+    assert all(batch.num_rows <= 7 for batch in batches)
+    assert _sorted(pa.Table.from_batches(batches)).equals(_expected(frame))
+
+
+def test_to_batch_reader(frame: DataFusionLazyFrame) -> None:
+    reader = frame.to_batch_reader(batch_size=30)
+    assert reader.schema == frame.native.schema()
+    batches = list(reader)
+    assert all(batch.num_rows <= 30 for batch in batches)
+    assert _sorted(pa.Table.from_batches(batches)).equals(_expected(frame))
+
+
+def test_arrow_c_stream(frame: DataFusionLazyFrame) -> None:
+    assert _sorted(frame).equals(_expected(frame))
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import narwhals as nw
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+if TYPE_CHECKING:
+    from narwhals_datafusion.namespace import DataFusionNamespace
+
+FRAMES: list[dict[str, list[Any]]] = [
+    {"a": [1, 2], "b": ["x", None]},
+    {"a": [3], "b": ["y"]},
+    {"a": [4, 5, 6], "b": ["z", "w", "v"]},
+]
+DIAGONAL: list[dict[str, list[Any]]] = [
+    {"a": [1, 2], "b": ["x", "y"]},
+    {"c": [1.5], "a": [3]},
+    {"b": ["z"], "d": [True]},
+]
+
+
+def _concat(
+    ns: DataFusionNamespace, frames: list[dict[str, list[Any]]], how: Any
+) -> tuple[pl.DataFrame, pl.DataFrame]:
+    expected = nw.concat([nw.from_native(pl.DataFrame(data)).lazy() for data in frames], how=how)
+    result = nw.concat(
+        [ns.from_native(ns.context.from_pydict(data)).to_narwhals() for data in frames], how=how
+    )
+    return result.collect("polars").to_native(), expected.collect().to_native()
+
+
+@pytest.mark.parametrize(("frames", "how"), [(FRAMES, "vertical"), (DIAGONAL, "diagonal")])
+def test_concat(ns: DataFusionNamespace, frames: list[dict[str, list[Any]]], how: str) -> None:
+    result, expected = _concat(ns, frames, how)
+    # A union doesn't keep the order of its inputs.
+    sort_by = list(expected.columns)
+    assert_frame_equal(result.sort(sort_by), expected.sort(sort_by))
+
+
+def test_concat_vertical_schema_mismatch(ns: DataFusionNamespace) -> None:
+    with pytest.raises(TypeError, match="same schema"):
+        _concat(ns, DIAGONAL, "vertical")
+
+
+def test_concat_keeps_schema(ns: DataFusionNamespace) -> None:
+    frames = [ns.from_native(ns.context.from_pydict(data)).to_narwhals() for data in DIAGONAL]
+    result = nw.concat(frames, how="diagonal")
+    assert result.columns == ["a", "b", "c", "d"]
+    assert result.collect_schema() == dict(result.collect("polars").schema)
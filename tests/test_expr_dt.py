@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+
+import narwhals as nw
+import pyarrow as pa
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+DATETIMES = [
+    datetime(2024, 2, 29, 13, 45, 30, 123456),
+    datetime(1969, 12, 31, 23, 59, 59, 999999),
+    None,
+    datetime(2000, 1, 1),
+]
+TABLE = pa.table(
+    {
+        "i": pa.array(range(4)),
+        "ts": pa.array(DATETIMES, pa.timestamp("us")),
+        "utc": pa.array(DATETIMES, pa.timestamp("us", "UTC")),
+        "d": pa.array([date(2024, 2, 29), date(1969, 12, 31), None, date(2000, 1, 1)]),
+        "td": pa.array(
+            [timedelta(days=1, seconds=3), timedelta(microseconds=-1500), None, timedelta(0)]
+        ),
+    }
+)
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        nw.col("ts").dt.date(),
+        nw.col("ts").dt.timestamp("ms"),
+        nw.col("ts").dt.timestamp("ns").alias("ns"),
+        nw.col("utc").dt.timestamp("ms").alias("utc_ms"),
+        nw.col("d").dt.timestamp("us").alias("date_ts"),
+        nw.col("td").dt.total_minutes(),
+        nw.col("td").dt.total_seconds(),
+        nw.col("td").dt.total_milliseconds(),
+        nw.col("td").dt.total_microseconds(),
+        nw.col("td").dt.total_nanoseconds(),
+        nw.col("ts").dt.to_string("%Y/%m/%d %H:%M"),
+        nw.col("ts").dt.truncate("1d"),
+        nw.col("ts").dt.truncate("15m"),
+        nw.col("ts").dt.truncate("1mo"),
+        nw.col("ts").dt.truncate("1y"),
+        nw.col("ts").dt.offset_by("1d"),
+        nw.col("ts").dt.offset_by("-2h"),
+        nw.col("ts").dt.offset_by("1mo"),
+        nw.col("utc").dt.convert_time_zone("Asia/Kathmandu"),
+        nw.col("ts").dt.replace_time_zone("Europe/Berlin").alias("berlin"),
+        nw.col("utc").dt.replace_time_zone(None).alias("naive"),
+    ],
+)
+def test_dt(compare: Callable[..., None], expr: nw.Expr) -> None:
+    compare(TABLE, lambda lf: lf.select("i", expr), sort_by=["i"])
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        *(
+            getattr(nw.col("ts").dt, part)()
+            for part in (
+                "year",
+                "month",
+                "day",
+                "hour",
+                "minute",
+                "second",
+                "millisecond",
+                "microsecond",
+                "nanosecond",
+                "ordinal_day",
+                "weekday",
+            )
+        ),
+        nw.col("d").dt.year().alias("date_year"),
+        nw.col("d").dt.weekday().alias("date_weekday"),
+        nw.col("utc").dt.convert_time_zone("America/New_York").dt.hour().alias("ny"),
+    ],
+)
+def test_dt_parts(compare: Callable[..., None], expr: nw.Expr) -> None:
+    # polars returns the narrowest integer type for each part.
+    compare(
+        TABLE, lambda lf: lf.select("i", expr), sort_by=["i"], check_dtypes=False
+    )
+
+
+def test_filter_on_date(compare: Callable[..., None]) -> None:
+    compare(
+        TABLE,
+        lambda lf: lf.filter(nw.col("ts").dt.date() == date(2024, 2, 29)),
+    )
+
+
+def test_filter_on_aware_datetime(compare: Callable[..., None]) -> None:
+    compare(
+        TABLE,
+        lambda lf: lf.filter(nw.col("utc") > datetime(1999, 1, 1, tzinfo=timezone.utc)),
+        sort_by=["i"],
+    )
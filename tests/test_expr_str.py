@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import narwhals as nw
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+DATA = {
+    "i": [0, 1, 2, 3, 4, 5],
+    "s": ["  Hello World ", "foo.bar", None, "-12", "a$b$c", "ÄÖü straße"],
+    "t": ["$1", "${0}", None, "x", "$$", "$name"],
+}
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        nw.col("s").str.contains("o.b", literal=True),
+        nw.col("s").str.contains(r"^\s*[A-Z]"),
+        nw.col("s").str.starts_with("foo"),
+        nw.col("s").str.ends_with("c"),
+        nw.col("s").str.replace("o", "0", literal=True),
+        nw.col("s").str.replace(".", "_", literal=True),
+        nw.col("s").str.replace("$", "€", literal=True),
+        nw.col("s").str.replace(r"(\w)\$", "${1}!"),
+        nw.col("s").str.replace_all("$", "$$", literal=True),
+        nw.col("s").str.replace_all(r"[aeiou]", "*"),
+        nw.col("s").str.strip_chars(),
+        nw.col("s").str.strip_chars(" -H"),
+        nw.col("s").str.slice(1, 3),
+        nw.col("s").str.slice(-3),
+        nw.col("s").str.head(2),
+        nw.col("s").str.tail(2),
+        nw.col("s").str.split(" "),
+        nw.col("s").str.to_lowercase(),
+        nw.col("s").str.to_uppercase(),
+        nw.col("s").str.zfill(5),
+    ],
+)
+def test_str(compare: Callable[..., None], expr: nw.Expr) -> None:
+    compare(DATA, lambda lf: lf.select("i", expr), sort_by=["i"])
+
+
+@pytest.mark.parametrize("n", [1, -1])
+@pytest.mark.parametrize("pattern", ["o", "$", "."])
+def test_replace_literal_with_expr(compare: Callable[..., None], pattern: str, n: int) -> None:
+    # `$` in the values is taken verbatim, not as a group reference.
+    compare(
+        DATA,
+        lambda lf: lf.select(
+            "i", nw.col("s").str.replace(pattern, nw.col("t"), literal=True, n=n)
+        ),
+        sort_by=["i"],
+    )
+
+
+def test_len_chars(compare: Callable[..., None]) -> None:
+    # polars counts as UInt32.
+    compare(
+        DATA,
+        lambda lf: lf.select("i", nw.col("s").str.len_chars()),
+        sort_by=["i"],
+        check_dtypes=False,
+    )
+
+
+def test_filter_starts_with(compare: Callable[..., None]) -> None:
+    compare(DATA, lambda lf: lf.filter(nw.col("s").str.starts_with("fo")))
+
+
+@pytest.mark.parametrize(
+    ("values", "format"),
+    [
+        (["2024-01-02 03:04:05", "1999-12-31 23:59:59", None], "%Y-%m-%d %H:%M:%S"),
+        (["2024-01-02T03:04:05", "1999-12-31T23:59:59", None], None),
+    ],
+)
+def test_to_datetime(
+    compare: Callable[..., None], values: list[str | None], format: str | None
+) -> None:
+    compare({"s": values}, lambda lf: lf.select(nw.col("s").str.to_datetime(format)))
+
+
+@pytest.mark.parametrize(
+    ("values", "format"),
+    [(["02/01/2024", "31/12/1999", None], "%d/%m/%Y"), (["2024-01-02", None], None)],
+)
+def test_to_date(
+    compare: Callable[..., None], values: list[str | None], format: str | None
+) -> None:
+    compare({"s": values}, lambda lf: lf.select(nw.col("s").str.to_date(format)))
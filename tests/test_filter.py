@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import narwhals as nw
+
+
+def _physical_plan(lf: nw.LazyFrame) -> str:
+    return lf._compliant_frame.explain().split("physical plan:\n", 1)[1]
+
+
+def test_filter_pushed_into_parquet_scan(scan: nw.LazyFrame) -> None:
+    result = scan.filter(nw.col("a") > 90, nw.col("b") != "95")
+    scan_node = next(
+        line for line in _physical_plan(result).splitlines() if "DataSourceExec" in line
+    )
+    assert "predicate=a@0 > 90 AND b@1 != 95" in scan_node
+    assert "pruning_predicate=" in scan_node
+    assert "a_max@0 > 90" in scan_node
+    assert result.collect("polars")["a"].to_list() == [91, 92, 93, 94, 96, 97, 98, 99]
+
+
+def test_filter_is_single_predicate(scan: nw.LazyFrame) -> None:
+    result = scan.filter(nw.col("a") > 10, nw.col("g") == 1, nw.col("a") < 20)
+    plan = _physical_plan(result)
+    assert plan.count("FilterExec") == 1
+    assert result.collect("polars")["a"].to_list() == [13, 16, 19]
+
+
+def test_filter_pandas_result(scan: nw.LazyFrame) -> None:
+    # Parquet strings are read as views, which pandas can't hold natively.
+    result = scan.filter(nw.col("a") < 3).collect("pandas")
+    assert result.schema["b"] == nw.String
+    assert result.filter(nw.col("b") != "1")["a"].to_list() == [0, 2]
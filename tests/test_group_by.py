@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import narwhals as nw
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+DATA = {
+    "k": ["a", "b", "a", None, "b", "a"],
+    "j": [1, 1, 2, 2, 1, 1],
+    "x": [1, 2, 3, 4, None, 6],
+    "y": [1.5, 2.5, None, 4.5, 5.5, 6.5],
+}
+
+
+@pytest.mark.parametrize(
+    "aggs",
+    [
+        [nw.col("x").sum(), nw.col("y").mean()],
+        [nw.col("x").min().alias("lo"), nw.col("x").max().alias("hi")],
+        [nw.col("y").std(), nw.col("y").var(ddof=0).alias("v")],
+        [nw.col("x").median(), nw.col("y").max()],
+    ],
+)
+def test_agg(compare: Callable[..., None], aggs: list[nw.Expr]) -> None:
+    compare(DATA, lambda lf: lf.group_by("k").agg(*aggs), sort_by=["k"])
+
+
+@pytest.mark.parametrize("aggs", [[nw.col("x", "y").count()], [nw.len()], [nw.col("x").n_unique()]])
+def test_counts(compare: Callable[..., None], aggs: list[nw.Expr]) -> None:
+    # polars counts as UInt32, the lazy backends as Int64
+    compare(
+        DATA,
+        lambda lf: lf.group_by("k").agg(*aggs),
+        sort_by=["k"],
+        check_dtypes=False,
+    )
+
+
+def test_multiple_keys(compare: Callable[..., None]) -> None:
+    compare(
+        DATA,
+        lambda lf: lf.group_by("k", "j").agg(nw.col("x").sum()),
+        sort_by=["k", "j"],
+    )
+
+
+def test_drop_null_keys(compare: Callable[..., None]) -> None:
+    compare(
+        DATA,
+        lambda lf: lf.group_by("k", drop_null_keys=True).agg(nw.col("x").sum()),
+        sort_by=["k"],
+    )
+
+
+def test_expression_key(compare: Callable[..., None]) -> None:
+    compare(
+        DATA,
+        lambda lf: lf.group_by(nw.col("j") * 10).agg(nw.col("x").sum()),
+        sort_by=["j"],
+    )
+
+
+def test_all_excludes_keys(compare: Callable[..., None]) -> None:
+    data: dict[str, Any] = {"k": DATA["k"], "x": DATA["x"], "j": DATA["j"]}
+    compare(data, lambda lf: lf.group_by("k").agg(nw.all().sum()), sort_by=["k"])
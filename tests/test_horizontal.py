@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import narwhals as nw
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+DATA = {
+    "i": [0, 1, 2, 3, 4],
+    "g": ["a", "a", "b", "b", "b"],
+    "a": [1, None, 3, None, -2],
+    "b": [4.5, 2.0, None, None, 0.5],
+    "c": [True, None, False, None, True],
+    "s": ["x", "y", None, "w", None],
+}
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        nw.sum_horizontal("a", "b"),
+        nw.mean_horizontal("a", "b"),
+        nw.min_horizontal("a", "b"),
+        nw.max_horizontal("a", "b"),
+        nw.min_horizontal("a", nw.col("b") * 2, nw.lit(1)).alias("min_lit"),
+        nw.any_horizontal("c", nw.col("a") > 0, ignore_nulls=True),
+        nw.all_horizontal("c", nw.col("a") > 0, ignore_nulls=True),
+        nw.coalesce("a", "b"),
+        nw.coalesce(nw.col("s"), nw.lit("z")),
+        nw.concat_str("s", nw.col("a"), separator="-"),
+        nw.concat_str("s", "a", separator="-", ignore_nulls=True),
+    ],
+)
+def test_horizontal(compare: Callable[..., None], expr: nw.Expr) -> None:
+    compare(DATA, lambda lf: lf.select("i", expr), sort_by=["i"])
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        nw.when(nw.col("a") > 0).then(nw.col("b")).otherwise(nw.col("a")),
+        nw.when(nw.col("a") > 0).then(1).otherwise(0.5).alias("mixed"),
+        nw.when(nw.col("c")).then(nw.col("s")).alias("no_otherwise"),
+        nw.when(nw.col("a").is_null()).then(nw.lit("missing")).otherwise(nw.col("s")),
+        (
+            nw.when(nw.col("a") > nw.col("a").mean())
+            .then(nw.col("a"))
+            .otherwise(0)
+            .over("g")
+            .alias("over")
+        ),
+        ((nw.col("b") - nw.col("b").mean()).over("g")).alias("centered"),
+    ],
+)
+def test_when_then(compare: Callable[..., None], expr: nw.Expr) -> None:
+    compare(DATA, lambda lf: lf.select("i", expr), sort_by=["i"])
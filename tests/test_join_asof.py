@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import narwhals as nw
+import pyarrow as pa
+import pytest
+
+if TYPE_CHECKING:
+    from narwhals_datafusion.namespace import DataFusionNamespace
+
+LEFT = pa.table(
+    {
+        "t": pa.array([1, 5, 10, None, 12, 20], pa.int64()),
+        "g": pa.array([0, 0, 1, 0, None, 1], pa.int64()),
+        "x": list(range(6)),
+    }
+)
+RIGHT = pa.table(
+    {
+        "t": pa.array([2, 4, 8, 10, None, 14], pa.int64()),
+        "g": pa.array([0, 0, 1, 1, 0, 1], pa.int64()),
+        "val": [10, 11, 12, 13, 14, 15],
+    }
+)
+
+
+@pytest.mark.parametrize(
+    ("strategy", "by", "expected"),
+    [
+        ("backward", None, [None, 11, 13, None, 13, 15]),
+        ("forward", None, [10, 12, 13, None, 15, None]),
+        # Ties go to the later right-hand row.
+        ("nearest", None, [10, 11, 13, None, 15, 15]),
+        ("backward", "g", [None, 11, 13, None, None, 15]),
+        ("forward", "g", [10, None, 13, None, None, None]),
+        ("nearest", "g", [10, 11, 13, None, None, 15]),
+    ],
+)
+def test_join_asof(
+    ns: DataFusionNamespace, strategy: str, by: str | None, expected: list[int | None]
+) -> None:
+    def wrap(table: pa.Table) -> nw.LazyFrame:
+        return ns.from_native(ns.context.from_arrow(table)).to_narwhals()
+
+    kwargs = {"by": by} if by else {}
+    result = (
+        wrap(LEFT)
+        .join_asof(wrap(RIGHT), on="t", strategy=strategy, **kwargs)
+        .sort("x")
+        .collect("polars")
+    )
+    # A null key never matches.
+    assert result["val"].to_list() == expected
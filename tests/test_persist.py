@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import narwhals as nw
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from narwhals_datafusion.namespace import DataFusionNamespace
+
+
+def test_persist_string_column(
+    ns: DataFusionNamespace, scan: nw.LazyFrame, tmp_path: Path
+) -> None:
+    # Parquet strings are read as views, which `pa.Table.nbytes` rejects.
+    ns.configure_persist_cache(memory_budget=1 << 20, spill_dir=tmp_path)
+    try:
+        small = scan.filter(nw.col("a") < 5).select("b")
+        persisted = small._compliant_frame.persist().to_narwhals()
+        assert persisted.collect("polars")["b"].to_list() == ["0", "1", "2", "3", "4"]
+        info = ns.persist_cache_info()
+        assert (info.in_memory, info.spilled) == (1, 0)
+        assert info.memory_bytes > 0
+
+        ns.configure_persist_cache(memory_budget=0, spill_dir=tmp_path)
+        persisted = small._compliant_frame.persist().to_narwhals()
+        assert persisted.collect("polars")["b"].to_list() == ["0", "1", "2", "3", "4"]
+        info = ns.persist_cache_info()
+        assert (info.in_memory, info.spilled, info.memory_bytes) == (0, 1, 0)
+    finally:
+        ns.configure_persist_cache()
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import datafusion
+import narwhals as nw
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from narwhals_datafusion.namespace import DataFusionNamespace
+
+
+@pytest.fixture
+def plan_cache(ns: DataFusionNamespace) -> Iterator[None]:
+    ns.enable_plan_cache()
+    yield
+    ns.disable_plan_cache()
+
+
+@pytest.mark.usefixtures("plan_cache")
+def test_scans_are_cached(ns: DataFusionNamespace, parquet_path: Path) -> None:
+    for _ in range(2):
+        lf = ns.scan_parquet(parquet_path).to_narwhals()
+        result = lf.filter(nw.col("a") > 97).select("a").collect("polars")
+        assert result["a"].to_list() == [98, 99]
+    info = ns.plan_cache_info()
+    assert info is not None
+    assert (info.hits, info.misses) == (1, 1)
+
+
+@pytest.mark.usefixtures("plan_cache")
+def test_other_contexts_are_not_cached(
+    ns: DataFusionNamespace, parquet_path: Path
+) -> None:
+    # The plan would be decoded and executed on the shared context otherwise.
+    context = datafusion.SessionContext()
+    for _ in range(2):
+        native = context.read_parquet(str(parquet_path))
+        lf = ns.from_native(native).to_narwhals()
+        result = lf.filter(nw.col("a") > 97).select("a").collect("polars")
+        assert result["a"].to_list() == [98, 99]
+    info = ns.plan_cache_info()
+    assert info is not None
+    assert (info.hits, info.misses) == (0, 0)
+
+
+@pytest.mark.usefixtures("plan_cache")
+def test_multiple_partitions_are_uncacheable(
+    ns: DataFusionNamespace, tmp_path: Path
+) -> None:
+    ns.configure_session(target_partitions=4)
+    try:
+        for i in range(4):
+            pq.write_table(pa.table({"a": [i]}), tmp_path / f"{i}.parquet")
+        for _ in range(3):
+            lf = ns.scan_parquet(tmp_path).to_narwhals()
+            plan = lf._compliant_frame.native.execution_plan()
+            assert plan.partition_count > 1
+            result = lf.filter(nw.col("a") > 0).collect("polars")
+            assert sorted(result["a"].to_list()) == [1, 2, 3]
+        info = ns.plan_cache_info()
+        assert info is not None
+        assert (info.hits, info.misses, info.uncacheable, info.currsize) == (0, 1, 2, 0)
+    finally:
+        ns.configure_session()
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import narwhals as nw
+import pyarrow as pa
+
+if TYPE_CHECKING:
+    from narwhals_datafusion.namespace import DataFusionNamespace
+    from narwhals_datafusion.utils import QueryProfile
+
+
+def test_translation_time_is_charged_to_the_result(ns: DataFusionNamespace) -> None:
+    base = ns.from_native(ns.context.from_arrow(pa.table({"x": [1.0, 2.0]})))
+    expr = nw.col("x")
+    for _ in range(4):
+        expr = (expr * expr) - (expr / expr)
+    deep = base.to_narwhals().select(expr)
+    shallow = base.to_narwhals().select(nw.col("x") + 1)
+    assert base._translation_seconds == 0.0
+    assert deep._compliant_frame._translation_seconds > 0.0
+    assert (
+        shallow._compliant_frame._translation_seconds
+        < deep._compliant_frame._translation_seconds
+    )
+
+    profiles: list[QueryProfile] = []
+    ns.set_profiler(profiles.append)
+    try:
+        joined = deep.with_row_index("i", order_by=["x"]).join(
+            shallow.with_row_index("i", order_by=["x"]), on="i"
+        )
+        joined.collect("polars")
+    finally:
+        ns.set_profiler(None)
+    assert profiles[0].translation_seconds >= (
+        deep._compliant_frame._translation_seconds
+        + shallow._compliant_frame._translation_seconds
+    )
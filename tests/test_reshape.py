@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import narwhals as nw
+import pyarrow as pa
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from narwhals_datafusion.namespace import DataFusionNamespace
+
+LISTS = pa.table(
+    {
+        "i": [0, 1, 2, 3],
+        "a": pa.array([[1, 2], [3, None], None, [4]], pa.list_(pa.int64())),
+        "b": pa.array([["x", "y"], ["z", "w"], None, ["v"]], pa.list_(pa.string())),
+    }
+)
+WIDE = {"i": [0, 1, 2], "k": ["p", "q", "p"], "x": [1, None, 3], "y": [4, 5, None]}
+
+
+@pytest.mark.parametrize("columns", [["a"], ["b"], ["a", "b"]])
+def test_explode(compare: Callable[..., None], columns: list[str]) -> None:
+    compare(LISTS, lambda lf: lf.explode(*columns), sort_by=["i", *columns])
+
+
+def test_explode_empty(ns: DataFusionNamespace) -> None:
+    # Like `explode_outer` (and polars before 2.0), an empty list becomes a
+    # null row rather than being dropped.
+    table = pa.table({"i": [0, 1], "a": pa.array([[], [1]], pa.list_(pa.int64()))})
+    lf = ns.from_native(ns.context.from_arrow(table)).to_narwhals()
+    result = lf.explode("a").sort("i").collect("polars")
+    assert result.to_dict(as_series=False) == {"i": [0, 1], "a": [None, 1]}
+
+
+@pytest.mark.parametrize(
+    ("a", "b"), [([[1, 2]], [[1]]), ([[]], [[1]]), ([None], [[]]), ([[1], None], [[1], [2]])]
+)
+def test_explode_mismatched_lengths(
+    ns: DataFusionNamespace, a: list[list[int] | None], b: list[list[int] | None]
+) -> None:
+    dtype = pa.list_(pa.int64())
+    table = pa.table({"a": pa.array(a, dtype), "b": pa.array(b, dtype)})
+    frame = ns.from_native(ns.context.from_arrow(table)).explode(["a", "b"])
+    with pytest.raises(nw.exceptions.ShapeError, match="matching element counts"):
+        frame.to_narwhals().collect("polars")
+    with pytest.raises(nw.exceptions.ShapeError, match="matching element counts"):
+        list(frame.iter_batches())
+    with pytest.raises(nw.exceptions.ShapeError, match="matching element counts"):
+        asyncio.run(frame.collect_async())
+
+
+def test_explode_non_list(ns: DataFusionNamespace) -> None:
+    lf = ns.from_native(ns.context.from_arrow(LISTS)).to_narwhals()
+    with pytest.raises(nw.exceptions.InvalidOperationError, match="expected List type"):
+        lf.explode("i")
+
+
+@pytest.mark.parametrize(
+    ("on", "index"),
+    [(["x", "y"], ["i"]), (None, ["i", "k"]), (["x"], None), (None, None)],
+)
+def test_unpivot(
+    compare: Callable[..., None], on: list[str] | None, index: list[str] | None
+) -> None:
+    data = WIDE if index is not None else {"x": WIDE["x"], "y": WIDE["y"]}
+    compare(
+        data,
+        lambda lf: lf.unpivot(on, index=index, variable_name="var", value_name="val"),
+        sort_by=[*(index or []), "var", "val"],
+    )
+
+
+def test_unpivot_nothing(compare: Callable[..., None]) -> None:
+    compare(WIDE, lambda lf: lf.unpivot([], index=["i"]), check_dtypes=False)
+
+
+@pytest.mark.parametrize("order_by", [["i"], ["k", "i"]])
+def test_with_row_index(compare: Callable[..., None], order_by: list[str]) -> None:
+    compare(
+        WIDE,
+        lambda lf: lf.with_row_index("idx", order_by=order_by),
+        sort_by=["idx"],
+    )
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import narwhals as nw
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from narwhals_datafusion import namespace
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from narwhals_datafusion.namespace import DataFusionNamespace
+
+
+def test_scan_reuses_schema_until_invalidated(
+    ns: DataFusionNamespace, tmp_path: Path
+) -> None:
+    pq.write_table(pa.table({"a": [1]}), tmp_path / "0.parquet")
+    assert ns.scan_parquet(tmp_path).columns == ["a"]
+    pq.write_table(pa.table({"a": [2], "b": ["x"]}), tmp_path / "1.parquet")
+    assert ns.scan_parquet(tmp_path).columns == ["a"]
+    ns.invalidate_scans(tmp_path)
+    assert sorted(ns.scan_parquet(tmp_path).columns) == ["a", "b"]
+
+
+def test_scans_are_bounded(
+    ns: DataFusionNamespace, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(namespace, "_MAX_SCANS", 2)
+    ns.invalidate_scans()
+    for i in range(3):
+        pq.write_table(pa.table({"a": [i]}), tmp_path / f"{i}.parquet")
+        ns.scan_parquet(tmp_path / f"{i}.parquet")
+    assert [key[1] for key in namespace._SCANS] == [
+        str(tmp_path / "1.parquet"),
+        str(tmp_path / "2.parquet"),
+    ]
+
+
+@pytest.fixture
+def nested(tmp_path: Path) -> Path:
+    # flat/<dir>/0.parquet and hive/<dir>/year=2020/0.parquet
+    for directory, value in [("pq_1", 1), ("pq_2", 2), ("other", 3)]:
+        table = pa.table({"a": [value], "b": [str(value)]})
+        for path in (
+            tmp_path / "flat" / directory,
+            tmp_path / "hive" / directory / "year=2020",
+        ):
+            path.mkdir(parents=True)
+            pq.write_table(table, path / "0.parquet")
+    return tmp_path
+
+
+def test_scan_glob_in_file_name(ns: DataFusionNamespace, nested: Path) -> None:
+    lf = ns.scan_parquet(nested / "flat" / "pq_1" / "*.parquet").to_narwhals()
+    assert lf.collect("polars")["a"].to_list() == [1]
+
+
+@pytest.mark.parametrize("hive_partitioning", [True, False])
+def test_scan_glob_in_directory(
+    ns: DataFusionNamespace, nested: Path, *, hive_partitioning: bool
+) -> None:
+    lf = ns.scan_parquet(
+        nested / "flat" / "pq_*" / "*.parquet", hive_partitioning=hive_partitioning
+    ).to_narwhals()
+    assert lf.collect("polars").sort("a")["a"].to_list() == [1, 2]
+
+
+def test_scan_glob_hive_partitions(ns: DataFusionNamespace, nested: Path) -> None:
+    source = nested / "hive" / "pq_*" / "year=*" / "*.parquet"
+    lf = ns.scan_parquet(source).to_narwhals()
+    result = lf.filter(nw.col("year") == "2020").collect("polars").sort("a")
+    assert result.columns == ["a", "b", "year"]
+    assert result.rows() == [(1, "1", "2020"), (2, "2", "2020")]
+    lf = ns.scan_parquet(source, hive_partitioning=False).to_narwhals()
+    assert lf.collect_schema().names() == ["a", "b"]
+
+
+def test_scan_csv_glob_in_directory(ns: DataFusionNamespace, tmp_path: Path) -> None:
+    for i in range(2):
+        (tmp_path / f"csv_{i}").mkdir()
+        (tmp_path / f"csv_{i}" / "data.csv").write_text(f"a\n{i}\n")
+    lf = ns.scan_csv(tmp_path / "csv_*" / "*.csv").to_narwhals()
+    assert lf.collect("polars").sort("a")["a"].to_list() == [0, 1]
+
+
+def test_scan_glob_without_matches(ns: DataFusionNamespace, tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError, match="No files match"):
+        ns.scan_parquet(tmp_path / "missing_*" / "*.parquet")
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import narwhals as nw
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from narwhals_datafusion.namespace import DataFusionNamespace
+
+DATA = {"a": [1, 2, 3], "Mixed": ["x", "y", "z"], "dotted.name": [1.0, 2.0, 3.0]}
+
+QUERIES: list[Callable[[nw.LazyFrame[Any]], nw.LazyFrame[Any]]] = [
+    lambda lf: lf.drop("a"),
+    lambda lf: lf.rename({"a": "b", "Mixed": "MIXED"}),
+    lambda lf: lf.select("dotted.name", "Mixed"),
+    lambda lf: lf.filter(nw.col("a") > 1).head(1),
+    lambda lf: lf.with_columns(nw.col("a").cast(nw.Float32), b=nw.col("Mixed").str.to_uppercase()),
+    lambda lf: lf.with_columns(nw.col("a") * 2).drop("Mixed").rename({"a": "Mixed"}),
+]
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_schema_matches_result(
+    compare: Callable[..., None],
+    ns: DataFusionNamespace,
+    query: Callable[[nw.LazyFrame[Any]], nw.LazyFrame[Any]],
+) -> None:
+    compare(DATA, query)
+    native = ns.context.from_pydict(DATA)
+    lf = query(ns.from_native(native).to_narwhals())
+    # The propagated schema agrees with what DataFusion plans.
+    fresh = ns.from_native(lf.to_native()).collect_schema()
+    assert lf.collect_schema() == fresh
+    assert lf.columns == list(fresh)
+    assert lf.collect_schema() == dict(lf.collect().schema)
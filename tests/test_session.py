@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import narwhals as nw
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from narwhals_datafusion.namespace import DataFusionNamespace
+
+QUERY = "select value as a, value % 1000 as g from range(2000000)"
+
+
+@pytest.fixture(autouse=True)
+def restore_session(ns: DataFusionNamespace) -> Iterator[None]:
+    yield
+    ns.configure_session()
+
+
+def test_configure_session_replaces_context(ns: DataFusionNamespace) -> None:
+    before = ns.context
+    frame = ns.from_native(before.from_pydict({"a": [1, 2, 3]})).to_narwhals()
+    context = ns.configure_session()
+    assert ns.context is context
+    assert context is not before
+    # Frames created before keep running on their own context.
+    assert frame.select(nw.col("a").sum()).collect("polars").item() == 6
+
+
+def test_target_partitions(ns: DataFusionNamespace) -> None:
+    context = ns.configure_session(target_partitions=3)
+    native = context.sql("select value % 10 as g, count(*) from range(1000) group by 1")
+    assert native.execution_plan().partition_count == 3
+
+
+def test_batch_size(ns: DataFusionNamespace) -> None:
+    context = ns.configure_session(batch_size=100)
+    batches = ns.from_native(context.sql("select * from range(1000)")).iter_batches()
+    assert max(batch.num_rows for batch in batches) == 100
+
+
+@pytest.mark.parametrize("memory_pool", ["fair", "greedy"])
+def test_memory_limit_spills(
+    ns: DataFusionNamespace, tmp_path: Path, memory_pool: str
+) -> None:
+    context = ns.configure_session(
+        memory_limit=20_000_000, memory_pool=memory_pool, spill_path=tmp_path
+    )
+    lf = ns.from_native(context.sql(QUERY)).to_narwhals()
+    result = lf.sort("g", "a").collect("polars")
+    assert result.shape == (2_000_000, 2)
+    assert result["a"][:3].to_list() == [0, 1000, 2000]
+
+
+def test_memory_limit_is_enforced(ns: DataFusionNamespace) -> None:
+    context = ns.configure_session(memory_limit=1_000_000)
+    lf = ns.from_native(context.sql(QUERY)).to_narwhals()
+    with pytest.raises(Exception, match="Not enough memory"):
+        lf.sort("g", "a").collect("polars")
+
+
+def test_invalid_memory_pool(ns: DataFusionNamespace) -> None:
+    with pytest.raises(ValueError, match="memory_pool"):
+        ns.configure_session(memory_pool="unbounded")  # type: ignore[arg-type]
+
+
+def test_scans_use_new_context(ns: DataFusionNamespace, parquet_path: Path) -> None:
+    first = ns.scan_parquet(str(parquet_path))
+    ns.configure_session()
+    second = ns.scan_parquet(str(parquet_path))
+    assert first.native is not second.native
+    assert second.to_narwhals().select(nw.len()).collect("polars").item() == 100
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from io import BytesIO
+from typing import TYPE_CHECKING
+
+import pyarrow.parquet as pq
+import pytest
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from narwhals_datafusion.namespace import DataFusionNamespace
+
+
+def _sink_to_buffer(ns: DataFusionNamespace, num_rows: int, **kwds: object) -> BytesIO:
+    # `range` executes in batches of the session's batch size (8192 rows).
+    native = ns.context.sql(f"select value as a from range({num_rows})")  # noqa: S608
+    buffer = BytesIO()
+    ns.from_native(native).sink_parquet(buffer, **kwds)
+    buffer.seek(0)
+    return buffer
+
+
+@pytest.mark.parametrize(
+    ("row_group_size", "expected"),
+    [(None, [20_000]), (5_000, [5_000] * 4), (15_000, [15_000, 5_000])],
+)
+def test_buffer_row_groups(
+    ns: DataFusionNamespace, row_group_size: int | None, expected: list[int]
+) -> None:
+    buffer = _sink_to_buffer(ns, 20_000, row_group_size=row_group_size)
+    metadata = pq.ParquetFile(buffer).metadata
+    sizes = [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+    assert sizes == expected
+    buffer.seek(0)
+    assert pq.read_table(buffer)["a"].to_pylist() == list(range(20_000))
+
+
+@pytest.mark.parametrize(
+    ("compression", "expected"),
+    [("uncompressed", "UNCOMPRESSED"), ("lz4_raw", "LZ4"), ("zstd", "ZSTD")],
+)
+def test_buffer_compression(
+    ns: DataFusionNamespace, tmp_path: Path, compression: str, expected: str
+) -> None:
+    buffer = _sink_to_buffer(ns, 100, compression=compression)
+    column = pq.ParquetFile(buffer).metadata.row_group(0).column(0)
+    assert column.compression == expected
+    # The path writer accepts the same names.
+    ns.from_native(ns.context.sql("select 1 as a")).sink_parquet(
+        str(tmp_path / "out.parquet"), compression=compression
+    )
+    assert pq.read_table(tmp_path / "out.parquet")["a"].to_pylist() == [1]
+
+
+def test_async_single_file(ns: DataFusionNamespace, tmp_path: Path) -> None:
+    import asyncio
+
+    native = ns.context.sql("select value as a from range(20000)")
+    path = tmp_path / "out.parquet"
+    coro = ns.from_native(native).sink_parquet_async(
+        str(path), compression="lz4_raw", row_group_size=15_000
+    )
+    asyncio.run(coro)
+    metadata = pq.ParquetFile(path).metadata
+    sizes = [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+    assert sizes == [15_000, 5_000]
+    assert metadata.row_group(0).column(0).compression == "LZ4"
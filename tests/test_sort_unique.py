@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import narwhals as nw
+import pyarrow as pa
+import pytest
+
+if TYPE_CHECKING:
+    from narwhals_datafusion.namespace import DataFusionNamespace
+
+
+def _physical_plan(lf: nw.LazyFrame) -> str:
+    return lf._compliant_frame.explain().split("physical plan:\n", 1)[1]
+
+
+@pytest.fixture
+def lf(ns: DataFusionNamespace) -> nw.LazyFrame:
+    table = pa.table(
+        {
+            "g": [1, 2, 1, 3, 2, 1],
+            "i": [0, 1, 2, 3, 4, 5],
+            "v": ["a", "b", "c", "d", "e", "f"],
+        }
+    )
+    return ns.from_native(ns.context.from_arrow(table)).to_narwhals()
+
+
+def test_sort_head_is_top_k(lf: nw.LazyFrame) -> None:
+    result = lf.sort("v", descending=True).head(2)
+    assert "SortExec: TopK(fetch=2)" in _physical_plan(result)
+    assert result.collect("polars")["v"].to_list() == ["f", "e"]
+
+
+@pytest.mark.parametrize(
+    ("keep", "expected"),
+    [
+        ("first", [(1, "a"), (2, "b"), (3, "d")]),
+        ("last", [(1, "f"), (2, "e"), (3, "d")]),
+        ("none", [(3, "d")]),
+    ],
+)
+def test_unique_keep(
+    lf: nw.LazyFrame, keep: str, expected: list[tuple[int, str]]
+) -> None:
+    result = lf.unique(["g"], keep=keep, order_by=["i"]).sort("g").collect("polars")
+    assert list(zip(result["g"], result["v"])) == expected
+
+
+def test_unique_keep_any(lf: nw.LazyFrame) -> None:
+    result = lf.unique(["g"], keep="any").sort("g").collect("polars")
+    assert result["g"].to_list() == [1, 2, 3]
+    assert result["v"].to_list()[2] == "d"
+    assert set(zip(result["g"], result["v"])) <= set(
+        zip(*lf.collect("polars").select("g", "v").to_dict().values())
+    )
+
+
+def test_unique_all_columns(ns: DataFusionNamespace) -> None:
+    table = pa.table({"a": [1, 1, 2, 2], "b": ["x", "x", "y", "z"]})
+    lf = ns.from_native(ns.context.from_arrow(table)).to_narwhals()
+    result = lf.unique().sort("a", "b").collect("polars")
+    assert result.rows() == [(1, "x"), (2, "y"), (2, "z")]
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import narwhals as nw
+import pyarrow as pa
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from narwhals_datafusion.namespace import DataFusionNamespace
+
+DATA = {"i": [0, 1, 2, 3, 4, 5], "g": ["a", "b", "a", "b", "a", "c"], "x": [3, 1, None, 4, 1, 5]}
+
+
+@pytest.mark.parametrize(
+    ("function", "return_dtype"),
+    [
+        (lambda s: s.sum(), None),
+        (lambda s: s.max() - s.min(), nw.Int64()),
+        (lambda s: s.len(), nw.Int64()),
+        (lambda s: s.mean(), nw.Float64()),
+    ],
+)
+def test_map_batches_in_group_by(
+    compare: Callable[..., None],
+    function: Callable[[Any], Any],
+    return_dtype: nw.dtypes.DType | None,
+) -> None:
+    expr = nw.col("x").map_batches(function, return_dtype, returns_scalar=True)
+    compare(DATA, lambda lf: lf.group_by("g").agg(expr), sort_by=["g"], check_dtypes=False)
+
+
+def test_map_batches_over(compare: Callable[..., None]) -> None:
+    expr = nw.col("x").map_batches(lambda s: s.sum(), nw.Int64(), returns_scalar=True)
+    compare(DATA, lambda lf: lf.with_columns(y=expr.over("g", order_by="i")), sort_by=["i"])
+
+
+def test_map_batches_elementwise(ns: DataFusionNamespace) -> None:
+    # narwhals doesn't accept elementwise `map_batches` on lazy frames yet.
+    frame = ns.from_native(ns.context.from_pydict(DATA))
+    expr = ns.col("x").map_batches(lambda s: s * 2 + 1, None, returns_scalar=False)
+    result = frame.select(expr).to_narwhals().collect("polars")
+    assert result["x"].to_list() == [7, 3, None, 9, 3, 11]
+
+
+@pytest.mark.parametrize(
+    ("old", "new", "return_dtype"),
+    [
+        ([3, 1, 4, 5], ["c", "a", "d", "e"], None),
+        ({3: 30, 1: 10, 4: 40, 5: 50}, None, nw.Int32()),
+        ([1, 3, 4, 5, 6], [1.5, 3.5, 4.5, 5.5, 6.5], nw.Float64()),
+    ],
+)
+def test_replace_strict(
+    compare: Callable[..., None],
+    old: Any,
+    new: Any,
+    return_dtype: nw.dtypes.DType | None,
+) -> None:
+    expr = nw.col("x").replace_strict(old, new, return_dtype=return_dtype)
+    compare(DATA, lambda lf: lf.select("i", expr), sort_by=["i"])
+
+
+def test_replace_strict_strings(compare: Callable[..., None]) -> None:
+    table = pa.table({"s": ["b", None, "a", "b"]})
+    compare(table, lambda lf: lf.select(nw.col("s").replace_strict({"a": 1, "b": 2})))
+
+
+@pytest.mark.parametrize("collect", ["polars", "pyarrow"])
+def test_replace_strict_unmapped(ns: DataFusionNamespace, collect: str) -> None:
+    lf = ns.from_native(ns.context.from_pydict(DATA)).to_narwhals()
+    expr = nw.col("x").replace_strict([3, 1], ["c", "a"])
+    with pytest.raises(nw.exceptions.InvalidOperationError, match=r"did not get replaced: \[4, 5\]"):
+        lf.select(expr).collect(collect)
+
+
+def test_map_batches_elementwise_wrong_length(ns: DataFusionNamespace) -> None:
+    frame = ns.from_native(ns.context.from_pydict(DATA))
+    expr = ns.col("x").map_batches(lambda s: s.sum(), nw.Int64(), returns_scalar=False)
+    with pytest.raises(TypeError, match="one value per row"):
+        frame.select(expr).to_narwhals().collect("polars")
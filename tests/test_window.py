@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import narwhals as nw
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+DATA = {
+    "i": [0, 1, 2, 3, 4, 5, 6, 7],
+    "g": ["a", "a", "b", "a", "b", "b", "a", "b"],
+    "x": [3, 1, None, 4, 1, 5, 9, 2],
+    "y": [1.0, 2.5, 3.0, None, 0.5, 1.5, 2.0, 4.0],
+}
+
+ORDERED: list[nw.Expr] = [
+    nw.col("x").cum_sum(),
+    nw.col("x").cum_max(),
+    nw.col("x").cum_min(),
+    nw.col("y").cum_prod(),
+    nw.col("x").cum_sum(reverse=True).alias("rev"),
+    nw.col("x").shift(1),
+    nw.col("y").shift(-2),
+    nw.col("x").diff(),
+    nw.col("y").rolling_sum(3),
+    nw.col("y").rolling_mean(2, min_samples=1),
+    nw.col("y").rolling_sum(3, min_samples=2, center=True).alias("centered"),
+    nw.col("y").rolling_std(3, min_samples=2),
+    nw.col("y").rolling_var(3, ddof=0),
+]
+
+
+@pytest.mark.parametrize("expr", ORDERED)
+@pytest.mark.parametrize("partition_by", [[], ["g"]])
+def test_ordered(
+    compare: Callable[..., None], expr: nw.Expr, partition_by: list[str]
+) -> None:
+    compare(
+        DATA,
+        lambda lf: lf.with_columns(expr.over(*partition_by, order_by="i")),
+        sort_by=["i"],
+    )
+
+
+@pytest.mark.parametrize("expr", [nw.col("x").cum_count()])
+def test_cum_count(compare: Callable[..., None], expr: nw.Expr) -> None:
+    # polars counts as UInt32.
+    compare(
+        DATA,
+        lambda lf: lf.with_columns(expr.over("g", order_by="i")),
+        sort_by=["i"],
+        check_dtypes=False,
+    )
+
+
+@pytest.mark.parametrize("method", ["average", "min", "max", "dense", "ordinal"])
+@pytest.mark.parametrize("descending", [False, True])
+@pytest.mark.parametrize("partition_by", [[], ["g"]])
+def test_rank(
+    compare: Callable[..., None], method: str, partition_by: list[str], *, descending: bool
+) -> None:
+    rank = nw.col("x").rank(method, descending=descending)  # type: ignore[arg-type]
+    compare(
+        DATA,
+        lambda lf: lf.with_columns(rank.over(*partition_by) if partition_by else rank),
+        sort_by=["i"],
+        check_dtypes=False,
+    )
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        nw.col("x").sum().over("g"),
+        nw.col("y").mean().over("g"),
+        (nw.col("x") - nw.col("x").mean()).alias("centered"),
+        (nw.col("y") / nw.col("y").max().over("g")).alias("scaled"),
+    ],
+)
+def test_aggregate_over(compare: Callable[..., None], expr: nw.Expr) -> None:
+    compare(DATA, lambda lf: lf.with_columns(expr), sort_by=["i"])